@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.endpoints import auth, users, posts, comments, ai
+from app.api.endpoints import auth, users, posts, comments, ai, search
 
 api_router = APIRouter()
 
@@ -9,3 +9,4 @@ api_router.include_router(users.router, prefix="/users", tags=["사용자"])
 api_router.include_router(posts.router, prefix="/posts", tags=["게시글"])
 api_router.include_router(comments.router, prefix="/comments", tags=["댓글"])
 api_router.include_router(ai.router, prefix="/ai", tags=["AI"])
+api_router.include_router(search.router, prefix="/search", tags=["검색"])
@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import Generator, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -6,20 +6,25 @@ from jose import jwt, JWTError
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app import models, schemas
-from app.core import security
+from app import models, schemas, services
 from app.core.config import settings
 from app.db.base import get_db
+from app.services.token_revocation import token_revocation
 
 # 토큰 검증을 위한 OAuth2 스키마
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
-# 현재 사용자 가져오기
-def get_current_user(
+# 토큰이 없어도 되는 엔드포인트용 (토큰이 없으면 None)
+optional_oauth2 = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.API_V1_STR}/auth/login", auto_error=False
+)
+
+# 토큰 검증 (서명 / 만료 / 폐기 여부)
+def get_token_payload(
     db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> models.User:
+) -> schemas.TokenPayload:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -30,7 +35,26 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="인증에 실패했습니다.",
         )
-    user = db.query(models.User).filter(models.User.id == token_data.sub).first()
+    # jti 가 없는 토큰(기능 도입 전 발급)은 폐기할 수 없으므로 만료까지 유효
+    if (
+        settings.TOKEN_REVOCATION_ENABLED
+        and token_data.jti
+        and token_revocation.is_revoked(db, token_data.jti)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="폐기된 토큰입니다. 다시 로그인해 주세요.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token_data
+
+# 현재 사용자 가져오기 (캐시된 스냅샷, 세션에 붙어 있지 않음)
+def get_current_user(
+    db: Session = Depends(get_db),
+    token: str = Depends(reusable_oauth2),
+    token_data: schemas.TokenPayload = Depends(get_token_payload),
+) -> models.User:
+    user = services.user.get_principal(db, user_id=token_data.sub, token=token)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -38,6 +62,20 @@ def get_current_user(
         )
     return user
 
+# 토큰의 사용자 id (DB 조회 없음, 토큰이 없거나 잘못되면 None)
+def get_current_user_id_optional(
+    token: Optional[str] = Depends(optional_oauth2),
+) -> Optional[int]:
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+        return schemas.TokenPayload(**payload).sub
+    except (JWTError, ValidationError):
+        return None
+
 # 활성 사용자 확인
 def get_current_active_user(
     current_user: models.User = Depends(get_current_user),
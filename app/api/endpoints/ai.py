@@ -5,13 +5,14 @@ AI 관련 API 엔드포인트
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pydantic import BaseModel
 import json
 import logging
 import traceback
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_user, get_current_admin_user
+from app.core.config import settings
 from app.models.user import User
 from app.services.ai import ai_service
 
@@ -34,6 +35,7 @@ class ColumnCandidatesResponse(BaseModel):
     details: list[dict] = []
     input: str
     message: str = ""
+    timings: Optional[Dict[str, float]] = None  # 디버그 모드에서만 구간별 소요 시간(ms) 포함
 
 
 class UpdateEmbeddingsResponse(BaseModel):
@@ -90,7 +92,8 @@ async def get_column_candidates(
             candidates=result["candidates"],
             details=result.get("details", []),
             input=result["input"],
-            message=result.get("message", "")
+            message=result.get("message", ""),
+            timings=result.get("timings") if settings.DEBUG else None
         )
         
     except HTTPException as e:
@@ -133,6 +136,34 @@ async def update_embeddings(
         raise HTTPException(status_code=500, detail=f"임베딩 갱신 중 오류가 발생했습니다: {str(e)}")
 
 
+class IndexPostEmbeddingsResponse(BaseModel):
+    """게시글 임베딩 백필 응답"""
+    message: str
+    count: int
+
+
+@router.post("/post-embeddings", response_model=IndexPostEmbeddingsResponse, status_code=202)
+def index_post_embeddings(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    임베딩이 없는 게시글의 임베딩 생성 (기존 게시글 백필, 관리자 전용)
+    
+    요청 안에서 인코딩하지 않고 백그라운드 스레드에서 배치 단위로 생성/커밋함
+    
+    Returns:
+        시작 안내와 백필 대상 게시글 수
+    """
+    count = ai_service.count_missing_posts(db)
+    if not ai_service.start_post_backfill():
+        raise HTTPException(status_code=409, detail="게시글 임베딩 백필이 이미 진행 중입니다.")
+    return IndexPostEmbeddingsResponse(
+        message=f"{count}개의 게시글 임베딩 생성을 시작했습니다.",
+        count=count,
+    )
+
+
 @router.get("/health")
 async def ai_health_check():
     """AI 서비스 상태 확인"""
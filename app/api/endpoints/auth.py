@@ -1,28 +1,42 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app import schemas, services
+from app import models, schemas, services
 from app.api import deps
 from app.core import security
 from app.core.config import settings
+from app.core.executor import ExecutorFull
 from app.db.base import get_db
+from app.services.token_revocation import token_revocation
 
 router = APIRouter()
 
+# 비밀번호 해시 실행기가 가득 찼을 때 (다른 엔드포인트를 지키기 위해 바로 거절)
+def _hash_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+        headers={"Retry-After": "1"},
+    )
+
 @router.post("/login", response_model=schemas.Token)
-def login_access_token(
+async def login_access_token(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible 토큰 로그인, username에 이메일 사용
     """
-    user = services.user.authenticate(
-        db, email=form_data.username, password=form_data.password
-    )
+    try:
+        user = await services.user.authenticate_async(
+            db, email=form_data.username, password=form_data.password
+        )
+    except ExecutorFull:
+        raise _hash_busy()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -43,8 +57,29 @@ def login_access_token(
         "token_type": "bearer",
     }
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    db: Session = Depends(get_db),
+    token_data: schemas.TokenPayload = Depends(deps.get_token_payload),
+    current_user: models.User = Depends(deps.get_current_user),
+) -> None:
+    """
+    현재 토큰 폐기 (만료 전이라도 이후 요청에서 거부됨)
+    """
+    if not token_data.jti or token_data.exp is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="폐기할 수 없는 토큰입니다.",
+        )
+    token_revocation.revoke(
+        db,
+        jti=token_data.jti,
+        expires_at=datetime.fromtimestamp(token_data.exp, tz=timezone.utc),
+        user_id=current_user.id,
+    )
+
 @router.post("/register", response_model=schemas.User)
-def register(
+async def register(
     *,
     db: Session = Depends(get_db),
     user_in: schemas.UserCreate,
@@ -52,12 +87,15 @@ def register(
     """
     새로운 사용자 생성
     """
-    user = services.user.get_by_email(db, email=user_in.email)
+    user = await anyio.to_thread.run_sync(services.user.get_by_email, db, user_in.email)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 사용 중인 이메일입니다.",
         )
     
-    user = services.user.create_user(db, obj_in=user_in)
+    try:
+        user = await services.user.create_user_async(db, obj_in=user_in)
+    except ExecutorFull:
+        raise _hash_busy()
     return user 
\ No newline at end of file
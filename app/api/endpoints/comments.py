@@ -1,14 +1,33 @@
-from typing import Any
+from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app import models, schemas, services
 from app.api import deps
 from app.db.base import get_db
+from app.db.routing import get_read_db
 
 router = APIRouter()
 
+@router.get("/preview", response_model=List[schemas.PostCommentsPreview])
+def read_comments_preview(
+    db: Session = Depends(get_read_db),
+    post_ids: List[int] = Query(..., description="게시글 ID 목록 (?post_ids=1&post_ids=2)"),
+    per_post: int = Query(3, ge=1, le=10, description="게시글별 댓글 수"),
+) -> Any:
+    """
+    여러 게시글의 최근 댓글 미리보기 (게시글 목록 화면용)
+    """
+    post_ids = list(dict.fromkeys(post_ids))
+    if len(post_ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="게시글은 한 번에 100개까지 조회할 수 있습니다.",
+        )
+    latest = services.comment.get_latest_comments_by_posts(db=db, post_ids=post_ids, per_post=per_post)
+    return [{"post_id": post_id, "comments": latest[post_id]} for post_id in post_ids]
+
 @router.post("/", response_model=schemas.Comment)
 def create_comment(
     *,
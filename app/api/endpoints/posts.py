@@ -1,27 +1,157 @@
-from typing import Any, List
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas, services
 from app.api import deps
+from app.core.conditional import (
+    conditional_json_response,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    validator_headers,
+)
+from app.core.config import settings
+from app.core.serialization import FastJSONResponse
 from app.db.base import get_db
+from app.db.routing import get_async_read_db, get_read_db
+from app.services.ai import ai_service
+from app.services.unique_viewers import make_viewer_key
 
 router = APIRouter()
 
-@router.get("/", response_model=schemas.PostPagination)
-def read_posts(
-    db: Session = Depends(get_db),
+FIELDS_DESCRIPTION = "응답에 포함할 필드 (쉼표 구분, 예: id,title,view_count,created_at)"
+EXCERPT_DESCRIPTION = "본문 앞부분 글자 수 (excerpt 필드로 반환)"
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    try:
+        return services.post.parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+@router.get("/", response_model=schemas.PostPagination, response_model_exclude_unset=True)
+async def read_posts(
+    request: Request,
+    adb: AsyncSession = Depends(get_async_read_db),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
     order_by: str = Query("created_at", description="정렬 기준"),
     order_desc: bool = Query(True, description="내림차순 정렬"),
+    count: Optional[str] = Query(
+        None,
+        pattern="^(exact|cached|estimated)$",
+        description="전체 개수 계산 방식 (기본값: 서버 설정)",
+    ),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    excerpt: Optional[int] = Query(None, ge=1, le=1000, description=EXCERPT_DESCRIPTION),
 ) -> Any:
     """
     게시글 목록 조회 (페이지네이션)
+
+    직렬화된 본문의 해시를 ETag 로 보내고, If-None-Match 가 같으면 304
     """
-    return services.post.get_pagination(
-        db=db, page=page, size=size, order_by=order_by, order_desc=order_desc
+    body = await services.post.get_pagination_async(
+        adb=adb, page=page, size=size, order_by=order_by, order_desc=order_desc,
+        count_strategy=count, fields=_parse_fields(fields), excerpt_length=excerpt,
+        as_json=True,
+    )
+    return conditional_json_response(request, body)
+
+@router.get("/cursor", response_model=schemas.PostCursorPage, response_model_exclude_unset=True)
+async def read_posts_by_cursor(
+    request: Request,
+    adb: AsyncSession = Depends(get_async_read_db),
+    size: int = Query(10, ge=1, le=100, description="페이지 크기"),
+    order_by: str = Query("created_at", description="정렬 기준 (created_at, view_count)"),
+    order_desc: bool = Query(True, description="내림차순 정렬"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 또는 prev_cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    excerpt: Optional[int] = Query(None, ge=1, le=1000, description=EXCERPT_DESCRIPTION),
+) -> Any:
+    """
+    게시글 목록 조회 (커서 페이지네이션)
+    """
+    parsed_fields = _parse_fields(fields)
+    try:
+        body = await services.post.get_posts_keyset_async(
+            adb=adb, size=size, order_by=order_by, order_desc=order_desc, cursor=cursor,
+            fields=parsed_fields, excerpt_length=excerpt, as_json=True,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return conditional_json_response(request, body)
+
+@router.get("/trending", response_model=List[schemas.TrendingPost])
+def read_trending_posts(
+    db: Session = Depends(get_db),
+    limit: int = Query(10, ge=1, le=100, description="게시글 수"),
+) -> Any:
+    """
+    인기 게시글 (조회/댓글 기반 시간 감쇠 점수 순)
+    """
+    return [
+        schemas.TrendingPost(
+            **schemas.Post.model_validate(post, from_attributes=True).model_dump(),
+            score=score,
+        )
+        for post, score in services.post.get_trending(db=db, limit=limit)
+    ]
+
+@router.get("/trending/viewers", response_model=List[schemas.PostUniqueViewers])
+def read_top_posts_by_unique_viewers(
+    db: Session = Depends(get_db),
+    days: int = Query(7, ge=1, le=90, description="집계 기간(일)"),
+    limit: int = Query(10, ge=1, le=100, description="게시글 수"),
+) -> Any:
+    """
+    최근 순방문자가 많은 게시글 (HyperLogLog 추정값)
+    """
+    return [
+        schemas.PostUniqueViewers(
+            **schemas.Post.model_validate(post, from_attributes=True).model_dump(),
+            unique_viewers=unique_viewers,
+        )
+        for post, unique_viewers in services.post.get_top_by_unique_viewers(
+            db=db, days=days, limit=limit
+        )
+    ]
+
+def _semantic_results(results) -> List[schemas.SemanticSearchPost]:
+    return [
+        schemas.SemanticSearchPost(
+            **schemas.Post.model_validate(post, from_attributes=True).model_dump(),
+            similarity=similarity,
+        )
+        for post, similarity in results
+    ]
+
+def _since(days: Optional[int]) -> Optional[datetime]:
+    return datetime.now(timezone.utc) - timedelta(days=days) if days else None
+
+@router.get("/semantic-search", response_model=List[schemas.SemanticSearchPost])
+async def semantic_search_posts(
+    adb: AsyncSession = Depends(get_async_read_db),
+    q: str = Query(..., min_length=1, max_length=500, description="검색 문장"),
+    limit: int = Query(10, ge=1, le=50, description="게시글 수"),
+    author_id: Optional[int] = Query(None, description="작성자 ID"),
+    days: Optional[int] = Query(None, ge=1, le=3650, description="최근 며칠 이내 게시글만"),
+) -> Any:
+    """
+    의미 기반 게시글 검색 (임베딩 근사 최근접 이웃)
+    """
+    return _semantic_results(
+        await ai_service.search_posts_async(
+            adb, q, limit=limit, author_id=author_id, since=_since(days)
+        )
     )
 
 @router.post("/", response_model=schemas.Post)
@@ -29,36 +159,66 @@ def create_post(
     *,
     db: Session = Depends(get_db),
     post_in: schemas.PostCreate,
+    background_tasks: BackgroundTasks,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     새 게시글 작성
     """
     post = services.post.create_post(db=db, obj_in=post_in, user_id=current_user.id)
+    # 임베딩은 응답을 보낸 뒤 생성
+    if settings.POST_EMBEDDINGS_ENABLED:
+        background_tasks.add_task(ai_service.index_post, post.id)
     return post
 
 @router.get("/{post_id}", response_model=schemas.PostDetail)
 def read_post(
     *,
     db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
     post_id: int,
     skip_increment: bool = Query(False, description="조회수 증가 건너뛰기"),
+    current_user_id: Optional[int] = Depends(deps.get_current_user_id_optional),
 ) -> Any:
     """
     게시글 상세 조회
+
+    ETag / Last-Modified 를 보내고, 클라이언트가 가진 표현이 최신이면 304 (조회수는 올리지 않음)
     """
-    post = services.post.get_post(db=db, post_id=post_id)
-    if not post:
+    # 작성자 정보까지 직렬화된 응답을 캐시에서 가져옴 (미스일 때만 DB 조회)
+    detail = services.post.get_post_detail(db=db, post_id=post_id)
+    if not detail:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다.",
         )
+
+    view_count = services.post.get_view_count(detail)
+    unique_viewers = services.post.get_unique_viewers(db=db, post_id=detail.id)
+    etag, last_modified = services.post.detail_validators(detail, view_count, unique_viewers)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
     
     # skip_increment 파라미터가 True가 아닌 경우에만 조회수 증가
+    # (버퍼링 모드에서는 행을 갱신하지 않으므로 읽기 전용 트랜잭션으로 끝남)
     if not skip_increment:
-        post = services.post.increment_view_count(db=db, db_obj=post)
+        view_count = services.post.record_view(db=db, db_obj=detail)
+        services.post.record_unique_viewer(
+            detail.id,
+            make_viewer_key(
+                current_user_id,
+                request.client.host if request.client else None,
+                request.headers.get("user-agent"),
+            ),
+        )
+        unique_viewers = services.post.get_unique_viewers(db=db, post_id=detail.id)
+        etag, last_modified = services.post.detail_validators(detail, view_count, unique_viewers)
     
-    return post
+    detail.view_count = view_count
+    detail.unique_viewers = unique_viewers
+    response.headers.update(validator_headers(etag, last_modified))
+    return detail
 
 @router.put("/{post_id}", response_model=schemas.Post)
 def update_post(
@@ -66,6 +226,7 @@ def update_post(
     db: Session = Depends(get_db),
     post_id: int,
     post_in: schemas.PostUpdate,
+    background_tasks: BackgroundTasks,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -83,6 +244,8 @@ def update_post(
             detail="권한이 없습니다.",
         )
     post = services.post.update_post(db=db, db_obj=post, obj_in=post_in)
+    if settings.POST_EMBEDDINGS_ENABLED and (post_in.title is not None or post_in.content is not None):
+        background_tasks.add_task(ai_service.index_post, post.id)
     return post
 
 @router.delete("/{post_id}", response_model=schemas.Post)
@@ -109,16 +272,72 @@ def delete_post(
     post = services.post.delete_post(db=db, db_obj=post)
     return post
 
+@router.get("/{post_id}/similar", response_model=List[schemas.SemanticSearchPost])
+async def read_similar_posts(
+    *,
+    adb: AsyncSession = Depends(get_async_read_db),
+    post_id: int,
+    limit: int = Query(10, ge=1, le=50, description="게시글 수"),
+    author_id: Optional[int] = Query(None, description="작성자 ID"),
+    days: Optional[int] = Query(None, ge=1, le=3650, description="최근 며칠 이내 게시글만"),
+) -> Any:
+    """
+    비슷한 게시글 목록 (임베딩이 아직 생성되지 않았으면 빈 목록)
+    """
+    if not await services.post.get_post_async(adb=adb, post_id=post_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게시글을 찾을 수 없습니다.",
+        )
+    return _semantic_results(
+        await ai_service.similar_posts_async(
+            adb, post_id, limit=limit, author_id=author_id, since=_since(days)
+        )
+    )
+
 @router.get("/{post_id}/comments", response_model=List[schemas.CommentDetail])
-def read_post_comments(
+async def read_post_comments(
     *,
-    db: Session = Depends(get_db),
+    adb: AsyncSession = Depends(get_async_read_db),
+    request: Request,
     post_id: int,
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """
     게시글의 댓글 목록 조회
+
+    댓글 / 작성자의 id 와 수정 시각으로 ETag 를 만들어 같으면 직렬화 없이 304
+    """
+    post = await services.post.get_post_async(adb=adb, post_id=post_id)
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게시글을 찾을 수 없습니다.",
+        )
+    comments = await services.comment.get_comment_details_by_post_async(
+        adb=adb, post_id=post_id, skip=skip, limit=limit
+    )
+    etag = make_etag(
+        "comments", post_id, skip, limit,
+        [(c["id"], c["updated_at"], c["author"]["id"], c["author"]["updated_at"]) for c in comments],
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    # 응답 스키마 필드만 담은 dict 이므로 response_model 검증 없이 바로 직렬화
+    return FastJSONResponse(comments, headers=validator_headers(etag))
+
+@router.get("/{post_id}/comments/cursor", response_model=schemas.CommentCursorPage)
+def read_post_comments_by_cursor(
+    *,
+    db: Session = Depends(get_read_db),
+    post_id: int,
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    order_desc: bool = Query(True, description="최신순 정렬"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 또는 prev_cursor"),
+) -> Any:
+    """
+    게시글의 댓글 목록 조회 (커서 페이지네이션)
     """
     post = services.post.get_post(db=db, post_id=post_id)
     if not post:
@@ -126,6 +345,12 @@ def read_post_comments(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다.",
         )
-    return services.comment.get_comments_by_post(
-        db=db, post_id=post_id, skip=skip, limit=limit
-    ) 
\ No newline at end of file
+    try:
+        return services.comment.get_comments_by_post_keyset(
+            db=db, post_id=post_id, size=size, order_desc=order_desc, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
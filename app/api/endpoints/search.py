@@ -0,0 +1,52 @@
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app import schemas, services
+from app.db.routing import get_read_db
+
+router = APIRouter()
+
+SORT_PATTERN = "^(relevance|recent)$"
+
+@router.get("/posts", response_model=schemas.PostSearchPage)
+def search_posts(
+    db: Session = Depends(get_read_db),
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    sort: str = Query("relevance", pattern=SORT_PATTERN, description="정렬 기준 (relevance, recent)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 또는 prev_cursor"),
+) -> Any:
+    """
+    게시글 제목/본문 검색
+    """
+    try:
+        return services.search.search_posts(db=db, q=q, size=size, cursor=cursor, sort=sort)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+@router.get("/comments", response_model=schemas.CommentSearchPage)
+def search_comments(
+    db: Session = Depends(get_read_db),
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    post_id: Optional[int] = Query(None, description="게시글 ID (지정 시 해당 게시글의 댓글만)"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    sort: str = Query("relevance", pattern=SORT_PATTERN, description="정렬 기준 (relevance, recent)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 또는 prev_cursor"),
+) -> Any:
+    """
+    댓글 검색
+    """
+    try:
+        return services.search.search_comments(
+            db=db, q=q, size=size, cursor=cursor, sort=sort, post_id=post_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
@@ -1,11 +1,12 @@
 from typing import Any, List
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas, services
 from app.api import deps
-from app.db.base import get_db
+from app.db.base import get_async_db, get_db
 
 router = APIRouter()
 
@@ -28,31 +29,38 @@ def update_user_me(
     """
     현재 사용자 정보 업데이트
     """
-    user = services.user.update_user(db, db_obj=current_user, obj_in=user_in)
+    # current_user 는 캐시된 스냅샷이므로 세션에서 다시 읽어서 수정
+    user = services.user.get_by_id(db, user_id=current_user.id)
+    user = services.user.update_user(db, db_obj=user, obj_in=user_in)
     return user
 
 @router.get("/{user_id}", response_model=schemas.User)
-def read_user_by_id(
+async def read_user_by_id(
     user_id: int,
     current_user: models.User = Depends(deps.get_current_active_user),
-    db: Session = Depends(get_db),
+    adb: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     특정 사용자 정보 조회
     """
-    user = services.user.get_by_id(db, user_id=user_id)
-    if user == current_user:
-        return user
+    if user_id == current_user.id:
+        return current_user
     if not services.user.is_admin(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="권한이 부족합니다.",
         )
+    user = await services.user.get_by_id_async(adb, user_id=user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다.",
+        )
     return user
 
 @router.get("/", response_model=List[schemas.User])
-def read_users(
-    db: Session = Depends(get_db),
+async def read_users(
+    adb: AsyncSession = Depends(get_async_db),
     skip: int = 0,
     limit: int = 100,
     current_user: models.User = Depends(deps.get_current_admin_user),
@@ -60,5 +68,5 @@ def read_users(
     """
     사용자 목록 조회 (관리자만 가능)
     """
-    users = services.user.get_users(db, skip=skip, limit=limit)
+    users = await services.user.get_users_async(adb, skip=skip, limit=limit)
     return users 
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+주기 실행 백그라운드 스레드
+메모리에 모아 둔 데이터를 일정 간격으로 DB에 반영하는 작업에 사용
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker:
+    """
+    interval 초마다 (또는 wake() 호출 시 즉시) func 를 실행하는 데몬 스레드
+
+    Example:
+        worker = PeriodicWorker("view-count-flusher", 5.0, view_counter.flush)
+        worker.start()
+        ...
+        worker.stop()  # 종료 전에 func 를 한 번 더 실행
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], object]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def wake(self) -> None:
+        """다음 주기를 기다리지 않고 즉시 실행"""
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """스레드를 멈추고 마지막으로 한 번 실행"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+            self._thread = None
+        self._run_once()
+
+    def _run_once(self) -> None:
+        try:
+            self.func()
+        except Exception as e:
+            logger.error(f"{self.name} 실행 실패: {e}")
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                break
+            self._run_once()
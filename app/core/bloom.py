@@ -0,0 +1,52 @@
+"""
+Bloom 필터
+고정 크기 비트 배열로 "확실히 없음 / 아마 있음" 을 판정 (거짓 양성만 있고 거짓 음성은 없음)
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    capacity 개를 넣었을 때 거짓 양성 비율이 약 error_rate 가 되도록 크기를 정하는 Bloom 필터
+
+    Example:
+        bloom = BloomFilter(capacity=1000, error_rate=0.001)
+        bloom.add("jti-1")
+        "jti-1" in bloom  # True
+        "jti-2" in bloom  # 거의 항상 False
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity 는 1 이상이어야 합니다.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate 는 0 과 1 사이여야 합니다.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # 최적 비트 수 m = -n ln p / (ln 2)^2, 해시 수 k = m/n ln 2
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str):
+        # 128비트 해시 하나를 둘로 나눠 이중 해싱 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    def is_full(self) -> bool:
+        """capacity 를 넘게 넣어서 거짓 양성 비율이 설계값보다 커졌는지"""
+        return self.count >= self.capacity
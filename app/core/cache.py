@@ -0,0 +1,359 @@
+"""
+프로세스 내 캐시
+만료 시간(TTL)을 가진 키-값 저장소와,
+직렬화된 객체를 LRU / 공유 저장소에 두는 객체 캐시 (동시 적재 합치기, 적중률 메트릭)
+"""
+
+import asyncio
+import importlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.core.metrics import registry
+
+CACHE_REQUESTS = registry.counter(
+    "object_cache_requests_total",
+    "객체 캐시 조회 횟수 (result: hit, miss, coalesced, wait_timeout)",
+    labelnames=("cache", "result"),
+)
+CACHE_INVALIDATIONS = registry.counter(
+    "object_cache_invalidations_total", "객체 캐시 무효화 횟수", labelnames=("cache",)
+)
+CACHE_LOAD_SECONDS = registry.histogram(
+    "object_cache_load_seconds", "캐시 미스 시 원본 적재 소요 시간(초)", labelnames=("cache",)
+)
+CACHE_ENTRIES = registry.gauge(
+    "object_cache_entries", "객체 캐시 항목 수", labelnames=("cache",)
+)
+
+
+class TTLCache:
+    """
+    스레드 안전한 TTL 캐시
+
+    Example:
+        cache = TTLCache(default_ttl=60)
+        cache.set("posts", 123)
+        cache.get("posts")  # 123 (60초 이내)
+    """
+
+    def __init__(self, default_ttl: float = 60.0, max_entries: int = 1024):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_entries:
+                self._evict_expired()
+                if len(self._data) >= self.max_entries:
+                    # 가장 먼저 만료되는 항목 제거
+                    oldest = min(self._data, key=lambda k: self._data[k][0])
+                    del self._data[oldest]
+            self._data[key] = (expires_at, value)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+
+
+class CacheBackend:
+    """
+    객체 캐시 저장소 인터페이스 (값은 직렬화된 바이트)
+
+    워커 간에 캐시를 공유하려면 (예: Redis 의 GET / SETEX / DEL / INCR)
+    같은 메서드를 구현한 클래스를 POST_CACHE_BACKEND 에 지정
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def get_version(self, name: str) -> int:
+        """목록 캐시 키에 붙일 현재 버전"""
+        raise NotImplementedError
+
+    def bump_version(self, name: str) -> int:
+        """버전을 올려 이전 버전 키를 모두 무효화"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return 0
+
+
+class LocalCacheBackend(CacheBackend):
+    """
+    워커 프로세스 메모리의 LRU 저장소 (기본값)
+
+    max_entries 를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    버전은 LRU 제거 대상이 아니므로 되돌아가지 않음
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def get_version(self, name: str) -> int:
+        return self._versions.get(name, 0)
+
+    def bump_version(self, name: str) -> int:
+        with self._lock:
+            version = self._versions.get(name, 0) + 1
+            self._versions[name] = version
+            return version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._versions.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def load_cache_backend(path: str, **kwargs: Any) -> CacheBackend:
+    """'모듈경로.클래스명' 문자열로 저장소 생성"""
+    module_name, _, class_name = path.rpartition(".")
+    backend_cls = getattr(importlib.import_module(module_name), class_name)
+    return backend_cls(**kwargs)
+
+
+class _Load:
+    """진행 중인 원본 적재 (같은 키를 기다리는 요청이 결과를 나눠 가짐)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+        self.stale = False  # 적재 중 무효화되면 결과를 저장하지 않음
+        # 비동기로 기다리는 요청 (스레드를 잡지 않도록 각자의 이벤트 루프 future 로 깨움)
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._waiters_lock = threading.Lock()
+
+    def async_waiter(self) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._waiters_lock:
+            if self.done.is_set():
+                future.set_result(None)
+            else:
+                self._waiters.append((loop, future))
+        return future
+
+    def finish(self) -> None:
+        with self._waiters_lock:
+            self.done.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_waiter, future)
+            except RuntimeError:
+                pass  # 이미 닫힌 이벤트 루프
+
+
+def _resolve_waiter(future: asyncio.Future) -> None:
+    if not future.done():  # 시간 초과로 취소된 대기는 건너뜀
+        future.set_result(None)
+
+
+class ObjectCache:
+    """
+    직렬화된 객체 캐시
+
+    같은 키의 캐시 미스가 동시에 들어오면 한 요청만 원본을 적재하고
+    나머지는 그 결과를 기다려서 받음 (캐시 만료 직후 DB 에 요청이 몰리는 것 방지)
+    적재가 wait_timeout 초 안에 끝나지 않으면 기다리던 요청은 직접 원본을 적재함
+
+    Example:
+        cache = ObjectCache("posts", LocalCacheBackend(), default_ttl=60)
+        raw = cache.get_or_load("post:1", lambda: load_post_json(1))
+        cache.invalidate("post:1")
+    """
+
+    def __init__(
+        self, name: str, backend: CacheBackend, default_ttl: float = 60.0, wait_timeout: float = 5.0
+    ):
+        self.name = name
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.wait_timeout = wait_timeout
+        self._loads: Dict[str, _Load] = {}
+        self._lock = threading.Lock()
+        CACHE_ENTRIES.set_function(lambda: len(self.backend), cache=name)
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Optional[bytes]],
+        ttl: Optional[float] = None,
+        cacheable: Optional[Callable[[], bool]] = None,
+    ) -> Optional[bytes]:
+        """
+        캐시된 값 또는 loader() 결과 (None 은 저장하지 않음)
+
+        cacheable 을 주면 적재 후 호출해 False 일 때 결과를 저장하지 않음 (기다리던 요청에는 전달)
+        """
+        value = self.backend.get(key)
+        if value is not None:
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return value
+
+        load, leader = self._join_load(key)
+        if not leader:
+            if load.done.wait(self.wait_timeout):
+                return self._shared_result(load)
+            # 적재가 멈췄거나 너무 느리면 함께 묶이지 않고 직접 적재 (결과는 먼저 시작한 요청이 저장)
+            CACHE_REQUESTS.inc(cache=self.name, result="wait_timeout")
+            return loader()
+
+        start = time.perf_counter()
+        try:
+            load.value = loader()
+            if cacheable is not None and not cacheable():
+                load.stale = True
+        except BaseException as e:
+            load.error = e
+            raise
+        finally:
+            self._finish_load(key, load, ttl, start)
+        return load.value
+
+    async def aget_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[bytes]]],
+        ttl: Optional[float] = None,
+        cacheable: Optional[Callable[[], bool]] = None,
+    ) -> Optional[bytes]:
+        """
+        get_or_load 의 비동기 버전 (loader 는 코루틴 함수)
+
+        다른 요청이 같은 키를 적재 중이면 스레드를 쓰지 않고 이벤트 루프에서 완료를 기다림
+        """
+        value = self.backend.get(key)
+        if value is not None:
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return value
+
+        load, leader = self._join_load(key)
+        if not leader:
+            try:
+                await asyncio.wait_for(load.async_waiter(), self.wait_timeout)
+            except asyncio.TimeoutError:
+                CACHE_REQUESTS.inc(cache=self.name, result="wait_timeout")
+                return await loader()
+            return self._shared_result(load)
+
+        start = time.perf_counter()
+        try:
+            load.value = await loader()
+            if cacheable is not None and not cacheable():
+                load.stale = True
+        except BaseException as e:
+            load.error = e
+            raise
+        finally:
+            self._finish_load(key, load, ttl, start)
+        return load.value
+
+    def _join_load(self, key: str) -> Tuple[_Load, bool]:
+        # 진행 중인 적재가 있으면 합류, 없으면 새로 시작 (반환값: 적재, 직접 적재하는지)
+        with self._lock:
+            load = self._loads.get(key)
+            leader = load is None
+            if leader:
+                load = self._loads[key] = _Load()
+        CACHE_REQUESTS.inc(cache=self.name, result="miss" if leader else "coalesced")
+        return load, leader
+
+    def _shared_result(self, load: _Load) -> Optional[bytes]:
+        if load.error is not None:
+            raise load.error
+        return load.value
+
+    def _finish_load(self, key: str, load: _Load, ttl: Optional[float], start: float) -> None:
+        CACHE_LOAD_SECONDS.observe(time.perf_counter() - start, cache=self.name)
+        # invalidate() 와 같은 잠금 안에서 저장해 무효화된 결과가 다시 저장되지 않도록 함
+        with self._lock:
+            del self._loads[key]
+            if load.error is None and load.value is not None and not load.stale:
+                self.backend.set(key, load.value, self.default_ttl if ttl is None else ttl)
+        load.finish()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            load = self._loads.get(key)
+            if load is not None:
+                load.stale = True
+            self.backend.delete(key)
+        CACHE_INVALIDATIONS.inc(cache=self.name)
+
+    def version(self, name: str) -> int:
+        return self.backend.get_version(name)
+
+    def bump_version(self, name: str) -> int:
+        CACHE_INVALIDATIONS.inc(cache=self.name)
+        return self.backend.bump_version(name)
+
+    def clear(self) -> None:
+        self.backend.clear()
@@ -0,0 +1,239 @@
+"""
+응답 압축 (gzip / brotli / zstd)
+Accept-Encoding 과 서버 선호 순서로 인코딩을 고르고,
+허용된 Content-Type 이면서 최소 크기 이상인 단일 본문 응답만 압축함
+"""
+
+import gzip
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import anyio
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:  # pragma: no cover - 선택 의존성
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+# 이보다 큰 본문은 스레드에서 압축 (zlib / brotli / zstd 는 GIL 을 놓으므로 이벤트 루프를 막지 않음)
+THREAD_MIN_SIZE = 64 * 1024
+
+COMPRESSION_BYTES = registry.counter(
+    "response_compression_bytes_total",
+    "압축한 응답 바이트 수 (kind: original, compressed)",
+    labelnames=("encoding", "kind"),
+)
+COMPRESSION_SECONDS = registry.histogram(
+    "response_compression_seconds",
+    "응답 압축 소요 시간(초)",
+    labelnames=("encoding",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    # mtime 을 고정해 같은 본문은 같은 바이트로 압축
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    return zstd.compress(data, level=level)
+
+
+def available_compressors() -> Dict[str, Callable[[bytes, int], bytes]]:
+    """설치된 라이브러리로 쓸 수 있는 인코딩 → 압축 함수"""
+    compressors: Dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip}
+    if brotli is not None:
+        compressors["br"] = _brotli
+    if zstd is not None:
+        compressors["zstd"] = _zstd
+    return compressors
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    preferences: Dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        preferences[name] = q
+    return preferences
+
+
+def choose_encoding(accept_encoding: Optional[str], encodings: Sequence[str]) -> Optional[str]:
+    """
+    클라이언트가 받을 수 있는 인코딩 중 q 값이 가장 높은 것 (같으면 encodings 순서)
+
+    Example:
+        choose_encoding("gzip, br;q=0.9", ["br", "gzip"])  # 'gzip'
+    """
+    if not accept_encoding:
+        return None
+    preferences = _parse_accept_encoding(accept_encoding)
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = preferences.get(encoding, preferences.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _header(headers: List[tuple], name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 ASGI 미들웨어
+
+    - Content-Type 이 content_types 중 하나로 시작하고 본문이 minimum_size 바이트 이상일 때만 압축
+    - 이미 Content-Encoding 이 있거나 Cache-Control: no-transform 인 응답, 204/304 응답은 그대로 보냄
+    - 본문을 여러 번에 나눠 보내는 스트리밍 응답은 버퍼링하지 않고 그대로 흘려보냄
+    - 압축하면 강한 ETag 를 약한 ETag 로 바꿈 (바이트가 달라지므로, If-None-Match 는 약한 비교라 304 는 그대로 동작)
+    """
+
+    def __init__(
+        self,
+        app,
+        encodings: Optional[Sequence[str]] = None,
+        minimum_size: Optional[int] = None,
+        content_types: Optional[Sequence[str]] = None,
+        levels: Optional[Dict[str, int]] = None,
+    ):
+        self.app = app
+        compressors = available_compressors()
+        self.compressors = {
+            encoding: compressors[encoding]
+            for encoding in (encodings or settings.COMPRESSION_ENCODINGS)
+            if encoding in compressors
+        }
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        self.content_types = tuple(content_types or settings.COMPRESSION_CONTENT_TYPES)
+        self.levels = {
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+            **(levels or {}),
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.compressors:
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept_encoding, list(self.compressors))
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if not self._compressible(message["status"], headers):
+                    passthrough = True
+                    await send(message)
+                    return
+                # 본문을 보기 전까지 헤더를 보류 (크기 / 스트리밍 여부 확인)
+                start_message = {**message, "headers": _with_vary(headers)}
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            passthrough = True
+            if message.get("more_body", False) or encoding is None or len(body) < self.minimum_size:
+                await send(start_message)
+                await send(message)
+                return
+
+            started = time.perf_counter()
+            compress, level = self.compressors[encoding], self.levels[encoding]
+            if len(body) >= THREAD_MIN_SIZE:
+                compressed = await anyio.to_thread.run_sync(compress, body, level)
+            else:
+                compressed = compress(body, level)
+            COMPRESSION_SECONDS.observe(time.perf_counter() - started, encoding=encoding)
+            if len(compressed) >= len(body):
+                await send(start_message)
+                await send(message)
+                return
+            COMPRESSION_BYTES.inc(len(body), encoding=encoding, kind="original")
+            COMPRESSION_BYTES.inc(len(compressed), encoding=encoding, kind="compressed")
+
+            headers = []
+            for key, value in start_message["headers"]:
+                lower = key.lower()
+                if lower == b"content-length":
+                    continue
+                if lower == b"etag" and not value.startswith(b"W/"):
+                    value = b"W/" + value
+                headers.append((key, value))
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+            headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compressible(self, status: int, headers: List[tuple]) -> bool:
+        if status < 200 or status in (204, 304):
+            return False
+        if _header(headers, b"content-encoding") is not None:
+            return False
+        cache_control = _header(headers, b"cache-control")
+        if cache_control is not None and b"no-transform" in cache_control.lower():
+            return False
+        content_type = (_header(headers, b"content-type") or b"").decode("latin-1").lower()
+        return content_type.startswith(self.content_types)
+
+
+def _with_vary(headers: List[tuple]) -> List[tuple]:
+    # 압축 여부가 Accept-Encoding 에 따라 달라지므로 공유 캐시가 구분하도록 함
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return headers + [(b"vary", b"Accept-Encoding")]
+    if b"accept-encoding" in vary.lower():
+        return headers
+    return [
+        (key, value + b", Accept-Encoding" if key.lower() == b"vary" else value)
+        for key, value in headers
+    ]
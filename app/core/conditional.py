@@ -0,0 +1,117 @@
+"""
+HTTP 조건부 요청 (ETag / Last-Modified / 304)
+응답 본문을 만들기 전에 검증값만 계산해서 If-None-Match / If-Modified-Since 와 비교
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional, Union
+
+from fastapi import Request, Response, status
+
+# 폴링하는 클라이언트가 휴리스틱 캐시 대신 매번 재검증하도록 함
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    강한 ETag (검증값 목록의 해시)
+
+    Example:
+        make_etag("post", 1, updated_at)  # '"3f2a..."'
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, bytes):
+            digest.update(part)
+        elif isinstance(part, str):
+            digest.update(part.encode("utf-8"))
+        else:
+            digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return f'"{digest.hexdigest()}"'
+
+
+def _to_http_second(value: datetime) -> datetime:
+    # HTTP 날짜는 초 단위이므로 비교 전에 잘라냄 (시간대가 없으면 UTC 로 간주)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def format_http_date(value: datetime) -> str:
+    return format_datetime(_to_http_second(value), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match 는 약한 비교 (W/ 접두어 무시)
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    클라이언트가 가진 표현이 최신인지 (RFC 9110 13.2.2 순서)
+
+    If-None-Match 가 있으면 그것만 보고, 없을 때만 If-Modified-Since 를 확인
+    """
+    if request.method not in ("GET", "HEAD"):
+        return False
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return _to_http_second(last_modified) <= since
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
+
+
+def conditional_json_response(
+    request: Request, body: Union[str, bytes], last_modified: Optional[datetime] = None
+) -> Response:
+    """
+    이미 직렬화된 JSON 본문 응답 (본문 해시를 ETag 로 사용, 일치하면 304)
+
+    응답 모델 검증 / 재직렬화를 거치지 않으므로 본문은 응답 스키마대로 만든 것이어야 함
+    """
+    etag = make_etag(body)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=validator_headers(etag, last_modified),
+    )
@@ -13,6 +13,24 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # 토큰 폐기(로그아웃) 설정 - 워커별 Bloom 필터에 없으면 DB 조회 없이 유효한 토큰으로 처리
+    TOKEN_REVOCATION_ENABLED: bool = True
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = 5.0  # 다른 워커의 폐기가 반영되기까지의 최대 지연
+    TOKEN_REVOCATION_FILTER_CAPACITY: int = 100000
+    TOKEN_REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    TOKEN_REVOCATION_PURGE_SECONDS: float = 3600.0  # 만료된 폐기 토큰 행 삭제 주기
+
+    # 비밀번호 해시 설정
+    # 첫 번째 방식으로 새 해시를 만들고, 나머지 방식이나 설정보다 약한 비용의 해시는 로그인 시 다시 해시함
+    # argon2 는 argon2-cffi 패키지 필요 (poetry install -E argon2)
+    PASSWORD_HASH_SCHEMES: List[str] = ["bcrypt"]
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_TIME_COST: int = 2
+    PASSWORD_ARGON2_MEMORY_COST: int = 19456  # KiB
+    PASSWORD_ARGON2_PARALLELISM: int = 1
+    PASSWORD_HASH_WORKERS: int = 2  # 해시 전용 스레드 수
+    PASSWORD_HASH_QUEUE_SIZE: int = 32  # 이보다 많이 밀리면 503 으로 거절
+
     # CORS 설정
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
 
@@ -26,11 +44,104 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    # 비동기 엔드포인트용 (없으면 DATABASE_URL 의 드라이버만 asyncpg 로 바꿔 사용)
+    ASYNC_DATABASE_URL: Optional[str] = os.getenv("ASYNC_DATABASE_URL")
+
+    # 데이터베이스 연결 풀 설정 (동기 / 비동기 엔진에 각각 적용되므로
+    # 워커 수 × 2 × (POOL_SIZE + MAX_OVERFLOW) 가 max_connections 를 넘지 않도록)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # 연결을 얻기까지 최대 대기 시간(초)
+    DB_POOL_RECYCLE: int = 1800  # 이보다 오래된 연결은 다시 연결 (초, -1 이면 사용 안 함)
+    DB_POOL_PRE_PING: bool = True  # 꺼낼 때 연결 확인 (끊긴 연결로 요청이 실패하지 않도록)
+
+    # 읽기 복제본 설정 (비어 있으면 모든 쿼리를 DATABASE_URL 로)
+    # 예: DATABASE_REPLICA_URLS='["postgresql://.../replica1", "postgresql://.../replica2"]'
+    # 복제본마다 동기 / 비동기 풀이 따로 생기므로 연결 수도 그만큼 늘어남
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_HEALTH_CHECK_SECONDS: float = 5.0
+    REPLICA_MAX_LAG_SECONDS: float = 10.0  # 복제 지연이 이보다 크면 복구될 때까지 읽기에서 제외
+    REPLICA_STICKY_SECONDS: int = 5  # 쓰기 후 이 시간 동안 같은 클라이언트의 읽기는 프라이머리로 (쿠키)
     
-    # 관리자 계정 설정
+    # 워커 시작 설정
+    # check: alembic 버전이 head 와 같으면 create_all 생략 (버전 기록이 없는 개발용 DB 만 create_all)
+    # create_all: 매번 create_all, off: 스키마를 건드리지 않음
+    DB_SCHEMA_STARTUP: str = "check"
+    AI_MODEL_PRELOAD: bool = True  # 시작 시 임베딩 모델 로드 (False 면 첫 사용 때 로드)
+
+    # 관리자 계정 설정 (python -m app.db.init_db 로 생성)
     ADMIN_EMAIL: str = os.getenv("ADMIN_EMAIL", "admin@example.com")
     ADMIN_PASSWORD: str = os.getenv("ADMIN_PASSWORD", "admin")
-    
+
+    # 디버그 모드 (요청별 상세 정보 노출)
+    DEBUG: bool = False
+
+    # 성능 계측 설정
+    SERVER_TIMING_ENABLED: bool = False  # 응답에 Server-Timing 헤더 포함 여부
+    QUERY_STATS_ENABLED: bool = True  # 요청별 SQL 통계 (DEBUG 시 X-DB-* 응답 헤더)
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1  # 느린 SELECT 중 EXPLAIN ANALYZE 를 남길 비율 (0 이면 안 함)
+
+    # 응답 압축 설정 (br / zstd 는 brotli / zstandard 패키지가 있을 때만 사용)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: List[str] = ["br", "zstd", "gzip"]  # 클라이언트 q 값이 같을 때의 우선순위
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 응답은 압축하지 않음 (바이트)
+    COMPRESSION_CONTENT_TYPES: List[str] = ["application/json", "text/"]  # 접두어 일치
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # 인증 사용자 캐시 설정 (토큰 → 사용자 조회 결과, update_user 시 즉시 무효화)
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_BACKEND: str = "app.core.cache.LocalCacheBackend"
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30  # 다른 워커 / 직접 DB 수정이 반영되기까지의 최대 지연
+
+    # 게시글 목록 전체 개수 계산 방식 (exact, cached, estimated)
+    POST_COUNT_STRATEGY: str = "exact"
+    POST_COUNT_CACHE_TTL_SECONDS: int = 60
+    POST_COUNT_ESTIMATE_MIN_ROWS: int = 100000  # 이보다 적으면 추정 대신 정확한 개수 사용
+
+    # 게시글 상세 / 첫 페이지 목록 캐시 설정
+    # 기본 저장소는 워커별 메모리이므로 다른 워커의 수정은 TTL 이 지나야 반영됨
+    POST_CACHE_ENABLED: bool = True
+    POST_CACHE_BACKEND: str = "app.core.cache.LocalCacheBackend"
+    POST_CACHE_MAX_ENTRIES: int = 10000
+    POST_DETAIL_CACHE_TTL_SECONDS: float = 60.0
+    POST_LIST_CACHE_TTL_SECONDS: float = 10.0  # 목록의 조회수는 이 시간만큼 늦게 반영될 수 있음
+    # 읽기 복제본을 쓰면 목록 캐시는 프라이머리에서 읽은 페이지만 저장하고, 쓰기 직후 요청은 캐시를 건너뜀
+
+    # 조회수 write-behind 설정
+    # 비정상 종료 시 최대 VIEW_COUNT_FLUSH_INTERVAL_SECONDS 초 또는 VIEW_COUNT_MAX_PENDING 건까지 유실 가능
+    VIEW_COUNT_BUFFERED: bool = True  # False 면 조회마다 즉시 UPDATE
+    VIEW_COUNT_FLUSH_INTERVAL_SECONDS: float = 5.0
+    VIEW_COUNT_MAX_PENDING: int = 1000
+    VIEW_COUNT_BACKEND: str = "app.services.view_count.LocalViewCountBackend"
+
+    # 순방문자(HyperLogLog) 집계 설정
+    UNIQUE_VIEWERS_ENABLED: bool = True
+    UNIQUE_VIEWERS_PRECISION: int = 12  # 스케치 크기 2^12 바이트, 표준 오차 약 1.6%
+    # (바꾸면 precision 이 다른 기존 스케치와는 낮은 쪽 precision 으로 접어서 합침)
+    UNIQUE_VIEWERS_FLUSH_INTERVAL_SECONDS: float = 30.0
+
+    # 인기 게시글 리더보드 설정 (조회/댓글 가중치, 반감기)
+    TRENDING_ENABLED: bool = True
+    TRENDING_HALF_LIFE_HOURS: float = 6.0
+    TRENDING_TOP_N: int = 100
+    TRENDING_MAX_TRACKED: int = 10000
+    TRENDING_VIEW_WEIGHT: float = 1.0
+    TRENDING_COMMENT_WEIGHT: float = 5.0
+    TRENDING_SNAPSHOT_PATH: Optional[str] = None  # 지정 시 재시작 후에도 점수 유지
+    # (단일 워커 가정: 워커가 여러 개면 각 워커의 점수가 같은 파일을 서로 덮어씀)
+    TRENDING_SNAPSHOT_INTERVAL_SECONDS: float = 60.0
+
+    # 게시글 의미 기반 검색 설정 (pgvector HNSW)
+    POST_EMBEDDINGS_ENABLED: bool = True
+    SEMANTIC_SEARCH_EF_SEARCH: int = 100
+    # 필터로 걸러진 만큼 인덱스를 더 읽도록 하는 옵션 (relaxed_order / strict_order)
+    # pgvector 0.8 이상에서만 있는 설정이므로 확장 버전을 확인한 뒤 켬 (None 이면 사용 안 함)
+    SEMANTIC_SEARCH_ITERATIVE_SCAN: Optional[str] = None
+
     class Config:
         case_sensitive = True
 
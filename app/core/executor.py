@@ -0,0 +1,94 @@
+"""
+대기열 길이가 제한된 전용 스레드 실행기
+비밀번호 해시처럼 CPU 를 오래 쓰는 작업을 기본 스레드 풀과 분리해서,
+몰려도 다른 동기 엔드포인트의 스레드를 빼앗지 않고 한도를 넘으면 바로 거절함
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.metrics import registry
+
+EXECUTOR_INFLIGHT = registry.gauge(
+    "executor_inflight_tasks", "실행 중이거나 대기 중인 작업 수", labelnames=("executor",)
+)
+EXECUTOR_REJECTED = registry.counter(
+    "executor_rejected_total", "대기열이 가득 차서 거절한 작업 수", labelnames=("executor",)
+)
+EXECUTOR_WAIT_SECONDS = registry.histogram(
+    "executor_queue_wait_seconds", "작업이 실행되기까지 대기한 시간(초)", labelnames=("executor",)
+)
+EXECUTOR_RUN_SECONDS = registry.histogram(
+    "executor_run_seconds", "작업 실행 시간(초)", labelnames=("executor",)
+)
+
+
+class ExecutorFull(RuntimeError):
+    """실행기 대기열이 가득 참 (호출 측에서 503 으로 응답)"""
+
+
+class BoundedExecutor:
+    """
+    max_workers 개 스레드 + 최대 max_queue 개 대기 작업
+
+    Example:
+        executor = BoundedExecutor("password-hash", max_workers=2, max_queue=32)
+        hashed = await executor.run(pwd_context.hash, password)  # 가득 차면 ExecutorFull
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._inflight = 0
+        self._lock = threading.Lock()
+        EXECUTOR_INFLIGHT.set_function(lambda: self._inflight, executor=name)
+
+    def _acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            EXECUTOR_REJECTED.inc(executor=self.name)
+            raise ExecutorFull(f"{self.name} 실행기의 대기열이 가득 찼습니다.")
+        with self._lock:
+            self._inflight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._inflight -= 1
+        self._slots.release()
+
+    def _submit(self, func: Callable[..., Any], args: tuple) -> Future:
+        self._acquire()
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            EXECUTOR_WAIT_SECONDS.observe(started - submitted, executor=self.name)
+            try:
+                return func(*args)
+            finally:
+                EXECUTOR_RUN_SECONDS.observe(time.perf_counter() - started, executor=self.name)
+
+        try:
+            future = self._executor.submit(task)
+        except BaseException:
+            self._release()
+            raise
+        # 실행 전에 취소된 작업도 자리를 돌려주도록 완료 콜백에서 반환
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """func(*args) 를 실행기에서 실행하고 결과를 기다림 (이벤트 루프는 막지 않음)"""
+        return await asyncio.wrap_future(self._submit(func, args))
+
+    def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """동기 코드에서 사용 (호출 스레드는 결과가 나올 때까지 기다림)"""
+        return self._submit(func, args).result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
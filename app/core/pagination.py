@@ -0,0 +1,138 @@
+"""
+커서(keyset) 페이지네이션 공통 기능
+커서는 정렬 키 값과 마지막 id를 담은 JSON을 base64url 로 인코딩한 불투명 문자열
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+
+# 커서 진행 방향
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """커서 페이로드를 불투명 문자열로 인코딩 (datetime 은 ISO 8601 문자열로 저장)"""
+    data = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in payload.items()
+    }
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    커서 문자열 디코딩
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    if not isinstance(payload, dict):
+        raise ValueError("잘못된 커서입니다.")
+    return payload
+
+
+def parse_datetime(value: Any) -> datetime:
+    """커서에 저장된 ISO 8601 문자열을 datetime 으로 변환"""
+    if not isinstance(value, str):
+        raise ValueError("잘못된 커서입니다.")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def paginate_keyset(
+    query: Any,
+    sort_column: Any,
+    id_column: Any,
+    size: int,
+    order_desc: bool = True,
+    cursor: Optional[str] = None,
+    tag: str = "",
+    key_getter: Optional[Callable[[Any], Tuple[Any, Any]]] = None,
+    value_parser: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """
+    (정렬 컬럼, id) 기준 keyset 페이지네이션
+
+    OFFSET 없이 마지막으로 본 키 이후의 행만 조회하므로 페이지 깊이와 무관하게
+    (sort_column, id_column) 인덱스 범위 스캔 한 번으로 끝남
+
+    Args:
+        query: 필터까지 적용된 SQLAlchemy 쿼리 (정렬/limit 은 여기서 적용)
+        sort_column: 정렬 컬럼 또는 식
+        id_column: 동률을 깨기 위한 유일 키 컬럼
+        size: 페이지 크기
+        order_desc: 내림차순 여부
+        cursor: 이전 응답의 next_cursor / prev_cursor
+        tag: 커서가 만들어진 정렬 기준 (다른 정렬의 커서 재사용 방지)
+        key_getter: 행에서 (정렬값, id) 를 꺼내는 함수 (기본: 컬럼 이름으로 속성 조회)
+        value_parser: 커서에 저장된 정렬값을 원래 타입으로 되돌리는 함수
+
+    Returns:
+        (행 목록, next_cursor, prev_cursor)
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    if key_getter is None:
+        def key_getter(row: Any) -> Tuple[Any, Any]:
+            return getattr(row, sort_column.key), getattr(row, id_column.key)
+
+    backwards = False
+    if cursor:
+        payload = decode_cursor(cursor)
+        if payload.get("t") != tag or payload.get("d") not in (CURSOR_NEXT, CURSOR_PREV):
+            raise ValueError("잘못된 커서입니다.")
+        last_id = payload.get("id")
+        if not isinstance(last_id, int) or isinstance(last_id, bool):
+            raise ValueError("잘못된 커서입니다.")
+        value = payload.get("v")
+        if value_parser is not None and value is not None:
+            try:
+                value = value_parser(value)
+            except (TypeError, ValueError) as e:
+                raise ValueError("잘못된 커서입니다.") from e
+        backwards = payload["d"] == CURSOR_PREV
+        # 이전 페이지로 갈 때는 정렬을 뒤집어 조회한 뒤 결과를 다시 뒤집음
+        scan_desc = order_desc != backwards
+        key = tuple_(sort_column, id_column)
+        bound = tuple_(value, last_id)
+        query = query.filter(key < bound if scan_desc else key > bound)
+    else:
+        scan_desc = order_desc
+
+    if scan_desc:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    rows = query.limit(size + 1).all()
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if backwards:
+        rows.reverse()
+
+    def make_cursor(row: Any, direction: str) -> str:
+        value, row_id = key_getter(row)
+        return encode_cursor({"t": tag, "v": value, "id": row_id, "d": direction})
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if has_more or backwards:
+            next_cursor = make_cursor(rows[-1], CURSOR_NEXT)
+        if cursor and (not backwards or has_more):
+            prev_cursor = make_cursor(rows[0], CURSOR_PREV)
+    return rows, next_cursor, prev_cursor
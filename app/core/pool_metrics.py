@@ -0,0 +1,79 @@
+"""
+DB 연결 풀 메트릭
+연결을 얻기까지 기다린 시간, 사용 중 / 유휴 / 초과(overflow) 연결 수, 대기 시간 초과 횟수
+
+워커 수 × (DB_POOL_SIZE + DB_MAX_OVERFLOW) 가 Postgres max_connections 에서
+관리용 예약 연결을 뺀 값을 넘지 않도록 잡고, 대기 시간 / 초과 연결이 늘면 풀 크기를 조정
+"""
+
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import registry
+
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "풀에서 연결을 얻기까지 기다린 시간(초)",
+    labelnames=("pool",),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_TIMEOUTS = registry.counter(
+    "db_pool_timeouts_total", "풀 대기 시간(DB_POOL_TIMEOUT) 초과 횟수", labelnames=("pool",)
+)
+DB_POOL_CONNECTIONS = registry.gauge(
+    "db_pool_connections",
+    "풀 연결 수 (state: in_use, idle, overflow)",
+    labelnames=("pool", "state"),
+)
+DB_POOL_CAPACITY = registry.gauge(
+    "db_pool_capacity", "풀 최대 연결 수 (pool_size + max_overflow)", labelnames=("pool",)
+)
+
+
+class _CheckoutMetricsMixin:
+    """연결을 얻는 데 걸린 시간과 대기 시간 초과 기록"""
+
+    metrics_name = "primary"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc(pool=self.metrics_name)
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start, pool=self.metrics_name)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+class InstrumentedQueuePool(_CheckoutMetricsMixin, QueuePool):
+    """동기 엔진용"""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutMetricsMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 (asyncpg)"""
+
+
+def register_pool_metrics(engine, name: str = "primary", max_overflow: int = 0) -> None:
+    """
+    엔진 풀의 연결 수 게이지 등록 (Instrumented*QueuePool 이면 대기 시간도 이름으로 구분)
+
+    비동기 엔진은 engine.sync_engine 을 넘김
+    """
+    pool = engine.pool
+    if isinstance(pool, _CheckoutMetricsMixin):
+        pool.metrics_name = name
+    if not isinstance(pool, QueuePool):
+        return
+    # dispose() 후에는 engine.pool 이 새 풀로 바뀌므로 매번 engine 에서 읽음
+    DB_POOL_CONNECTIONS.set_function(lambda: engine.pool.checkedout(), pool=name, state="in_use")
+    DB_POOL_CONNECTIONS.set_function(lambda: engine.pool.checkedin(), pool=name, state="idle")
+    DB_POOL_CONNECTIONS.set_function(lambda: max(0, engine.pool.overflow()), pool=name, state="overflow")
+    DB_POOL_CAPACITY.set(pool.size() + max_overflow, pool=name)
@@ -0,0 +1,197 @@
+"""
+요청별 SQL 실행 통계
+엔진 이벤트로 문장 수 / DB 시간 / 가장 느린 문장을 요청 단위로 모으고,
+임계값을 넘는 SELECT 는 표본을 골라 EXPLAIN (ANALYZE, BUFFERS) 결과와 함께 로그로 남김
+"""
+
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request",
+    "요청당 SQL 실행 횟수",
+    labelnames=("method", "route"),
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_TIME_PER_REQUEST = registry.histogram(
+    "db_time_per_request_seconds",
+    "요청당 SQL 실행 시간 합계(초)",
+    labelnames=("method", "route"),
+)
+SLOW_QUERIES = registry.counter(
+    "db_slow_queries_total", "임계값을 넘은 SQL 실행 횟수"
+)
+
+_START_TIMES_KEY = "query_stats_start_times"
+
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 SQL 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def add(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def headers(self):
+        return [
+            (b"x-db-query-count", str(self.count).encode("latin-1")),
+            (b"x-db-time-ms", f"{self.total_seconds * 1000:.3f}".encode("latin-1")),
+            (b"x-db-slowest-ms", f"{self.slowest_seconds * 1000:.3f}".encode("latin-1")),
+        ]
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def get_request_query_stats() -> Optional[RequestQueryStats]:
+    """현재 요청의 SQL 통계 (요청 밖에서는 None)"""
+    return _current_stats.get()
+
+
+def _explain_analyze(conn, statement: str, parameters) -> Optional[str]:
+    """
+    같은 DB 연결에서 EXPLAIN (ANALYZE, BUFFERS) 실행
+
+    ANALYZE 는 문장을 한 번 더 실행하므로 SELECT 에만 쓰고,
+    실패해도 진행 중인 트랜잭션이 깨지지 않도록 SAVEPOINT 안에서 실행
+    SQLAlchemy 를 거치지 않는 DBAPI 커서를 쓰므로 이벤트가 다시 호출되지 않음
+    비동기 엔진(asyncpg)은 SQLAlchemy 의 DBAPI 어댑터 커서를 쓰며, 이벤트가 greenlet 안에서
+    호출되므로 같은 방식으로 실행됨 (자리표시자 형식도 원래 문장과 같음)
+    진단용 훅이므로 어떤 실패도 밖으로 던지지 않고 로그만 남김 (원래 문장은 이미 성공했음)
+    """
+    explain_cursor = None
+    try:
+        explain_cursor = conn.connection.dbapi_connection.cursor()
+        explain_cursor.execute("SAVEPOINT query_stats_explain")
+        try:
+            explain_cursor.execute("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+            plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+        except Exception:
+            explain_cursor.execute("ROLLBACK TO SAVEPOINT query_stats_explain")
+            raise
+        explain_cursor.execute("RELEASE SAVEPOINT query_stats_explain")
+        return plan
+    except Exception as e:
+        logger.warning(f"느린 쿼리 실행 계획 조회 실패: {e}")
+        return None
+    finally:
+        if explain_cursor is not None:
+            try:
+                explain_cursor.close()
+            except Exception:
+                pass
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add(statement, elapsed)
+
+    if elapsed * 1000 < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+    SLOW_QUERIES.inc()
+
+    plan = None
+    is_select = statement.lstrip()[:6].upper() == "SELECT" and "FOR UPDATE" not in statement.upper()
+    if (
+        is_select
+        and not executemany
+        # EXPLAIN (ANALYZE, BUFFERS) 는 PostgreSQL 문법 (동기 psycopg2 / 비동기 asyncpg 모두)
+        and conn.dialect.name == "postgresql"
+        and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+    ):
+        plan = _explain_analyze(conn, statement, parameters)
+
+    message = f"느린 쿼리 ({elapsed * 1000:.1f}ms): {statement}"
+    if plan:
+        message += f"\n{plan}"
+    logger.warning(message)
+
+
+def _handle_error(exception_context):
+    # 실패한 문장은 after_cursor_execute 가 호출되지 않으므로 시작 시각을 여기서 버림
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_START_TIMES_KEY):
+        conn.info[_START_TIMES_KEY].pop()
+
+
+def install_query_hooks() -> None:
+    """모든 Engine 에 SQL 통계 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+
+def _route_label(scope) -> str:
+    # 경로 파라미터가 들어간 실제 URL 대신 라우트 템플릿을 써서 레이블 수를 제한
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    endpoint = scope.get("endpoint")
+    return getattr(endpoint, "__name__", None) or "unmatched"
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 SQL 통계를 모으는 ASGI 미들웨어
+
+    라우트별 메트릭(db_queries_per_request, db_time_per_request_seconds)을 기록하고,
+    DEBUG 설정 시 응답에 X-DB-Query-Count / X-DB-Time-Ms / X-DB-Slowest-Ms 헤더를 붙임
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                message = {**message, "headers": list(message.get("headers", [])) + stats.headers()}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            labels = {"method": scope["method"], "route": _route_label(scope)}
+            DB_QUERIES_PER_REQUEST.observe(stats.count, **labels)
+            DB_TIME_PER_REQUEST.observe(stats.total_seconds, **labels)
@@ -0,0 +1,129 @@
+"""
+전문 검색용 토큰화 / 검색식 / 하이라이트
+한글은 형태소 분석 없이 음절 bigram 으로 색인하고 ('데이터' → '데이', '이터'),
+PostgreSQL 'simple' 설정의 tsvector / tsquery 로 검색
+
+검색 벡터는 services.post / services.comment 의 생성·수정 함수에서만 채움
+(bigram 토큰화가 파이썬 코드라 DB 트리거로 옮기지 않음). 직접 INSERT 하거나
+ORM 으로 바로 추가한 행 (벤치마크 시드, 테스트 데이터 등) 은 search_vector 가 NULL 이라
+검색되지 않으므로, 검색 대상이어야 하면 post_search_vector / comment_search_vector 로 함께 저장
+"""
+
+import hashlib
+import html
+import re
+from typing import List, Optional
+
+from sqlalchemy import func, literal
+
+SEARCH_CONFIG = "simple"
+
+_HANGUL = "가-힣"
+_WORD_RE = re.compile(rf"[{_HANGUL}]+|[^\W_{_HANGUL}]+")
+_HANGUL_RE = re.compile(rf"[{_HANGUL}]+")
+# tsvector 렉심 최대 길이 제한 대비
+_MAX_TOKEN_LENGTH = 100
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def _word_tokens(word: str) -> List[str]:
+    if _HANGUL_RE.fullmatch(word) and len(word) > 1:
+        return [word[i:i + 2] for i in range(len(word) - 1)]
+    return [word[:_MAX_TOKEN_LENGTH]]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    색인용 토큰 목록
+
+    Example:
+        tokenize("FastAPI 데이터베이스")  # ['fastapi', '데이', '이터', '터베', '베이', '이스']
+    """
+    tokens: List[str] = []
+    for word in _words(text):
+        tokens.extend(_word_tokens(word))
+    return tokens
+
+
+def to_document(text: str) -> str:
+    """to_tsvector 에 넘길 공백 구분 토큰 문자열 (토큰 위치가 원문 순서를 유지)"""
+    return " ".join(tokenize(text))
+
+
+def build_tsquery(query: str) -> Optional[str]:
+    """
+    검색어 → to_tsquery 문자열
+
+    단어 안의 bigram 은 인접 연산자(<->)로, 단어끼리는 AND(&)로 묶음
+    한 글자 한글 단어는 접두어 검색 ('가':*)
+    토큰은 문자/숫자만 포함하므로 그대로 따옴표로 감싸도 안전함
+
+    Returns:
+        검색할 토큰이 없으면 None
+    """
+    terms = []
+    for word in _words(query):
+        if _HANGUL_RE.fullmatch(word) and len(word) == 1:
+            terms.append(f"'{word}':*")
+        else:
+            terms.append(" <-> ".join(f"'{token}'" for token in _word_tokens(word)))
+    if not terms:
+        return None
+    return " & ".join(f"({term})" for term in terms)
+
+
+def query_fingerprint(tsquery: str) -> str:
+    """커서가 같은 검색어로 만들어졌는지 확인하기 위한 짧은 해시"""
+    return hashlib.blake2b(tsquery.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def weighted_vector(text: str, weight: str):
+    """가중치를 붙인 tsvector SQL 식"""
+    return func.setweight(func.to_tsvector(SEARCH_CONFIG, literal(to_document(text))), weight)
+
+
+def post_search_vector(title: str, content: str):
+    """게시글 검색 벡터 (제목 A, 본문 B 가중치)"""
+    return weighted_vector(title, "A").op("||")(weighted_vector(content, "B"))
+
+
+def comment_search_vector(content: str):
+    """댓글 검색 벡터"""
+    return weighted_vector(content, "B")
+
+
+def highlight(text: str, query: str, max_length: Optional[int] = None, context: int = 40) -> str:
+    """
+    검색어를 <mark> 로 감싼 HTML 이스케이프된 문자열
+
+    max_length 를 주면 첫 일치 위치 앞뒤로 잘라 스니펫을 만듦
+    """
+    text = text or ""
+    words = sorted(set(_words(query)), key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE) if words else None
+
+    start, end = 0, len(text)
+    if max_length is not None and len(text) > max_length:
+        first = pattern.search(text) if pattern else None
+        start = max(0, first.start() - min(context, max_length // 3)) if first else 0
+        end = min(len(text), start + max_length)
+        start = max(0, end - max_length)
+
+    segment = text[start:end]
+    parts = []
+    position = 0
+    for match in pattern.finditer(segment) if pattern else ():
+        parts.append(html.escape(segment[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(segment[position:]))
+
+    snippet = "".join(parts)
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(text):
+        snippet += "…"
+    return snippet
@@ -1,13 +1,39 @@
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Optional, Sequence, Tuple, Union
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.executor import BoundedExecutor
+
+def build_password_context(schemes: Sequence[str]) -> CryptContext:
+    """
+    비밀번호 해시 컨텍스트 (첫 번째 방식이 기본, 나머지는 검증만 하고 재해시 대상)
+
+    설정한 비용보다 약한 해시도 needs_update 로 잡히도록 최소값을 같이 지정
+    """
+    options = {}
+    if "bcrypt" in schemes:
+        options["bcrypt__rounds"] = settings.PASSWORD_BCRYPT_ROUNDS
+        options["bcrypt__min_rounds"] = settings.PASSWORD_BCRYPT_ROUNDS
+    if "argon2" in schemes:
+        options["argon2__rounds"] = settings.PASSWORD_ARGON2_TIME_COST
+        options["argon2__min_rounds"] = settings.PASSWORD_ARGON2_TIME_COST
+        options["argon2__memory_cost"] = settings.PASSWORD_ARGON2_MEMORY_COST
+        options["argon2__parallelism"] = settings.PASSWORD_ARGON2_PARALLELISM
+    return CryptContext(schemes=list(schemes), deprecated="auto", **options)
 
 # 패스워드 해싱을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_password_context(settings.PASSWORD_HASH_SCHEMES)
+
+# 해시 전용 실행기 (로그인이 몰려도 기본 스레드 풀을 차지하지 않음)
+password_executor = BoundedExecutor(
+    "password-hash",
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_QUEUE_SIZE,
+)
 
 # 비밀번호 해싱
 def get_password_hash(password: str) -> str:
@@ -17,6 +43,20 @@ def get_password_hash(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+# 비밀번호 검증 + 해시 방식 / 비용이 바뀌었으면 새 해시 (필요 없으면 None)
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_executor.run(get_password_hash, password)
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    return await password_executor.run(verify_and_update_password, plain_password, hashed_password)
+
 # JWT 토큰 생성
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
@@ -27,6 +67,7 @@ def create_access_token(
         expire = datetime.utcnow() + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode = {"exp": expire, "sub": str(subject)}
+    # jti 는 토큰 폐기(로그아웃) 시 식별자
+    to_encode = {"exp": expire, "sub": str(subject), "jti": uuid.uuid4().hex}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt 
\ No newline at end of file
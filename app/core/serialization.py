@@ -0,0 +1,54 @@
+"""
+빠른 JSON 직렬화
+orjson 이 설치되어 있으면 사용하고 (poetry install -E fast-json), 없으면 표준 json 으로 대체
+날짜 형식은 Pydantic 직렬화와 같음 (UTC 는 'Z', 그 외 시간대는 오프셋)
+"""
+
+import json
+from datetime import date, datetime, timezone
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        if value.tzinfo is not None and value.utcoffset() == timezone.utc.utcoffset(None):
+            text = text[:-6] + "Z"
+        return text
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """dict / list / 기본 타입 / datetime 을 UTF-8 JSON 바이트로"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    dumps() 로 렌더링하는 JSON 응답
+
+    엔드포인트가 이 응답을 직접 반환하면 response_model 검증과 jsonable_encoder 를 거치지 않으므로
+    DB 에서 응답 스키마 필드만 골라 만든 dict 처럼 이미 형태가 맞는 데이터에만 사용
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,121 @@
+"""
+구간별 실행 시간 측정
+요청 단위로 구간 시간을 모아 Server-Timing 헤더와 히스토그램 메트릭으로 내보냄
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+
+
+class RequestTimings:
+    """요청 하나에서 측정된 구간 시간 모음"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.entries: List[Tuple[str, float]] = []
+
+    def add(self, name: str, seconds: float) -> None:
+        self.entries.append((name, seconds))
+
+    def as_dict(self) -> Dict[str, float]:
+        """구간명 → 밀리초 (같은 이름은 합산)"""
+        result: Dict[str, float] = {}
+        for name, seconds in self.entries:
+            result[name] = round(result.get(name, 0.0) + seconds * 1000, 3)
+        return result
+
+    def server_timing_header(self) -> str:
+        parts = [f"{name};dur={ms}" for name, ms in self.as_dict().items()]
+        total_ms = round((time.perf_counter() - self.started) * 1000, 3)
+        parts.append(f"total;dur={total_ms}")
+        return ", ".join(parts)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """현재 요청의 구간 시간 모음 (요청 밖에서는 None)"""
+    return _current_timings.get()
+
+
+class StageTimer:
+    """
+    한 작업(파이프라인) 안의 구간 시간 측정기
+
+    측정값은 자신의 결과, 현재 요청의 RequestTimings, 히스토그램 메트릭에 동시에 기록됨
+
+    Example:
+        timer = StageTimer(AI_STAGE_SECONDS)
+        with timer.stage("encode"):
+            ...
+        timer.as_dict()  # {"encode": 12.3}
+    """
+
+    def __init__(self, histogram: Optional[Histogram] = None):
+        self.histogram = histogram
+        self.entries: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.entries.append((name, elapsed))
+            if self.histogram is not None:
+                self.histogram.observe(elapsed, stage=name)
+            request_timings = _current_timings.get()
+            if request_timings is not None:
+                request_timings.add(name, elapsed)
+
+    def as_dict(self) -> Dict[str, float]:
+        """구간명 → 밀리초"""
+        result: Dict[str, float] = {}
+        for name, seconds in self.entries:
+            result[name] = round(result.get(name, 0.0) + seconds * 1000, 3)
+        return result
+
+
+class ServerTimingMiddleware:
+    """
+    요청마다 RequestTimings 를 준비하고,
+    SERVER_TIMING_ENABLED 설정 시 응답에 Server-Timing 헤더를 붙이는 ASGI 미들웨어
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+
+        async def send_wrapper(message):
+            if (
+                message["type"] == "http.response.start"
+                and settings.SERVER_TIMING_ENABLED
+                and timings.entries
+            ):
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", timings.server_timing_header().encode("latin-1"))
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_timings.reset(token)
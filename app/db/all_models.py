@@ -1,4 +1,6 @@
 from app.models.user import User
 from app.models.post import Post
 from app.models.comment import Comment
-from app.models.ai import ColumnDescription, ColumnEmbedding 
\ No newline at end of file
+from app.models.ai import ColumnDescription, ColumnEmbedding, PostEmbedding 
+from app.models.view_sketch import PostViewerSketch, PostDailyViewerSketch
+from app.models.revoked_token import RevokedToken
@@ -1,15 +1,83 @@
-from sqlalchemy import create_engine
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    register_pool_metrics,
+)
+
+def _pool_options(poolclass) -> dict:
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+# 엔진 생성 (프로세스 안의 모든 세션이 이 함수로 만든 엔진 하나의 풀을 공유)
+def create_db_engine(url: str = None, pool_name: str = "primary", **kwargs) -> Engine:
+    url = url or settings.DATABASE_URL
+    if make_url(url).get_backend_name() == "sqlite":
+        # SQLite 는 자체 풀을 쓰므로 풀 설정 없이 생성
+        return create_engine(url, **kwargs)
+    options = {**_pool_options(InstrumentedQueuePool), **kwargs}
+    db_engine = create_engine(url, **options)
+    register_pool_metrics(db_engine, pool_name, max_overflow=options["max_overflow"])
+    return db_engine
+
+def to_async_url(url: str) -> str:
+    """postgresql(+psycopg2) URL 을 asyncpg 드라이버 URL 로"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql":
+        return url
+    return parsed.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+def register_vector_codec(db_engine: AsyncEngine) -> None:
+    """asyncpg 는 vector 타입 코덱을 연결마다 등록해야 함 (pgvector 임베딩 검색)"""
+    if db_engine.dialect.driver != "asyncpg":
+        return
+    from pgvector.asyncpg import register_vector
+
+    @event.listens_for(db_engine.sync_engine, "connect")
+    def _register_vector(dbapi_connection, connection_record):
+        dbapi_connection.run_async(register_vector)
+
+# 비동기 엔진 생성 (asyncpg, 동기 엔진과 같은 풀 설정)
+def create_async_db_engine(url: str = None, pool_name: str = "async", **kwargs) -> AsyncEngine:
+    url = url or settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    options = {**_pool_options(InstrumentedAsyncQueuePool), **kwargs}
+    db_engine = create_async_engine(url, **options)
+    register_vector_codec(db_engine)
+    register_pool_metrics(db_engine.sync_engine, pool_name, max_overflow=options["max_overflow"])
+    return db_engine
 
 # 데이터베이스 엔진 생성
-engine = create_engine(settings.DATABASE_URL)
+engine = create_db_engine()
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진은 처음 사용할 때 생성 (asyncpg 를 쓰지 않는 스크립트 / 마이그레이션은 동기 엔진만 사용)
+_async_engine: Optional[AsyncEngine] = None
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+    return _async_engine
+
+# 비동기 세션 팩토리 (커밋 후에도 읽어 둔 속성에 접근할 수 있도록 만료하지 않음)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
 # 모델의 기본 클래스
 Base = declarative_base()
 
@@ -19,4 +87,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# 비동기 엔드포인트용
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        yield db
@@ -1,26 +1,133 @@
+"""
+데이터베이스 초기화
+워커 시작 시에는 Alembic 버전만 한 번 확인하고 (최신이면 create_all 생략),
+관리자 계정은 배포 때 한 번만 실행하는 명령으로 생성
+
+사용법:
+    poetry run alembic upgrade head
+    poetry run python -m app.db.init_db  # ADMIN_EMAIL / ADMIN_PASSWORD 설정으로 관리자 생성
+    poetry run python -m app.db.init_db --email admin@example.com --password ...
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Optional, Set, Tuple
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from app import models, schemas, services
 from app.core.config import settings
-from app.db.base import Base, engine
-
-def init_db(db: Session) -> None:
-    # 테이블 생성
-    Base.metadata.create_all(bind=engine)
-    
-    # 관리자 계정 생성
-    admin = services.user.get_by_email(db, email=settings.ADMIN_EMAIL)
-    if not admin:
+from app.db.base import Base, SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+SCHEMA_STARTUP_MODES = ("check", "create_all", "off")
+
+
+def alembic_heads() -> Set[str]:
+    """마이그레이션 스크립트의 head 리비전"""
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "migrations"))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def schema_revisions(db_engine: Engine) -> Tuple[Optional[Set[str]], Set[str]]:
+    """
+    (DB 에 기록된 리비전, 스크립트 head 리비전)
+
+    기록된 리비전이 없으면 (마이그레이션을 한 번도 하지 않은 DB) 첫 값은 None
+    """
+    with db_engine.connect() as conn:
+        current = set(MigrationContext.configure(conn).get_current_heads())
+    return current or None, alembic_heads()
+
+
+def init_schema(mode: str = "check", db_engine: Engine = engine) -> str:
+    """
+    워커 시작 시 스키마 준비
+
+    check: alembic_version 이 head 와 같으면 아무것도 하지 않음.
+           기록된 버전이 없으면 (개발용 DB) create_all, head 와 다르면 경고만 남김
+           (create_all 로 새 테이블만 만들면 이후 alembic upgrade 가 실패하므로)
+    create_all: 매번 create_all (모든 테이블 카탈로그 조회)
+    off: 아무것도 하지 않음
+
+    Returns:
+        수행한 작업 (current, create_all, outdated, skipped)
+    """
+    if mode not in SCHEMA_STARTUP_MODES:
+        raise ValueError(f"알 수 없는 스키마 초기화 방식입니다: {mode}")
+    if mode == "off":
+        return "skipped"
+    if mode == "check":
+        current, heads = schema_revisions(db_engine)
+        if current == heads:
+            return "current"
+        if current is not None:
+            logger.warning(
+                f"DB 스키마가 최신이 아닙니다 (현재 {sorted(current)}, head {sorted(heads)}). "
+                "alembic upgrade head 를 실행하세요."
+            )
+            return "outdated"
+        logger.info("기록된 alembic 버전이 없어 create_all 로 테이블을 만듭니다.")
+    Base.metadata.create_all(bind=db_engine)
+    return "create_all"
+
+
+def create_admin(db: Session, email: str, password: str) -> Tuple[models.User, bool]:
+    """
+    관리자 계정 생성 (이미 있으면 관리자 권한만 부여)
+
+    Returns:
+        (사용자, 새로 만들었는지)
+    """
+    admin = services.user.get_by_email(db, email=email)
+    created = admin is None
+    if created:
         admin_in = schemas.UserCreate(
-            email=settings.ADMIN_EMAIL,
+            email=email,
             username="관리자",
-            password=settings.ADMIN_PASSWORD,
-            confirm_password=settings.ADMIN_PASSWORD,
+            password=password,
+            confirm_password=password,
         )
         admin = services.user.create_user(db, obj_in=admin_in)
-        
+    if not admin.is_admin:
         # 관리자 권한 부여
         admin.is_admin = True
         db.add(admin)
         db.commit()
-        db.refresh(admin) 
\ No newline at end of file
+        db.refresh(admin)
+        services.user.invalidate_principal(admin.id)
+    return admin, created
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="관리자 계정 생성")
+    parser.add_argument("--email", default=settings.ADMIN_EMAIL)
+    parser.add_argument("--password", default=settings.ADMIN_PASSWORD)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        admin, created = create_admin(db, email=args.email, password=args.password)
+        if created:
+            print(f"✅ 관리자 계정이 생성되었습니다: {admin.email}")
+        else:
+            print(f"✅ 관리자 계정이 이미 있습니다: {admin.email}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 관리자 계정 생성 실패: {e}")
+        raise SystemExit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+읽기 복제본 라우팅
+읽기 전용 엔드포인트의 세션은 건강한 복제본을 돌아가며 사용하고,
+쓰기(flush / INSERT·UPDATE·DELETE)가 시작되면 그 세션의 이후 쿼리는 프라이머리로 보냄
+
+쓰기 직후 읽기(read-your-writes)
+    - 같은 요청: 쓰기가 있었으면 이후 만드는 읽기 세션도 프라이머리 사용
+    - 다음 요청: 쓰기가 있었던 응답에 쿠키를 붙여 REPLICA_STICKY_SECONDS 동안 프라이머리 사용
+text() 로 직접 실행한 쓰기는 감지하지 못하므로 읽기 세션에서는 ORM / Core 구문만 사용
+"""
+
+import itertools
+import logging
+import threading
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import AsyncGenerator, List, Optional, Union
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.background import PeriodicWorker
+from app.core.config import settings
+from app.core.metrics import registry
+from app.db.base import create_async_db_engine, create_db_engine, engine, get_async_engine, to_async_url
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_COOKIE = "db_primary"
+
+# 복제본이면 (수신한 WAL 을 모두 적용했을 때는 0) 마지막 트랜잭션 적용 후 지난 시간, 프라이머리면 0
+REPLICATION_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+DB_REPLICA_HEALTHY = registry.gauge(
+    "db_replica_healthy", "복제본 상태 (1: 읽기에 사용, 0: 제외)", labelnames=("replica",)
+)
+DB_REPLICA_LAG = registry.gauge(
+    "db_replica_lag_seconds", "마지막 상태 확인 때의 복제 지연(초)", labelnames=("replica",)
+)
+DB_ROUTED_SESSIONS = registry.counter(
+    "db_routed_sessions_total",
+    "읽기 세션이 처음 사용한 DB (target: replica, primary)",
+    labelnames=("target",),
+)
+
+
+class _RoutingState:
+    """요청 하나의 라우팅 상태"""
+
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned  # 직전 쓰기 쿠키가 있어 프라이머리 고정
+        self.wrote = False  # 이 요청에서 쓰기가 있었음
+
+
+_current_state: ContextVar[Optional[_RoutingState]] = ContextVar("db_routing_state", default=None)
+
+
+def must_use_primary() -> bool:
+    """현재 요청의 읽기를 프라이머리로 보내야 하는지 (고정 쿠키가 있거나 이 요청에서 쓰기가 있었음)"""
+    state = _current_state.get()
+    return state is not None and (state.pinned or state.wrote)
+
+
+def mark_primary_write() -> None:
+    """현재 요청에서 쓰기가 있었음을 기록 (이후 읽기는 프라이머리로, 응답에 고정 쿠키)"""
+    state = _current_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+# 모든 세션(프라이머리 전용 세션 포함)의 쓰기를 감지
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    mark_primary_write()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mark_primary_write()
+
+
+class Replica:
+    """복제본 하나 (동기 엔진 + 처음 사용할 때 만드는 비동기 엔진)"""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.url = url
+        self.engine = create_db_engine(url, pool_name=name)
+        self._async_engine: Optional[AsyncEngine] = None
+        self._lock = threading.Lock()
+        self.healthy = True  # 첫 상태 확인 전에는 사용
+        self.lag_seconds = 0.0
+        DB_REPLICA_HEALTHY.set_function(lambda: 1 if self.healthy else 0, replica=name)
+        DB_REPLICA_LAG.set_function(lambda: self.lag_seconds, replica=name)
+        event.listen(self.engine, "handle_error", self._on_error)
+
+    def async_engine(self) -> AsyncEngine:
+        with self._lock:
+            if self._async_engine is None:
+                self._async_engine = create_async_db_engine(
+                    to_async_url(self.url), pool_name=f"{self.name}-async"
+                )
+                event.listen(self._async_engine.sync_engine, "handle_error", self._on_error)
+            return self._async_engine
+
+    def _on_error(self, context) -> None:
+        # 연결이 끊겼거나 연결하지 못했으면 다음 상태 확인까지 읽기에서 제외
+        if context.is_disconnect or context.connection is None:
+            if self.healthy:
+                logger.warning(f"복제본 {self.name} 연결 실패, 읽기에서 제외: {context.original_exception}")
+            self.healthy = False
+
+    def check(self, max_lag_seconds: float) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                self.lag_seconds = float(conn.execute(REPLICATION_LAG_SQL).scalar() or 0)
+        except Exception as e:
+            if self.healthy:
+                logger.warning(f"복제본 {self.name} 상태 확인 실패: {e}")
+            self.healthy = False
+            return False
+        healthy = self.lag_seconds <= max_lag_seconds
+        if healthy != self.healthy:
+            action = "읽기에 다시 사용" if healthy else "지연으로 제외"
+            logger.info(f"복제본 {self.name} {action} (지연 {self.lag_seconds:.1f}초)")
+        self.healthy = healthy
+        return healthy
+
+
+class ReplicaRouter:
+    """
+    건강한 복제본을 라운드 로빈으로 고름 (없으면 None → 프라이머리)
+
+    Example:
+        router = ReplicaRouter(["postgresql://.../replica1"])
+        router.start()  # REPLICA_HEALTH_CHECK_SECONDS 마다 연결 / 복제 지연 확인
+        replica = router.choose()
+    """
+
+    def __init__(self, urls: List[str], check_interval: float = 5.0, max_lag_seconds: float = 10.0):
+        self.replicas = [Replica(f"replica{i}", url) for i, url in enumerate(urls, start=1)]
+        self.max_lag_seconds = max_lag_seconds
+        self._counter = itertools.count()
+        self._worker = PeriodicWorker("replica-health-checker", check_interval, self.check)
+
+    def choose(self) -> Optional[Replica]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def check(self) -> int:
+        """모든 복제본 상태 확인, 건강한 복제본 수 반환"""
+        return sum(replica.check(self.max_lag_seconds) for replica in self.replicas)
+
+    def start(self) -> None:
+        if self.replicas:
+            self.check()
+            self._worker.start()
+
+    def stop(self) -> None:
+        if self.replicas:
+            self._worker.stop()
+
+
+class RoutingSession(Session):
+    """
+    읽기는 복제본 하나(세션 동안 고정), 쓰기와 그 이후 쿼리는 프라이머리로 보내는 세션
+
+    한 트랜잭션의 읽기가 같은 연결을 쓰도록 복제본은 처음 쿼리할 때 한 번만 고름
+    AsyncSession 의 sync_session_class 로 쓸 때는 use_async=True (비동기 엔진의 sync_engine 을 반환)
+    """
+
+    def __init__(self, *args, primary: Engine, router: ReplicaRouter, use_async: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._primary = primary
+        self._router = router
+        self._use_async = use_async
+        self._replica_bind: Optional[Engine] = None
+        self._use_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self._use_primary and (
+            self._flushing or isinstance(clause, UpdateBase) or must_use_primary()
+        ):
+            self._use_primary = True
+            if self._replica_bind is None:
+                DB_ROUTED_SESSIONS.inc(target="primary")
+        if self._use_primary:
+            return self._primary
+        if self._replica_bind is None:
+            replica = self._router.choose()
+            if replica is None:
+                self._use_primary = True
+                DB_ROUTED_SESSIONS.inc(target="primary")
+                return self._primary
+            self._replica_bind = replica.async_engine().sync_engine if self._use_async else replica.engine
+            DB_ROUTED_SESSIONS.inc(target="replica")
+        return self._replica_bind
+
+
+def read_only_from_primary(session: Union[Session, AsyncSession]) -> bool:
+    """
+    세션이 지금까지 프라이머리에서만 읽었는지
+
+    라우팅 세션이 아니면 항상 프라이머리, 복제본에서 한 번이라도 읽었으면 False
+    (복제 지연으로 오래된 결과일 수 있으므로 공유 캐시에 저장하지 않는 데 사용)
+    """
+    if isinstance(session, AsyncSession):
+        session = session.sync_session
+    if not isinstance(session, RoutingSession):
+        return True
+    return session._replica_bind is None
+
+
+# 전역 인스턴스
+replica_router = ReplicaRouter(
+    settings.DATABASE_REPLICA_URLS,
+    check_interval=settings.REPLICA_HEALTH_CHECK_SECONDS,
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+)
+
+# 읽기 전용 세션 팩토리 (복제본이 없으면 모든 쿼리가 프라이머리로)
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, primary=engine, router=replica_router
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False
+)
+
+# 읽기 전용 엔드포인트용 의존성
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncReadSessionLocal(
+        primary=get_async_engine().sync_engine, router=replica_router, use_async=True
+    ) as db:
+        yield db
+
+
+class ReplicaStickinessMiddleware:
+    """
+    요청마다 라우팅 상태를 준비하는 ASGI 미들웨어
+
+    고정 쿠키가 있으면 이 요청의 읽기를 프라이머리로 보내고,
+    요청 중 쓰기가 있었으면 응답에 REPLICA_STICKY_SECONDS 동안 유효한 쿠키를 붙임
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = _RoutingState(pinned=_has_primary_cookie(scope))
+        token = _current_state.set(state)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and state.wrote and settings.REPLICA_STICKY_SECONDS > 0:
+                cookie = (
+                    f"{PRIMARY_COOKIE}=1; Max-Age={settings.REPLICA_STICKY_SECONDS}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", cookie.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_state.reset(token)
+
+
+def _has_primary_cookie(scope) -> bool:
+    for name, value in scope.get("headers", []):
+        if name == b"cookie":
+            cookie = SimpleCookie()
+            try:
+                cookie.load(value.decode("latin-1"))
+            except Exception:
+                continue
+            if PRIMARY_COOKIE in cookie:
+                return True
+    return False
@@ -1,9 +1,8 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
-
-# 데이터베이스 엔진 생성
-engine = create_engine(settings.DATABASE_URL)
-
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 엔진 / 세션 팩토리는 app.db.base 에 하나만 두고 여기서는 다시 내보내기만 함 (연결 풀 공유)
+from app.db.base import (  # noqa: F401
+    AsyncSessionLocal,
+    SessionLocal,
+    create_db_engine,
+    engine,
+    get_async_engine,
+)
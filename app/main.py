@@ -1,14 +1,30 @@
+import time
+
+# 워커 시작 시간 측정 (이 모듈이 불러오는 패키지 import 포함)
+_IMPORT_STARTED = time.perf_counter()
+
 import logging
 import traceback
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 
 from app.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.db.base import get_db
-from app.db.init_db import init_db
+from app.core.metrics import registry
+from app.core.query_stats import QueryStatsMiddleware, install_query_hooks
+from app.core.serialization import FastJSONResponse
+from app.core.timing import ServerTimingMiddleware, StageTimer
+from app.db.init_db import init_schema
+from app.db.routing import ReplicaStickinessMiddleware, replica_router
+from app.services.ai import ai_service
+from app.services.token_revocation import token_revocation
+from app.services.trending import trending
+from app.services.unique_viewers import unique_viewer_tracker
+from app.services.view_count import view_counter
 
 # 더 자세한 로깅 설정
 logging.basicConfig(
@@ -20,7 +36,9 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="게시판 API",
     description="로그인, 회원가입, 게시판 기능을 제공하는 API",
-    version="0.1.0"
+    version="0.1.0",
+    # 응답 모델 검증 후 JSON 렌더링도 orjson 사용 (설치되어 있을 때)
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 미들웨어 설정
@@ -30,8 +48,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing", "X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Slowest-Ms"],
 )
 
+# 요청별 구간 시간 측정 (Server-Timing 헤더)
+app.add_middleware(ServerTimingMiddleware)
+
+# 요청별 SQL 실행 통계 (라우트별 메트릭, 느린 쿼리 로그)
+if settings.QUERY_STATS_ENABLED:
+    install_query_hooks()
+    app.add_middleware(QueryStatsMiddleware)
+
+# 읽기 복제본 사용 시 쓰기 직후 요청은 프라이머리에서 읽도록 고정 (쿠키)
+if settings.DATABASE_REPLICA_URLS:
+    app.add_middleware(ReplicaStickinessMiddleware)
+
+# 응답 압축 (가장 바깥에서 최종 본문을 압축)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -39,10 +74,57 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 async def root():
     return {"message": "게시판 API 서버에 오신 것을 환영합니다."}
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    """Prometheus 텍스트 포맷 메트릭"""
+    return registry.render()
+
+STARTUP_SECONDS = registry.gauge(
+    "app_startup_seconds",
+    "워커 시작 구간별 소요 시간(초) (imports, db_init, model_load, total)",
+    labelnames=("stage",),
+)
+
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
 @app.on_event("startup")
 def on_startup():
     logger.info("애플리케이션 시작...")
-    # 데이터베이스 초기화
-    db = next(get_db())
-    init_db(db)
-    logger.info("데이터베이스가 초기화되었습니다.") 
\ No newline at end of file
+    timer = StageTimer()
+    started = time.perf_counter()
+    # 스키마 확인 (관리자 계정은 python -m app.db.init_db 로 한 번만 생성)
+    with timer.stage("db_init"):
+        schema = init_schema(settings.DB_SCHEMA_STARTUP)
+    logger.info(f"데이터베이스 스키마: {schema}")
+    if settings.AI_MODEL_PRELOAD:
+        with timer.stage("model_load"):
+            ai_service.load_model()
+
+    # 조회수 배치 반영 스레드 시작
+    if settings.VIEW_COUNT_BUFFERED:
+        view_counter.start()
+    if settings.UNIQUE_VIEWERS_ENABLED:
+        unique_viewer_tracker.start()
+    if settings.TRENDING_ENABLED:
+        trending.start()
+    if settings.TOKEN_REVOCATION_ENABLED:
+        token_revocation.start()
+    # 복제본 상태 확인 (설정된 복제본이 없으면 아무것도 하지 않음)
+    replica_router.start()
+
+    # 시작 시간 기록 (total 은 import 부터 백그라운드 작업 시작까지)
+    stages = {"imports": _IMPORT_SECONDS}
+    stages.update({stage: ms / 1000 for stage, ms in timer.as_dict().items()})
+    stages["total"] = _IMPORT_SECONDS + time.perf_counter() - started
+    for stage, seconds in stages.items():
+        STARTUP_SECONDS.set(seconds, stage=stage)
+    logger.info("시작 완료: " + ", ".join(f"{stage} {seconds:.2f}초" for stage, seconds in stages.items()))
+
+@app.on_event("shutdown")
+def on_shutdown():
+    # 남은 조회수 / 순방문자 스케치 반영, 인기 게시글 스냅샷 저장
+    view_counter.stop()
+    unique_viewer_tracker.stop()
+    trending.stop()
+    token_revocation.stop()
+    replica_router.stop() 
\ No newline at end of file
@@ -1,3 +1,5 @@
 from app.models.user import User
 from app.models.post import Post
 from app.models.comment import Comment
+from app.models.view_sketch import PostViewerSketch, PostDailyViewerSketch
+from app.models.revoked_token import RevokedToken
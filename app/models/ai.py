@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
 from app.db.base import Base
 from datetime import datetime
@@ -31,3 +32,27 @@ class ColumnEmbedding(Base):
     
     # 관계
     column_description = relationship("ColumnDescription", back_populates="embeddings")
+
+
+class PostEmbedding(Base):
+    """게시글 임베딩 테이블 (의미 기반 검색용)"""
+    __tablename__ = "post_embeddings"
+    __table_args__ = (
+        # 코사인 거리 근사 최근접 이웃(ANN) 검색
+        Index(
+            "ix_post_embeddings_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    # 검색 필터용으로 게시글 값을 복사 (조인 없이 ANN 스캔 중에 바로 거름)
+    user_id = Column(Integer, nullable=False, index=True)
+    post_created_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    embedding = Column(Vector(384), nullable=False)
+    # 임베딩을 만든 제목+본문 해시 (내용이 같으면 다시 계산하지 않음)
+    content_hash = Column(String(64), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,18 +1,27 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 게시글별 댓글 목록 (post_id 필터 + 최신순 정렬)
+        Index("ix_comments_post_id_created_at_id", "post_id", "created_at", "id"),
+        Index("ix_comments_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 전문 검색 벡터 (app.core.search 토큰화, 서비스에서 갱신) - 일반 조회에서는 로드하지 않음
+    # 트리거가 없으므로 서비스를 거치지 않고 추가한 행은 NULL (검색되지 않음)
+    search_vector = deferred(Column(TSVECTOR))
 
     # 관계 설정
     author = relationship("User", backref="comments")
@@ -1,19 +1,32 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 목록 정렬 (offset / keyset 페이지네이션 모두 id 를 보조 정렬 키로 사용)
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_view_count_id", "view_count", "id"),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     view_count = Column(Integer, default=0)
+    # 댓글 추가/삭제 시 같은 트랜잭션에서 갱신 (목록에서 GROUP BY 없이 사용)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_commented_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 전문 검색 벡터 (app.core.search 토큰화, 서비스에서 갱신) - 일반 조회에서는 로드하지 않음
+    # 트리거가 없으므로 서비스를 거치지 않고 추가한 행은 NULL (검색되지 않음)
+    search_vector = deferred(Column(TSVECTOR))
 
     # 관계 설정
     author = relationship("User", backref="posts")
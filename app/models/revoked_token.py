@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+class RevokedToken(Base):
+    """만료 전에 폐기한 액세스 토큰 (jti), 만료 시각이 지나면 삭제 가능"""
+    __tablename__ = "revoked_tokens"
+
+    # 워커가 마지막으로 읽은 id 이후만 가져가도록 증가하는 id 사용
+    id = Column(Integer, primary_key=True)
+    jti = Column(String(64), unique=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now())
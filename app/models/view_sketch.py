@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+class PostViewerSketch(Base):
+    """게시글 전체 기간 순방문자 HyperLogLog 스케치"""
+    __tablename__ = "post_viewer_sketches"
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    registers = Column(LargeBinary, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class PostDailyViewerSketch(Base):
+    """게시글 일별 순방문자 HyperLogLog 스케치"""
+    __tablename__ = "post_daily_viewer_sketches"
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    registers = Column(LargeBinary, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,3 +1,4 @@
 from app.schemas.user import User, UserCreate, UserUpdate, UserLogin, Token, TokenPayload
-from app.schemas.post import Post, PostCreate, PostUpdate, PostDetail, PostPagination
-from app.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentDetail
+from app.schemas.post import Post, PostCreate, PostUpdate, PostDetail, PostListItem, PostPagination, PostCursorPage, PostUniqueViewers, TrendingPost, SemanticSearchPost
+from app.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentDetail, CommentCursorPage, PostCommentsPreview
+from app.schemas.search import PostSearchHit, CommentSearchHit, PostSearchPage, CommentSearchPage
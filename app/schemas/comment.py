@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -32,4 +32,16 @@ class CommentDetail(Comment):
     author: User
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+# 커서 페이지네이션을 위한 응답
+class CommentCursorPage(BaseModel):
+    items: List[CommentDetail]
+    size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+# 게시글별 최근 댓글 미리보기
+class PostCommentsPreview(BaseModel):
+    post_id: int
+    comments: List[CommentDetail]
@@ -23,6 +23,8 @@ class Post(PostBase):
     id: int
     user_id: int
     view_count: int
+    comment_count: int = 0
+    last_commented_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -32,14 +34,48 @@ class Post(PostBase):
 # 상세 정보를 포함한 게시글 (작성자 정보 포함)
 class PostDetail(Post):
     author: User
+    unique_viewers: Optional[int] = None  # 순방문자 추정값 (HyperLogLog)
 
     class Config:
         orm_mode = True
 
+# 목록 항목 (?fields= 로 고른 필드만 채워지고, 채우지 않은 필드는 응답에서 빠짐)
+class PostListItem(BaseModel):
+    id: Optional[int] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    user_id: Optional[int] = None
+    view_count: Optional[int] = None
+    comment_count: Optional[int] = None
+    last_commented_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    excerpt: Optional[str] = None  # ?excerpt=N 지정 시 본문 앞 N글자
+
 # 페이지네이션을 위한 응답
 class PostPagination(BaseModel):
     total: int
-    items: List[Post]
+    total_exact: bool = True  # False 면 캐시 또는 통계 기반 추정값
+    items: List[PostListItem]
     page: int
     size: int
-    pages: int 
\ No newline at end of file
+    pages: int 
+
+# 커서 페이지네이션을 위한 응답
+class PostCursorPage(BaseModel):
+    items: List[PostListItem]
+    size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+# 순방문자 순위 응답
+class PostUniqueViewers(Post):
+    unique_viewers: int
+
+# 인기 게시글 응답
+class TrendingPost(Post):
+    score: float
+
+# 의미 기반 검색 결과 (similarity: 코사인 유사도)
+class SemanticSearchPost(Post):
+    similarity: float
\ No newline at end of file
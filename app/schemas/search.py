@@ -0,0 +1,29 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+from app.schemas.post import Post
+from app.schemas.comment import Comment
+
+# 게시글 검색 결과 (title_highlight / snippet 은 HTML 이스케이프 후 일치 부분을 <mark> 로 감싼 문자열)
+class PostSearchHit(Post):
+    rank: float
+    title_highlight: str
+    snippet: str
+
+# 댓글 검색 결과
+class CommentSearchHit(Comment):
+    rank: float
+    snippet: str
+
+# 커서 기반 검색 결과 페이지
+class PostSearchPage(BaseModel):
+    items: List[PostSearchHit]
+    size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class CommentSearchPage(BaseModel):
+    items: List[CommentSearchHit]
+    size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
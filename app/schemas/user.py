@@ -48,4 +48,6 @@ class Token(BaseModel):
 
 # 토큰 페이로드
 class TokenPayload(BaseModel):
-    sub: Optional[int] = None 
\ No newline at end of file
+    sub: Optional[int] = None
+    exp: Optional[int] = None
+    jti: Optional[str] = None 
\ No newline at end of file
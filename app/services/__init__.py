@@ -1 +1 @@
-from app.services import user, post, comment
+from app.services import user, post, comment, search
@@ -3,24 +3,72 @@ AI 서비스 레이어
 임베딩 생성, 코사인 유사도 계산, 컬럼 후보 추출
 """
 
+import hashlib
+import threading
+import anyio
 import numpy as np
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 from sentence_transformers import SentenceTransformer
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.models.ai import ColumnDescription, ColumnEmbedding
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, text
+from app.models.ai import ColumnDescription, ColumnEmbedding, PostEmbedding
+from app.models.post import Post
+from app.db.routing import ReadSessionLocal
 from app.db.session import SessionLocal
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.timing import StageTimer
 import logging
 import traceback
 
 logger = logging.getLogger(__name__)
 
+# 컬럼 후보 추출 파이프라인 구간별 소요 시간
+AI_STAGE_SECONDS = registry.histogram(
+    "ai_pipeline_stage_seconds",
+    "컬럼 후보 추출 파이프라인 구간별 소요 시간(초)",
+    labelnames=("stage",),
+)
+
+# 게시글 의미 기반 검색 구간별 소요 시간
+SEMANTIC_SEARCH_STAGE_SECONDS = registry.histogram(
+    "semantic_search_stage_seconds",
+    "게시글 의미 기반 검색 구간별 소요 시간(초)",
+    labelnames=("stage",),
+)
+
+
+def post_embedding_text(title: str, content: str) -> str:
+    """게시글 임베딩 입력 텍스트 (모델 최대 길이를 넘는 뒷부분은 모델이 잘라냄)"""
+    return f"{title}\n{content}"
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
 
 class AIService:
     def __init__(self):
-        # 임베딩 모델 로드 (로컬에서 실행)
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        # 임베딩 모델은 import 시점이 아니라 처음 사용할 때 (또는 앱 시작 시 load_model) 로드
+        self._model: Optional[SentenceTransformer] = None
+        self._model_lock = threading.Lock()
+        self._backfill_lock = threading.Lock()  # 백필은 한 번에 하나만
         self.embedding_dim = 384  # all-MiniLM-L6-v2 차원
+
+    @property
+    def model(self) -> SentenceTransformer:
+        if self._model is None:
+            self.load_model()
+        return self._model
+
+    def load_model(self) -> None:
+        """임베딩 모델 로드 (로컬에서 실행, 이미 로드했으면 무시)"""
+        with self._model_lock:
+            if self._model is None:
+                self._model = SentenceTransformer('all-MiniLM-L6-v2')
     
     def generate_embedding(self, text: str) -> List[float]:
         """텍스트를 임베딩으로 변환"""
@@ -53,62 +101,78 @@ class AIService:
             return 0.0
     
     def get_column_candidates(self, user_input: str, top_k: int = 5) -> Dict[str, Any]:
-        """사용자 입력에 대한 컬럼 후보 추출"""
-        db = SessionLocal()
+        """
+        사용자 입력에 대한 컬럼 후보 추출
+
+        구간(encode, db_fetch, relationship_load, scoring, rank)별 소요 시간을 측정해
+        결과의 "timings"(밀리초)와 ai_pipeline_stage_seconds 메트릭에 기록
+        """
+        db = ReadSessionLocal()  # 컬럼 카탈로그 조회만 하므로 복제본 사용
+        timer = StageTimer(AI_STAGE_SECONDS)
         try:
             logger.info(f"컬럼 후보 추출 시작 - 입력: {user_input}, top_k: {top_k}")
             
             # 사용자 입력을 임베딩으로 변환
-            logger.info("사용자 입력 임베딩 생성 시작")
-            user_embedding = self.generate_embedding(user_input)
-            logger.info(f"사용자 임베딩 생성 완료 - 차원: {len(user_embedding)}")
+            with timer.stage("encode"):
+                user_embedding = self.generate_embedding(user_input)
+            logger.debug(f"사용자 임베딩 생성 완료 - 차원: {len(user_embedding)}")
             
-            # 모든 컬럼 임베딩 조회
-            logger.info("컬럼 임베딩 조회 시작")
-            embeddings = db.query(ColumnEmbedding).all()
-            logger.info(f"조회된 임베딩 개수: {len(embeddings)}")
+            # 모든 컬럼 임베딩 조회 (컬럼 설명은 JOIN 으로 함께 로드)
+            with timer.stage("db_fetch"):
+                embeddings = (
+                    db.query(ColumnEmbedding)
+                    .options(joinedload(ColumnEmbedding.column_description, innerjoin=True))
+                    .all()
+                )
+            logger.debug(f"조회된 임베딩 개수: {len(embeddings)}")
             
             if not embeddings:
                 logger.warning("임베딩이 없습니다")
                 return {
                     "candidates": [], 
                     "message": "임베딩이 생성되지 않았습니다. 먼저 임베딩을 생성해주세요.",
-                    "input": user_input
+                    "input": user_input,
+                    "timings": timer.as_dict(),
                 }
             
+            # 컬럼 설명 관계 (db_fetch 에서 이미 로드되어 추가 쿼리 없음)
+            with timer.stage("relationship_load"):
+                descriptions = [embedding.column_description for embedding in embeddings]
+            
             # 유사도 계산
-            logger.info("유사도 계산 시작")
             similarities = []
-            for embedding in embeddings:
-                similarity = self.calculate_cosine_similarity(user_embedding, embedding.embedding)
-                similarities.append({
-                    "column_id": embedding.column_id,
-                    "table_name": embedding.column_description.table_name,
-                    "column_name": embedding.column_description.column_name,
-                    "description": embedding.column_description.description,
-                    "similarity": similarity
-                })
-            
-            # 유사도 순으로 정렬
-            similarities.sort(key=lambda x: x["similarity"], reverse=True)
-            logger.info(f"유사도 계산 완료 - 총 {len(similarities)}개")
-            
-            # 상위 k개 선택
-            top_candidates = similarities[:top_k]
-            logger.info(f"상위 {top_k}개 후보 선택 완료")
+            with timer.stage("scoring"):
+                for embedding, description in zip(embeddings, descriptions):
+                    similarity = self.calculate_cosine_similarity(user_embedding, embedding.embedding)
+                    similarities.append({
+                        "column_id": embedding.column_id,
+                        "table_name": description.table_name,
+                        "column_name": description.column_name,
+                        "description": description.description,
+                        "similarity": similarity
+                    })
+            
+            # 유사도 순으로 정렬 후 상위 k개 선택
+            with timer.stage("rank"):
+                similarities.sort(key=lambda x: x["similarity"], reverse=True)
+                top_candidates = similarities[:top_k]
             
             result = {
                 "candidates": [candidate["column_name"] for candidate in top_candidates],
                 "details": top_candidates,
-                "input": user_input
+                "input": user_input,
+                "timings": timer.as_dict(),
             }
-            logger.info(f"최종 결과: {result}")
+            logger.info(
+                f"컬럼 후보 추출 완료 - 후보 {len(similarities)}개 중 {len(top_candidates)}개, "
+                f"구간별 소요(ms): {result['timings']}"
+            )
             return result
             
         except Exception as e:
             logger.error(f"컬럼 후보 추출 실패: {e}")
             logger.error(f"스택 트레이스: {traceback.format_exc()}")
-            return {"candidates": [], "error": str(e), "input": user_input}
+            return {"candidates": [], "error": str(e), "input": user_input, "timings": timer.as_dict()}
         finally:
             db.close()
     
@@ -161,5 +225,252 @@ class AIService:
             db.close()
 
 
+    def _upsert_post_embedding(self, db: Session, post: Post, embedding: List[float], digest: str) -> None:
+        values = {
+            "post_id": post.id,
+            "user_id": post.user_id,
+            "post_created_at": post.created_at,
+            "embedding": embedding,
+            "content_hash": digest,
+        }
+        stmt = insert(PostEmbedding).values(**values)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PostEmbedding.post_id],
+                set_={
+                    "embedding": stmt.excluded.embedding,
+                    "content_hash": stmt.excluded.content_hash,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def index_post(self, post_id: int, db: Optional[Session] = None) -> bool:
+        """
+        게시글 임베딩 생성/갱신
+
+        요청 처리 중이 아니라 응답 후 BackgroundTasks 에서 실행되므로 기본적으로 자체 세션을 사용
+        제목/본문이 마지막으로 임베딩한 내용과 같으면 다시 계산하지 않음
+
+        Returns:
+            임베딩을 새로 저장했는지 여부
+        """
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            post = db.query(Post).filter(Post.id == post_id).first()
+            if post is None:
+                return False
+            post_text = post_embedding_text(post.title, post.content)
+            digest = content_hash(post_text)
+            current = (
+                db.query(PostEmbedding.content_hash)
+                .filter(PostEmbedding.post_id == post_id)
+                .scalar()
+            )
+            if current == digest:
+                return False
+
+            embedding = self.generate_embedding(post_text)
+            if not any(embedding):
+                # 임베딩 생성 실패 (영벡터는 코사인 거리를 계산할 수 없음)
+                return False
+            self._upsert_post_embedding(db, post, embedding, digest)
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"게시글 {post_id} 임베딩 생성 실패: {e}")
+            return False
+        finally:
+            if own_session:
+                db.close()
+
+    def start_post_backfill(self, batch_size: int = 256) -> bool:
+        """
+        index_missing_posts 를 백그라운드 스레드에서 시작
+
+        Returns:
+            시작했으면 True, 이미 진행 중이면 False
+        """
+        if not self._backfill_lock.acquire(blocking=False):
+            return False
+
+        def run() -> None:
+            try:
+                result = self.index_missing_posts(batch_size=batch_size)
+                if "error" not in result:
+                    logger.info(result["message"])
+            finally:
+                self._backfill_lock.release()
+
+        threading.Thread(target=run, name="post-embedding-backfill", daemon=True).start()
+        return True
+
+    def count_missing_posts(self, db: Session) -> int:
+        """임베딩이 없는 게시글 수"""
+        return (
+            db.query(func.count(Post.id))
+            .outerjoin(PostEmbedding, PostEmbedding.post_id == Post.id)
+            .filter(PostEmbedding.post_id.is_(None))
+            .scalar()
+        )
+
+    def index_missing_posts(self, batch_size: int = 256) -> Dict[str, Any]:
+        """임베딩이 없는 게시글을 batch_size 개씩 묶어 임베딩 생성 (기존 게시글 백필용)"""
+        db = SessionLocal()
+        created_count = 0
+        try:
+            while True:
+                posts = (
+                    db.query(Post)
+                    .outerjoin(PostEmbedding, PostEmbedding.post_id == Post.id)
+                    .filter(PostEmbedding.post_id.is_(None))
+                    .order_by(Post.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not posts:
+                    break
+                texts = [post_embedding_text(post.title, post.content) for post in posts]
+                # 한 번에 인코딩하는 편이 건별 호출보다 훨씬 빠름
+                embeddings = self.model.encode(texts, batch_size=batch_size, convert_to_tensor=False)
+                for post, post_text, embedding in zip(posts, texts, embeddings):
+                    self._upsert_post_embedding(db, post, embedding.tolist(), content_hash(post_text))
+                db.commit()
+                created_count += len(posts)
+
+            return {
+                "message": f"{created_count}개의 게시글 임베딩이 생성되었습니다.",
+                "count": created_count,
+            }
+        except Exception as e:
+            db.rollback()
+            logger.error(f"게시글 임베딩 백필 실패: {e}")
+            return {"error": str(e), "count": created_count}
+        finally:
+            db.close()
+
+    def _configure_ann_search(self, db: Session) -> None:
+        """현재 트랜잭션에만 적용되는 HNSW 검색 옵션"""
+        db.execute(
+            text("SELECT set_config('hnsw.ef_search', :value, true)"),
+            {"value": str(settings.SEMANTIC_SEARCH_EF_SEARCH)},
+        )
+        if settings.SEMANTIC_SEARCH_ITERATIVE_SCAN:
+            db.execute(
+                text("SELECT set_config('hnsw.iterative_scan', :value, true)"),
+                {"value": settings.SEMANTIC_SEARCH_ITERATIVE_SCAN},
+            )
+
+    def _nearest_posts(
+        self,
+        db: Session,
+        embedding: List[float],
+        limit: int,
+        timer: StageTimer,
+        author_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        exclude_post_id: Optional[int] = None,
+    ) -> List[Tuple[Post, float]]:
+        with timer.stage("ann"):
+            self._configure_ann_search(db)
+            distance = PostEmbedding.embedding.cosine_distance(embedding)
+            query = db.query(PostEmbedding.post_id, distance.label("distance"))
+            if author_id is not None:
+                query = query.filter(PostEmbedding.user_id == author_id)
+            if since is not None:
+                query = query.filter(PostEmbedding.post_created_at >= since)
+            if exclude_post_id is not None:
+                query = query.filter(PostEmbedding.post_id != exclude_post_id)
+            # ORDER BY 거리 LIMIT k 형태여야 HNSW 인덱스를 사용함
+            nearest = query.order_by(distance).limit(limit).all()
+
+        if not nearest:
+            return []
+        with timer.stage("fetch"):
+            posts = {
+                post.id: post
+                for post in db.query(Post).filter(Post.id.in_([post_id for post_id, _ in nearest]))
+            }
+        return [
+            (posts[post_id], 1.0 - float(distance_value))
+            for post_id, distance_value in nearest
+            if post_id in posts
+        ]
+
+    def search_posts(
+        self,
+        db: Session,
+        query_text: str,
+        limit: int = 10,
+        author_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> List[Tuple[Post, float]]:
+        """
+        의미 기반 게시글 검색
+
+        Returns:
+            (게시글, 코사인 유사도) 목록 (유사한 순)
+        """
+        timer = StageTimer(SEMANTIC_SEARCH_STAGE_SECONDS)
+        with timer.stage("encode"):
+            embedding = self.generate_embedding(query_text)
+        return self._nearest_posts(db, embedding, limit, timer, author_id=author_id, since=since)
+
+    async def search_posts_async(
+        self,
+        adb: AsyncSession,
+        query_text: str,
+        limit: int = 10,
+        author_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> List[Tuple[Post, float]]:
+        """search_posts 의 비동기 버전 (모델 인코딩은 스레드, 검색 쿼리는 asyncpg 연결에서 실행)"""
+        timer = StageTimer(SEMANTIC_SEARCH_STAGE_SECONDS)
+        with timer.stage("encode"):
+            embedding = await anyio.to_thread.run_sync(self.generate_embedding, query_text)
+        return await adb.run_sync(
+            self._nearest_posts, embedding, limit, timer, author_id=author_id, since=since
+        )
+
+    def similar_posts(
+        self,
+        db: Session,
+        post_id: int,
+        limit: int = 10,
+        author_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> List[Tuple[Post, float]]:
+        """
+        저장된 임베딩 기준으로 비슷한 게시글 (모델 인코딩 없음, 아직 임베딩이 없으면 빈 목록)
+        """
+        timer = StageTimer(SEMANTIC_SEARCH_STAGE_SECONDS)
+        embedding = (
+            db.query(PostEmbedding.embedding)
+            .filter(PostEmbedding.post_id == post_id)
+            .scalar()
+        )
+        if embedding is None:
+            return []
+        return self._nearest_posts(
+            db, embedding, limit, timer,
+            author_id=author_id, since=since, exclude_post_id=post_id,
+        )
+
+    async def similar_posts_async(
+        self,
+        adb: AsyncSession,
+        post_id: int,
+        limit: int = 10,
+        author_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> List[Tuple[Post, float]]:
+        """similar_posts 의 비동기 버전"""
+        return await adb.run_sync(
+            self.similar_posts, post_id, limit=limit, author_id=author_id, since=since
+        )
+
+
 # 전역 인스턴스
 ai_service = AIService()
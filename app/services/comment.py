@@ -1,21 +1,143 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy import Integer, column, desc, func, select, true, update, values
 
 from app import models, schemas
+from app.core.config import settings
+from app.core.pagination import paginate_keyset, parse_datetime
+from app.core.search import comment_search_vector
+from app.services.post import invalidate_post_cache
+from app.services.trending import trending
 
 def get_comments_by_post(
     db: Session, post_id: int, skip: int = 0, limit: int = 100
 ) -> List[models.Comment]:
+    """
+    CommentDetail 응답용 댓글 목록
+
+    작성자는 다대일이라 JOIN 으로 함께 로드하고, 그 밖의 관계는 지연 로딩 대신 예외를 내서
+    행마다 쿼리가 추가되는 경우(N+1)를 바로 드러냄
+    """
     return (
         db.query(models.Comment)
+        .options(joinedload(models.Comment.author, innerjoin=True), raiseload("*"))
+        .filter(models.Comment.post_id == post_id)
+        .order_by(desc(models.Comment.created_at), desc(models.Comment.id))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+# CommentDetail 응답 필드 (스키마에서 가져와 응답 모델과 항상 같은 필드만 SELECT)
+COMMENT_FIELDS = tuple(schemas.Comment.model_fields)
+AUTHOR_FIELDS = tuple(schemas.User.model_fields)
+
+def get_comment_details_by_post(
+    db: Session, post_id: int, skip: int = 0, limit: int = 100
+) -> List[Dict[str, Any]]:
+    """
+    CommentDetail 형태의 dict 목록 (get_comments_by_post 와 같은 순서)
+
+    응답에 들어갈 컬럼만 튜플로 조회해서 바로 dict 로 옮기므로
+    ORM 객체 생성과 항목별 스키마 검증을 하지 않음 (비밀번호 해시 등은 SELECT 하지 않음)
+    """
+    author_columns = [getattr(models.User, name).label(f"author_{name}") for name in AUTHOR_FIELDS]
+    rows = (
+        db.query(*(getattr(models.Comment, name) for name in COMMENT_FIELDS), *author_columns)
+        .join(models.User, models.User.id == models.Comment.user_id)
         .filter(models.Comment.post_id == post_id)
-        .order_by(desc(models.Comment.created_at))
+        .order_by(desc(models.Comment.created_at), desc(models.Comment.id))
         .offset(skip)
         .limit(limit)
         .all()
     )
+    return [
+        {
+            **{name: row._mapping[name] for name in COMMENT_FIELDS},
+            "author": {name: row._mapping[f"author_{name}"] for name in AUTHOR_FIELDS},
+        }
+        for row in rows
+    ]
+
+async def get_comment_details_by_post_async(
+    adb: AsyncSession, post_id: int, skip: int = 0, limit: int = 100
+) -> List[Dict[str, Any]]:
+    """get_comment_details_by_post 의 비동기 버전"""
+    return await adb.run_sync(get_comment_details_by_post, post_id, skip, limit)
+
+def get_comments_by_post_keyset(
+    db: Session,
+    post_id: int,
+    size: int = 20,
+    order_desc: bool = True,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    게시글 댓글 목록 (created_at, id) 커서 페이지네이션
+
+    Raises:
+        ValueError: 잘못되었거나 다른 게시글/정렬로 만들어진 커서
+    """
+    comments, next_cursor, prev_cursor = paginate_keyset(
+        db.query(models.Comment)
+        .options(joinedload(models.Comment.author, innerjoin=True), raiseload("*"))
+        .filter(models.Comment.post_id == post_id),
+        sort_column=models.Comment.created_at,
+        id_column=models.Comment.id,
+        size=size,
+        order_desc=order_desc,
+        cursor=cursor,
+        tag=f"comments:{post_id}:{'desc' if order_desc else 'asc'}",
+        value_parser=parse_datetime,
+    )
+    return {
+        "items": comments,
+        "size": size,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+    }
+
+def get_latest_comments_by_posts(
+    db: Session, post_ids: List[int], per_post: int = 3
+) -> Dict[int, List[models.Comment]]:
+    """
+    여러 게시글의 최근 댓글을 게시글별 per_post 개씩 한 번의 쿼리로 조회
+
+    게시글 id 목록을 VALUES 로 펼치고 게시글마다 LATERAL 서브쿼리로
+    (post_id, created_at, id) 인덱스를 역순으로 per_post 개만 읽음 (정렬 없이 인덱스 순서 사용)
+    게시글 목록 화면에서 게시글마다 요청하지 않도록 한 번에 조회
+
+    Returns:
+        post_id → 최근 댓글 목록 (최신순, 댓글이 없는 게시글은 빈 목록)
+    """
+    result: Dict[int, List[models.Comment]] = {post_id: [] for post_id in post_ids}
+    if not post_ids:
+        return result
+
+    ids = values(column("post_id", Integer), name="requested_posts").data(
+        [(post_id,) for post_id in result]
+    )
+    latest = (
+        select(models.Comment.id.label("comment_id"))
+        .where(models.Comment.post_id == ids.c.post_id)
+        .order_by(desc(models.Comment.created_at), desc(models.Comment.id))
+        .limit(per_post)
+        .correlate(ids)
+        .lateral("latest_comments")
+    )
+    comments = (
+        db.query(models.Comment)
+        .select_from(ids)
+        .join(latest, true())
+        .join(models.Comment, models.Comment.id == latest.c.comment_id)
+        .options(joinedload(models.Comment.author, innerjoin=True), raiseload("*"))
+        .all()
+    )
+    for comment in sorted(comments, key=lambda c: (c.created_at, c.id), reverse=True):
+        result[comment.post_id].append(comment)
+    return result
 
 def get_comment(db: Session, comment_id: int) -> Optional[models.Comment]:
     return db.query(models.Comment).filter(models.Comment.id == comment_id).first()
@@ -27,10 +149,27 @@ def create_comment(
         content=obj_in.content,
         post_id=obj_in.post_id,
         user_id=user_id,
+        search_vector=comment_search_vector(obj_in.content),
     )
     db.add(db_obj)
+    # 댓글 추가와 같은 트랜잭션에서 게시글 댓글 수 / 마지막 댓글 시각 갱신
+    # (now() 는 트랜잭션 시작 시각이라 댓글 created_at 과 같음)
+    db.execute(
+        update(models.Post)
+        .where(models.Post.id == obj_in.post_id)
+        .values(
+            comment_count=models.Post.comment_count + 1,
+            last_commented_at=func.now(),
+            # 댓글 변경은 게시글 수정이 아니므로 updated_at (onupdate) 은 그대로 둠
+            updated_at=models.Post.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
     db.refresh(db_obj)
+    invalidate_post_cache(db_obj.post_id)
+    if settings.TRENDING_ENABLED:
+        trending.record_comment(db_obj.post_id)
     return db_obj
 
 def update_comment(
@@ -40,6 +179,8 @@ def update_comment(
     
     for field, value in update_data.items():
         setattr(db_obj, field, value)
+    if "content" in update_data:
+        db_obj.search_vector = comment_search_vector(db_obj.content)
         
     db.add(db_obj)
     db.commit()
@@ -48,5 +189,24 @@ def update_comment(
 
 def delete_comment(db: Session, db_obj: models.Comment) -> models.Comment:
     db.delete(db_obj)
+    db.flush()
+    # 남은 댓글 기준으로 마지막 댓글 시각 재계산 (post_id, created_at 인덱스로 한 행만 읽음)
+    last_commented_at = (
+        select(func.max(models.Comment.created_at))
+        .where(models.Comment.post_id == db_obj.post_id)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(models.Post)
+        .where(models.Post.id == db_obj.post_id)
+        .values(
+            comment_count=func.greatest(models.Post.comment_count - 1, 0),
+            last_commented_at=last_commented_at,
+            # 댓글 변경은 게시글 수정이 아니므로 updated_at (onupdate) 은 그대로 둠
+            updated_at=models.Post.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
+    invalidate_post_cache(db_obj.post_id)
     return db_obj 
\ No newline at end of file
@@ -1,49 +1,256 @@
-from typing import Dict, List, Optional, Any
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, desc, text, update
 
 from app import models, schemas
+from app.core.cache import ObjectCache, TTLCache, load_cache_backend
+from app.core.conditional import make_etag
+from app.core.config import settings
+from app.core.pagination import paginate_keyset, parse_datetime
+from app.core.serialization import dumps, loads
+from app.core.search import post_search_vector
+from app.db.routing import must_use_primary, read_only_from_primary
+from app.services.trending import trending
+from app.services.unique_viewers import unique_viewer_tracker
+from app.services.view_count import view_counter
 
-def get_posts(
-    db: Session, 
-    skip: int = 0, 
-    limit: int = 10,
-    order_by: str = "created_at",
-    order_desc: bool = True
-) -> List[models.Post]:
-    query = db.query(models.Post)
-    
-    # 정렬
-    if order_by == "created_at":
-        order_col = models.Post.created_at
-    elif order_by == "view_count":
+# 전체 개수 계산 방식
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED)
+
+# 게시글 전체 개수 캐시 (create_post / delete_post 시 무효화)
+_count_cache = TTLCache(default_ttl=settings.POST_COUNT_CACHE_TTL_SECONDS, max_entries=1)
+
+# 게시글 상세(PostDetail) / 첫 페이지 목록 캐시 (직렬화된 JSON 저장)
+# 상세는 게시글별 키를 지우고, 목록은 버전을 올려 한 번에 무효화
+post_cache = ObjectCache(
+    "posts",
+    backend=load_cache_backend(settings.POST_CACHE_BACKEND, max_entries=settings.POST_CACHE_MAX_ENTRIES),
+    default_ttl=settings.POST_DETAIL_CACHE_TTL_SECONDS,
+)
+LIST_CACHE_VERSION = "posts:list"
+
+# keyset 페이지네이션이 가능한 정렬 기준 → (정렬 컬럼, 커서 값 변환 함수)
+KEYSET_ORDERS = {
+    "created_at": (models.Post.created_at, parse_datetime),
+    "view_count": (models.Post.view_count, int),
+}
+
+# 목록 응답에서 선택할 수 있는 필드 (?fields=id,title,...)
+LIST_FIELDS = (
+    "id", "title", "content", "user_id", "view_count",
+    "comment_count", "last_commented_at", "created_at", "updated_at",
+)
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    쉼표로 구분된 필드 목록 검증 (None 이면 전체 필드)
+
+    Raises:
+        ValueError: 목록 응답에 없는 필드
+    """
+    if fields is None:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in LIST_FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    # 순서 유지 + 중복 제거
+    return list(dict.fromkeys(names))
+
+def _list_rows_query(
+    db: Session,
+    fields: Optional[List[str]],
+    excerpt_length: Optional[int],
+    required: tuple = (),
+):
+    """
+    목록 응답용 튜플 쿼리 - 응답에 들어갈 컬럼만 SELECT 하고 ORM 객체는 만들지 않음
+    """
+    names = LIST_FIELDS
+    if fields is not None:
+        selected = {"id", *fields, *(column.key for column in required)}
+        names = [name for name in LIST_FIELDS if name in selected]
+    columns = [getattr(models.Post, name) for name in names]
+    if excerpt_length:
+        # 잘렸는지 알 수 있도록 한 글자 더 가져옴
+        columns.append(func.substr(models.Post.content, 1, excerpt_length + 1).label("excerpt"))
+    return db.query(*columns)
+
+def _order_list(query, order_by: str, order_desc: bool):
+    if order_by == "view_count":
         order_col = models.Post.view_count
     else:
         order_col = models.Post.created_at
     
+    # id 를 보조 정렬 키로 써서 같은 값끼리의 순서를 고정 (ix_posts_*_id 인덱스 순서와 일치)
     if order_desc:
-        query = query.order_by(desc(order_col))
-    else:
-        query = query.order_by(order_col)
-    
-    return query.offset(skip).limit(limit).all()
+        return query.order_by(desc(order_col), desc(models.Post.id))
+    return query.order_by(order_col, models.Post.id)
+
+def to_list_dict(
+    row: Any, fields: Optional[List[str]] = None, excerpt_length: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    요청한 필드만 담은 목록 항목 (담지 않은 필드는 응답에서 빠짐)
+
+    DB 값을 그대로 옮기므로 항목마다 PostListItem 검증을 하지 않음
+    """
+    values = {name: getattr(row, name) for name in (fields if fields is not None else LIST_FIELDS)}
+    if excerpt_length:
+        excerpt = row.excerpt or ""
+        values["excerpt"] = excerpt[:excerpt_length] + "…" if len(excerpt) > excerpt_length else excerpt
+    return values
 
 def get_post(db: Session, post_id: int) -> Optional[models.Post]:
     return db.query(models.Post).filter(models.Post.id == post_id).first()
 
+async def get_post_async(adb: AsyncSession, post_id: int) -> Optional[models.Post]:
+    return await adb.get(models.Post, post_id)
+
 def get_post_with_author(db: Session, post_id: int) -> Optional[models.Post]:
-    return db.query(models.Post).filter(models.Post.id == post_id).first()
+    """PostDetail 응답용 (작성자를 같은 쿼리에서 JOIN 으로 로드)"""
+    return (
+        db.query(models.Post)
+        .options(joinedload(models.Post.author, innerjoin=True))
+        .filter(models.Post.id == post_id)
+        .first()
+    )
+
+def _detail_cache_key(post_id: int) -> str:
+    return f"post:{post_id}"
+
+def get_post_detail(db: Session, post_id: int) -> Optional[schemas.PostDetail]:
+    """
+    PostDetail 응답 (캐시 우선)
+
+    캐시에는 DB에 저장된 값만 들어 있으므로 아직 반영되지 않은 조회수와 순방문자는 호출 측에서 덧붙임
+    """
+    def load() -> Optional[bytes]:
+        post = get_post_with_author(db, post_id)
+        if post is None:
+            return None
+        return schemas.PostDetail.model_validate(post, from_attributes=True).model_dump_json().encode("utf-8")
+
+    raw = (
+        post_cache.get_or_load(_detail_cache_key(post_id), load)
+        if settings.POST_CACHE_ENABLED
+        else load()
+    )
+    return schemas.PostDetail.model_validate_json(raw) if raw is not None else None
+
+def detail_validators(
+    detail: schemas.PostDetail, view_count: int, unique_viewers: Optional[int]
+) -> Tuple[str, datetime]:
+    """
+    상세 응답의 (ETag, Last-Modified)
+
+    응답 본문에 들어가는 값의 버전만으로 계산하므로 직렬화 전에 비교할 수 있음
+    (본문 / 제목 변경은 updated_at, 댓글 변경은 comment_count / last_commented_at,
+    작성자 변경은 작성자 updated_at 에 반영됨)
+    Last-Modified 는 조회수 변화를 반영하지 않음
+    """
+    etag = make_etag(
+        "post", detail.id, detail.updated_at, detail.comment_count, detail.last_commented_at,
+        detail.author.id, detail.author.updated_at, view_count, unique_viewers,
+    )
+    last_modified = max(
+        value for value in (detail.created_at, detail.updated_at, detail.last_commented_at) if value
+    )
+    return etag, last_modified
+
+def _list_cache_key(key_parts: Optional[tuple]) -> Optional[str]:
+    # 목록 버전이 바뀌면 이전 키는 더 이상 읽히지 않음
+    # 쓰기 직후(프라이머리 고정)에는 캐시를 읽지도 채우지도 않음 (방금 쓴 글이 보이도록)
+    if key_parts is None or not settings.POST_CACHE_ENABLED or must_use_primary():
+        return None
+    version = post_cache.version(LIST_CACHE_VERSION)
+    return f"{LIST_CACHE_VERSION}:v{version}:" + ":".join(str(part) for part in key_parts)
+
+def _with_list_items(page: Dict[str, Any]) -> Dict[str, Any]:
+    return {**page, "items": [schemas.PostListItem(**item) for item in page["items"]]}
+
+def _list_page(db: Session, key_parts: Optional[tuple], build, as_json: bool = False):
+    """
+    목록 페이지 (key_parts 가 있으면 캐시 우선)
+
+    build() 가 만든 dict 페이지를 응답 모델 검증 없이 dumps() 로 바로 직렬화
+    as_json 이면 응답 본문 JSON 바이트, 아니면 항목을 PostListItem 으로 바꾼 dict 반환
+    복제본에서 읽은 페이지는 지연으로 오래됐을 수 있으므로 캐시에 저장하지 않음
+    """
+    key = _list_cache_key(key_parts)
+    if key is None:
+        page = build()
+        if as_json:
+            return dumps(page)
+    else:
+        raw = post_cache.get_or_load(
+            key,
+            lambda: dumps(build()),
+            ttl=settings.POST_LIST_CACHE_TTL_SECONDS,
+            cacheable=lambda: read_only_from_primary(db),
+        )
+        if as_json:
+            return raw
+        page = loads(raw)
+    return _with_list_items(page)
+
+async def _list_page_async(adb: AsyncSession, key_parts: Optional[tuple], build, as_json: bool = False):
+    """_list_page 의 비동기 버전 (build 는 페이지 dict 를 돌려주는 코루틴 함수)"""
+    key = _list_cache_key(key_parts)
+    if key is None:
+        page = await build()
+        if as_json:
+            return dumps(page)
+    else:
+        async def load() -> bytes:
+            return dumps(await build())
+
+        raw = await post_cache.aget_or_load(
+            key,
+            load,
+            ttl=settings.POST_LIST_CACHE_TTL_SECONDS,
+            cacheable=lambda: read_only_from_primary(adb),
+        )
+        if as_json:
+            return raw
+        page = loads(raw)
+    return _with_list_items(page)
+
+def invalidate_post_cache(post_id: Optional[int] = None) -> None:
+    """
+    게시글 캐시 무효화 (post_id 를 주면 상세도 함께)
+
+    게시글 / 댓글을 쓰는 서비스 함수가 커밋한 뒤 호출
+    """
+    if post_id is not None:
+        post_cache.invalidate(_detail_cache_key(post_id))
+    post_cache.bump_version(LIST_CACHE_VERSION)
+
+def _on_views_flushed(counts: Dict[int, int]) -> None:
+    # 반영된 조회수가 대기분에서 빠졌으므로 캐시된 DB 값도 새로 읽어야 함
+    for post_id in counts:
+        post_cache.invalidate(_detail_cache_key(post_id))
+
+view_counter.add_flush_listener(_on_views_flushed)
 
 def create_post(db: Session, obj_in: schemas.PostCreate, user_id: int) -> models.Post:
     db_obj = models.Post(
         title=obj_in.title,
         content=obj_in.content,
         user_id=user_id,
+        search_vector=post_search_vector(obj_in.title, obj_in.content),
     )
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    invalidate_total_count()
+    invalidate_post_cache()
     return db_obj
 
 def update_post(
@@ -53,15 +260,21 @@ def update_post(
     
     for field, value in update_data.items():
         setattr(db_obj, field, value)
+    if "title" in update_data or "content" in update_data:
+        db_obj.search_vector = post_search_vector(db_obj.title, db_obj.content)
         
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    invalidate_post_cache(db_obj.id)
     return db_obj
 
 def delete_post(db: Session, db_obj: models.Post) -> models.Post:
     db.delete(db_obj)
     db.commit()
+    invalidate_total_count()
+    invalidate_post_cache(db_obj.id)
+    trending.remove(db_obj.id)
     return db_obj
 
 def increment_view_count(db: Session, db_obj: models.Post) -> models.Post:
@@ -69,34 +282,276 @@ def increment_view_count(db: Session, db_obj: models.Post) -> models.Post:
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    post_cache.invalidate(_detail_cache_key(db_obj.id))
     return db_obj
 
+def record_view(db: Session, db_obj: Union[models.Post, schemas.Post]) -> int:
+    """
+    조회수 1 증가 후 현재 조회수 반환
+
+    VIEW_COUNT_BUFFERED 설정 시 메모리 버퍼에만 기록하고 DB 행은 갱신하지 않음
+    db_obj 는 캐시에서 꺼낸 스키마 객체여도 됨 (id 와 view_count 만 사용)
+    """
+    if settings.TRENDING_ENABLED:
+        trending.record_view(db_obj.id)
+    if not settings.VIEW_COUNT_BUFFERED:
+        view_count = db.execute(
+            update(models.Post)
+            .where(models.Post.id == db_obj.id)
+            # 조회는 수정이 아니므로 updated_at (Last-Modified) 은 그대로 둠
+            .values(
+                view_count=func.coalesce(models.Post.view_count, 0) + 1,
+                updated_at=models.Post.updated_at,
+            )
+            .returning(models.Post.view_count)
+        ).scalar_one()
+        db.commit()
+        post_cache.invalidate(_detail_cache_key(db_obj.id))
+        return view_count
+    view_counter.record(db_obj.id)
+    return get_view_count(db_obj)
+
+def get_view_count(db_obj: Union[models.Post, schemas.Post]) -> int:
+    """DB에 저장된 조회수 + 아직 반영되지 않은 조회수"""
+    return (db_obj.view_count or 0) + view_counter.pending(db_obj.id)
+
+def record_unique_viewer(post_id: int, viewer_key: str) -> None:
+    if settings.UNIQUE_VIEWERS_ENABLED:
+        unique_viewer_tracker.record(post_id, viewer_key)
+
+def get_unique_viewers(db: Session, post_id: int) -> Optional[int]:
+    """게시글 순방문자 추정값 (HyperLogLog, 비활성화 시 None)"""
+    if not settings.UNIQUE_VIEWERS_ENABLED:
+        return None
+    return unique_viewer_tracker.estimate(db, post_id)
+
+def get_trending(db: Session, limit: int = 10) -> List[Tuple[models.Post, float]]:
+    """
+    인기 게시글 (게시글, 시간 감쇠 점수) 목록
+
+    순위는 메모리 리더보드에서 가져오고, 게시글은 기본키로만 조회
+    """
+    ranking = trending.top(limit)
+    if not ranking:
+        return []
+    posts = {
+        post.id: post
+        for post in db.query(models.Post).filter(models.Post.id.in_([post_id for post_id, _ in ranking]))
+    }
+    return [(posts[post_id], score) for post_id, score in ranking if post_id in posts]
+
+def get_top_by_unique_viewers(
+    db: Session, days: int = 7, limit: int = 10
+) -> List[Tuple[models.Post, int]]:
+    """최근 days 일 순방문자 상위 게시글 (게시글, 순방문자 추정값) 목록"""
+    ranking = unique_viewer_tracker.top_posts(db, days=days, limit=limit)
+    if not ranking:
+        return []
+    posts = {
+        post.id: post
+        for post in db.query(models.Post).filter(models.Post.id.in_([post_id for post_id, _ in ranking]))
+    }
+    return [(posts[post_id], count) for post_id, count in ranking if post_id in posts]
+
 def get_total_count(db: Session) -> int:
     return db.query(func.count(models.Post.id)).scalar()
 
+def get_estimated_count(db: Session) -> Optional[int]:
+    """
+    pg_class.reltuples 기반 추정 개수 (ANALYZE/autovacuum 시점 기준)
+
+    통계가 아직 수집되지 않은 테이블이면 None
+    """
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'posts'::regclass")
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+def invalidate_total_count() -> None:
+    _count_cache.delete("posts")
+
+def count_posts(db: Session, strategy: Optional[str] = None) -> Tuple[int, bool]:
+    """
+    설정된 방식으로 게시글 전체 개수 계산
+
+    Args:
+        strategy: exact, cached, estimated 중 하나 (None 이면 POST_COUNT_STRATEGY 사용)
+
+    Returns:
+        (개수, 정확한 값인지 여부)
+        캐시에서 꺼낸 값은 다른 워커의 쓰기를 놓쳤을 수 있으므로 정확하지 않은 값으로 취급
+    """
+    strategy = strategy or settings.POST_COUNT_STRATEGY
+
+    if strategy == COUNT_CACHED:
+        cached = _count_cache.get("posts")
+        if cached is not None:
+            return cached, False
+        total = get_total_count(db)
+        _count_cache.set("posts", total)
+        return total, True
+
+    if strategy == COUNT_ESTIMATED:
+        estimate = get_estimated_count(db)
+        if estimate is not None and estimate >= settings.POST_COUNT_ESTIMATE_MIN_ROWS:
+            return estimate, False
+
+    return get_total_count(db), True
+
+def _pagination_page(
+    page: int,
+    size: int,
+    order_by: str,
+    order_desc: bool,
+    count_strategy: Optional[str],
+    fields: Optional[List[str]],
+    excerpt_length: Optional[int],
+) -> Tuple[Optional[tuple], Callable[[Session], Dict[str, Any]]]:
+    # (캐시 키 구성 요소, 세션을 받아 페이지 dict 를 만드는 함수) - 동기 / 비동기 경로가 같은 쿼리를 사용
+    def build(db: Session) -> Dict[str, Any]:
+        total, total_exact = count_posts(db, strategy=count_strategy)
+        pages = (total // size) + (1 if total % size > 0 else 0)
+        skip = (page - 1) * size
+
+        rows = (
+            _order_list(_list_rows_query(db, fields, excerpt_length), order_by, order_desc)
+            .offset(skip)
+            .limit(size)
+            .all()
+        )
+
+        return {
+            "total": total,
+            "total_exact": total_exact,
+            "items": [to_list_dict(row, fields, excerpt_length) for row in rows],
+            "page": page,
+            "size": size,
+            "pages": pages
+        }
+
+    # 첫 페이지만 캐시
+    key_parts = (
+        "page", size, order_by, order_desc, count_strategy or settings.POST_COUNT_STRATEGY,
+        ",".join(fields) if fields is not None else "*", excerpt_length,
+    ) if page == 1 else None
+    return key_parts, build
+
 def get_pagination(
     db: Session,
     page: int = 1,
     size: int = 10,
     order_by: str = "created_at",
-    order_desc: bool = True
-) -> Dict[str, Any]:
-    total = get_total_count(db)
-    pages = (total // size) + (1 if total % size > 0 else 0)
-    skip = (page - 1) * size
-    
-    posts = get_posts(
-        db=db, 
-        skip=skip, 
-        limit=size,
-        order_by=order_by,
-        order_desc=order_desc
+    order_desc: bool = True,
+    count_strategy: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    excerpt_length: Optional[int] = None,
+    as_json: bool = False,
+) -> Union[Dict[str, Any], bytes]:
+    """
+    페이지 번호 기반 목록 (첫 페이지는 캐시 우선)
+
+    as_json 이면 PostPagination 응답 본문 JSON 바이트 반환
+    """
+    key_parts, build = _pagination_page(
+        page, size, order_by, order_desc, count_strategy, fields, excerpt_length
     )
-    
-    return {
-        "total": total,
-        "items": posts,
-        "page": page,
-        "size": size,
-        "pages": pages
-    } 
\ No newline at end of file
+    return _list_page(db, key_parts, lambda: build(db), as_json)
+
+async def get_pagination_async(
+    adb: AsyncSession,
+    page: int = 1,
+    size: int = 10,
+    order_by: str = "created_at",
+    order_desc: bool = True,
+    count_strategy: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    excerpt_length: Optional[int] = None,
+    as_json: bool = False,
+) -> Union[Dict[str, Any], bytes]:
+    """get_pagination 의 비동기 버전 (같은 쿼리를 AsyncSession.run_sync 로 실행)"""
+    key_parts, build = _pagination_page(
+        page, size, order_by, order_desc, count_strategy, fields, excerpt_length
+    )
+    return await _list_page_async(adb, key_parts, lambda: adb.run_sync(build), as_json)
+
+def _keyset_page(
+    size: int,
+    order_by: str,
+    order_desc: bool,
+    cursor: Optional[str],
+    fields: Optional[List[str]],
+    excerpt_length: Optional[int],
+) -> Tuple[Optional[tuple], Callable[[Session], Dict[str, Any]]]:
+    if order_by not in KEYSET_ORDERS:
+        order_by = "created_at"
+    order_col, value_parser = KEYSET_ORDERS[order_by]
+
+    def build(db: Session) -> Dict[str, Any]:
+        rows, next_cursor, prev_cursor = paginate_keyset(
+            # 커서를 만들려면 정렬 컬럼이 필요
+            _list_rows_query(db, fields, excerpt_length, required=(order_col,)),
+            sort_column=order_col,
+            id_column=models.Post.id,
+            size=size,
+            order_desc=order_desc,
+            cursor=cursor,
+            tag=f"posts:{order_by}:{'desc' if order_desc else 'asc'}",
+            value_parser=value_parser,
+        )
+
+        return {
+            "items": [to_list_dict(row, fields, excerpt_length) for row in rows],
+            "size": size,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        }
+
+    # 첫 페이지만 캐시 (커서가 가리키는 페이지는 요청마다 다름)
+    key_parts = (
+        "cursor", size, order_by, order_desc,
+        ",".join(fields) if fields is not None else "*", excerpt_length,
+    ) if cursor is None else None
+    return key_parts, build
+
+def get_posts_keyset(
+    db: Session,
+    size: int = 10,
+    order_by: str = "created_at",
+    order_desc: bool = True,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    excerpt_length: Optional[int] = None,
+    as_json: bool = False,
+) -> Union[Dict[str, Any], bytes]:
+    """
+    (정렬 컬럼, id) 기준 커서 페이지네이션
+
+    OFFSET 과 전체 count(*) 없이 조회하므로 페이지 깊이와 무관하게 응답 시간이 일정함
+    as_json 이면 PostCursorPage 응답 본문 JSON 바이트 반환
+
+    Raises:
+        ValueError: 잘못되었거나 다른 정렬 기준으로 만들어진 커서
+    """
+    key_parts, build = _keyset_page(size, order_by, order_desc, cursor, fields, excerpt_length)
+    return _list_page(db, key_parts, lambda: build(db), as_json)
+
+async def get_posts_keyset_async(
+    adb: AsyncSession,
+    size: int = 10,
+    order_by: str = "created_at",
+    order_desc: bool = True,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    excerpt_length: Optional[int] = None,
+    as_json: bool = False,
+) -> Union[Dict[str, Any], bytes]:
+    """
+    get_posts_keyset 의 비동기 버전
+
+    Raises:
+        ValueError: 잘못되었거나 다른 정렬 기준으로 만들어진 커서
+    """
+    key_parts, build = _keyset_page(size, order_by, order_desc, cursor, fields, excerpt_length)
+    return await _list_page_async(adb, key_parts, lambda: adb.run_sync(build), as_json)
@@ -0,0 +1,128 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Float, cast, func
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.core.pagination import paginate_keyset, parse_datetime
+from app.core.search import SEARCH_CONFIG, build_tsquery, highlight, query_fingerprint
+
+# 검색 결과 정렬 기준
+SORT_RELEVANCE = "relevance"
+SORT_RECENT = "recent"
+
+SNIPPET_LENGTH = 160
+
+
+def _empty_page(size: int) -> Dict[str, Any]:
+    return {"items": [], "size": size, "next_cursor": None, "prev_cursor": None}
+
+
+def _search(
+    db: Session,
+    model: Any,
+    q: str,
+    size: int,
+    cursor: Optional[str],
+    sort: str,
+    kind: str,
+    filters: tuple = (),
+):
+    """
+    검색 벡터 일치 행을 (rank, id) 또는 (created_at, id) 기준 커서 페이지네이션으로 조회
+
+    Returns:
+        ((모델, rank) 행 목록, next_cursor, prev_cursor) / 검색할 토큰이 없으면 None
+    """
+    tsquery = build_tsquery(q)
+    if tsquery is None:
+        return None
+
+    ts_query = func.to_tsquery(SEARCH_CONFIG, tsquery)
+    # ts_rank_cd 는 real 이므로 double 로 바꿔 커서 값이 정확히 왕복되도록 함
+    rank = cast(func.ts_rank_cd(model.search_vector, ts_query), Float(53)).label("rank")
+    query = db.query(model, rank).filter(model.search_vector.op("@@")(ts_query), *filters)
+
+    if sort == SORT_RECENT:
+        sort_column, value_parser = model.created_at, parse_datetime
+
+        def key_getter(row):
+            return row[0].created_at, row[0].id
+    else:
+        sort_column, value_parser = rank, float
+
+        def key_getter(row):
+            return row.rank, row[0].id
+
+    return paginate_keyset(
+        query,
+        sort_column=sort_column,
+        id_column=model.id,
+        size=size,
+        cursor=cursor,
+        tag=f"search:{kind}:{sort}:{query_fingerprint(tsquery)}",
+        key_getter=key_getter,
+        value_parser=value_parser,
+    )
+
+
+def search_posts(
+    db: Session,
+    q: str,
+    size: int = 20,
+    cursor: Optional[str] = None,
+    sort: str = SORT_RELEVANCE,
+) -> Dict[str, Any]:
+    """
+    게시글 제목/본문 전문 검색 (제목 일치에 가중치)
+
+    Raises:
+        ValueError: 잘못되었거나 다른 검색어로 만들어진 커서
+    """
+    result = _search(db, models.Post, q, size, cursor, sort, kind="posts")
+    if result is None:
+        return _empty_page(size)
+    rows, next_cursor, prev_cursor = result
+
+    items = [
+        schemas.PostSearchHit(
+            **schemas.Post.model_validate(post, from_attributes=True).model_dump(),
+            rank=rank,
+            title_highlight=highlight(post.title, q),
+            snippet=highlight(post.content, q, max_length=SNIPPET_LENGTH),
+        )
+        for post, rank in rows
+    ]
+    return {"items": items, "size": size, "next_cursor": next_cursor, "prev_cursor": prev_cursor}
+
+
+def search_comments(
+    db: Session,
+    q: str,
+    size: int = 20,
+    cursor: Optional[str] = None,
+    sort: str = SORT_RELEVANCE,
+    post_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    댓글 내용 전문 검색 (post_id 를 주면 해당 게시글의 댓글만)
+
+    Raises:
+        ValueError: 잘못되었거나 다른 검색어로 만들어진 커서
+    """
+    filters = (models.Comment.post_id == post_id,) if post_id is not None else ()
+    kind = f"comments:{post_id}" if post_id is not None else "comments"
+    result = _search(db, models.Comment, q, size, cursor, sort, kind=kind, filters=filters)
+    if result is None:
+        return _empty_page(size)
+    rows, next_cursor, prev_cursor = result
+
+    items = [
+        schemas.CommentSearchHit(
+            **schemas.Comment.model_validate(comment, from_attributes=True).model_dump(),
+            rank=rank,
+            snippet=highlight(comment.content, q, max_length=SNIPPET_LENGTH),
+        )
+        for comment, rank in rows
+    ]
+    return {"items": items, "size": size, "next_cursor": next_cursor, "prev_cursor": prev_cursor}
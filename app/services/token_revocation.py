@@ -0,0 +1,198 @@
+"""
+액세스 토큰 폐기 (로그아웃)
+폐기한 jti 는 DB 에 저장하고, 워커마다 Bloom 필터에 올려 두고 새로 추가된 행만 주기적으로 읽어 반영함
+필터에 없으면 DB 조회 없이 유효, 필터에 있을 때만 DB 로 확인 (거짓 양성)
+필터를 아직 한 번도 읽지 못했으면 (시작 시 DB 장애 등) 모든 토큰을 DB 로 확인함 (fail closed)
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.background import PeriodicWorker
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.metrics import registry
+from app.db.session import SessionLocal
+from app.models.revoked_token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# id 는 발급 순서대로지만 커밋 순서는 다를 수 있으므로 마지막으로 읽은 id 앞쪽을 이만큼 다시 읽음
+REFRESH_OVERLAP_IDS = 100
+
+# 첫 적재에 실패하면 요청마다 다시 시도하지 않고 1, 2, 4, ... 최대 60초 간격으로 재시도
+LOAD_RETRY_BASE_SECONDS = 1.0
+LOAD_RETRY_MAX_SECONDS = 60.0
+
+TOKEN_REVOCATION_CHECKS = registry.counter(
+    "token_revocation_checks_total",
+    "토큰 폐기 확인 횟수 (result: filter_miss - DB 조회 없음, revoked, false_positive, unloaded - 필터 적재 전 DB 조회)",
+    labelnames=("result",),
+)
+TOKEN_REVOCATION_FILTER_SIZE = registry.gauge(
+    "token_revocation_filter_entries", "폐기 토큰 Bloom 필터에 넣은 jti 수"
+)
+
+
+class TokenRevocationList:
+    """
+    폐기 토큰 목록 (DB 저장 + 워커별 Bloom 필터)
+
+    다른 워커에서 폐기한 토큰은 다음 refresh (refresh_interval 초) 까지는 필터에 없으므로 유효하게 보일 수 있음
+    같은 워커에서 폐기한 토큰은 바로 반영됨
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        refresh_interval: float = 5.0,
+        purge_interval: float = 3600.0,
+        session_factory=SessionLocal,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.purge_interval = purge_interval
+        self.session_factory = session_factory
+        self._filter = BloomFilter(capacity, error_rate)
+        self._last_id: Optional[int] = None  # None 이면 아직 한 번도 읽지 않음
+        self._last_purge = 0.0  # 마지막으로 만료 행을 삭제한 시각 (monotonic)
+        self._load_failures = 0  # 연속으로 실패한 첫 적재 횟수
+        self._retry_at = 0.0  # 이 시각 (monotonic) 전에는 요청에서 첫 적재를 다시 시도하지 않음
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._worker = PeriodicWorker("token-revocation-refresher", refresh_interval, self.refresh)
+        TOKEN_REVOCATION_FILTER_SIZE.set_function(lambda: self._filter.count)
+
+    def refresh(self) -> int:
+        """
+        마지막으로 읽은 id 이후에 폐기된 jti 를 필터에 추가
+
+        처음 호출이거나 필터가 가득 찼으면 만료되지 않은 행만으로 필터를 새로 만들고,
+        그 밖에도 purge_interval 초마다 만료된 행을 DB 에서 삭제함
+        요청 세션의 트랜잭션에 끼어들지 않도록 항상 별도 세션 사용
+
+        Returns:
+            필터에 추가한 jti 수
+        """
+        with self._refresh_lock:
+            db = self.session_factory()
+            try:
+                rebuild = self._last_id is None or self._filter.is_full()
+                if rebuild:
+                    return self._rebuild(db)
+                if time.monotonic() - self._last_purge >= self.purge_interval:
+                    self._purge_expired(db)
+                rows = (
+                    db.query(RevokedToken.id, RevokedToken.jti)
+                    .filter(RevokedToken.id > self._last_id - REFRESH_OVERLAP_IDS)
+                    .order_by(RevokedToken.id)
+                    .all()
+                )
+                added = 0
+                with self._lock:
+                    for row_id, jti in rows:
+                        if jti not in self._filter:
+                            self._filter.add(jti)
+                            added += 1
+                        self._last_id = max(self._last_id, row_id)
+                return added
+            except Exception as e:
+                db.rollback()
+                if self._last_id is None:
+                    self._load_failures += 1
+                    delay = min(LOAD_RETRY_BASE_SECONDS * 2 ** (self._load_failures - 1), LOAD_RETRY_MAX_SECONDS)
+                    self._retry_at = time.monotonic() + delay
+                    logger.error(f"폐기 토큰 목록 적재 실패 ({delay:.0f}초 뒤 재시도, 그동안 DB 로 확인): {e}")
+                else:
+                    logger.error(f"폐기 토큰 목록 갱신 실패: {e}")
+                return 0
+            finally:
+                db.close()
+
+    def _purge_expired(self, db: Session) -> int:
+        """만료된 행 삭제 (만료된 토큰은 서명 검증에서 거부되므로 필터에 남아 있어도 됨)"""
+        now = datetime.now(timezone.utc)
+        deleted = (
+            db.query(RevokedToken).filter(RevokedToken.expires_at <= now).delete(synchronize_session=False)
+        )
+        db.commit()
+        self._last_purge = time.monotonic()
+        return deleted
+
+    def _rebuild(self, db: Session) -> int:
+        self._purge_expired(db)
+        rows = db.query(RevokedToken.id, RevokedToken.jti).order_by(RevokedToken.id).all()
+        # 남은 행이 많으면 그만큼 크게 만들어 거짓 양성 비율 유지
+        bloom = BloomFilter(max(self.capacity, len(rows) * 2), self.error_rate)
+        last_id = 0
+        for row_id, jti in rows:
+            bloom.add(jti)
+            last_id = row_id
+        with self._lock:
+            self._filter = bloom
+            self._last_id = last_id
+        self._load_failures = 0
+        return len(rows)
+
+    def revoke(self, db: Session, jti: str, expires_at: datetime, user_id: Optional[int] = None) -> None:
+        """토큰 폐기 (이미 폐기된 jti 면 무시)"""
+        db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, user_id=user_id, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+        db.commit()
+        with self._lock:
+            self._filter.add(jti)
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        """
+        폐기된 토큰인지 (필터에 없으면 DB 조회 없이 False)
+
+        필터를 아직 적재하지 못했으면 필터 대신 DB 로 확인 (폐기된 토큰을 통과시키지 않음)
+        """
+        # 다른 요청이 적재 중이면 기다리지 않고 DB 로 확인
+        if self._last_id is None and time.monotonic() >= self._retry_at and not self._refresh_lock.locked():
+            self.refresh()
+        with self._lock:
+            loaded = self._last_id is not None
+            maybe_revoked = jti in self._filter
+        if loaded and not maybe_revoked:
+            TOKEN_REVOCATION_CHECKS.inc(result="filter_miss")
+            return False
+        revoked = db.query(RevokedToken.id).filter(RevokedToken.jti == jti).first() is not None
+        if revoked:
+            TOKEN_REVOCATION_CHECKS.inc(result="revoked")
+        else:
+            TOKEN_REVOCATION_CHECKS.inc(result="false_positive" if loaded else "unloaded")
+        return revoked
+
+    def clear(self) -> None:
+        """메모리 필터 초기화 (다음 확인 때 DB 에서 다시 읽음)"""
+        with self._lock:
+            self._filter = BloomFilter(self.capacity, self.error_rate)
+            self._last_id = None
+        self._load_failures = 0
+        self._retry_at = 0.0
+
+    def start(self) -> None:
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._worker.stop()
+
+
+# 전역 인스턴스
+token_revocation = TokenRevocationList(
+    capacity=settings.TOKEN_REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+    refresh_interval=settings.TOKEN_REVOCATION_REFRESH_SECONDS,
+    purge_interval=settings.TOKEN_REVOCATION_PURGE_SECONDS,
+)
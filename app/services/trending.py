@@ -0,0 +1,202 @@
+"""
+인기 게시글 리더보드
+조회/댓글 이벤트마다 시간 감쇠 점수를 갱신하고 상위 N개를 메모리에 유지
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.background import PeriodicWorker
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 기준 시각 이후 지수가 이 값을 넘으면 점수를 다시 정규화 (부동소수점 overflow 방지)
+_REBASE_EXPONENT = 50.0
+
+
+class TrendingLeaderboard:
+    """
+    시간 감쇠(forward decay) 점수 기반 상위 N 리더보드
+
+    시각 t 의 이벤트는 weight * exp(λ(t - t0)) 를 더하고, 현재 점수는 누적값 * exp(-λ(now - t0)) 임
+    감쇠 계수가 모든 게시글에 똑같이 곱해지므로 순위는 시간이 지나도 바뀌지 않고,
+    이벤트가 들어온 게시글의 점수만 갱신하면 됨 (테이블 스캔/정렬 없음)
+
+    top() 은 미리 만들어 둔 상위 N 스냅샷을 반환하므로 게시글 수와 무관하게 일정한 시간에 응답함
+    """
+
+    def __init__(
+        self,
+        half_life_seconds: float = 6 * 3600,
+        top_n: int = 100,
+        max_tracked: int = 10000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.decay = math.log(2) / half_life_seconds
+        self.top_n = top_n
+        self.max_tracked = max(max_tracked, top_n)
+        self.clock = clock
+        self._landmark = clock()
+        self._scores: Dict[int, float] = {}
+        # (누적 점수, post_id) 내림차순
+        self._top: List[Tuple[float, int]] = []
+        self._lock = threading.Lock()
+
+    def record(self, post_id: int, weight: float = 1.0) -> None:
+        """이벤트 반영 (조회 1회, 댓글 1개 등)"""
+        now = self.clock()
+        with self._lock:
+            exponent = self.decay * (now - self._landmark)
+            if exponent > _REBASE_EXPONENT:
+                self._rebase(now)
+                exponent = 0.0
+            score = self._scores.get(post_id, 0.0) + weight * math.exp(exponent)
+            self._scores[post_id] = score
+            self._update_top(post_id, score)
+            if len(self._scores) > self.max_tracked:
+                self._prune()
+
+    def remove(self, post_id: int) -> None:
+        """삭제된 게시글 제외"""
+        with self._lock:
+            if self._scores.pop(post_id, None) is None:
+                return
+            if any(entry_id == post_id for _, entry_id in self._top):
+                self._rebuild_top()
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        상위 게시글 (post_id, 현재 시각 기준 감쇠 점수) 목록
+        """
+        with self._lock:
+            top, landmark = self._top, self._landmark
+        factor = math.exp(-self.decay * (self.clock() - landmark))
+        return [(post_id, score * factor) for score, post_id in top[:limit or self.top_n]]
+
+    def _update_top(self, post_id: int, score: float) -> None:
+        # 누적 점수는 증가만 하므로, 갱신된 게시글만 상위 목록에 들어오거나 순위가 오를 수 있음
+        in_top = any(entry_id == post_id for _, entry_id in self._top)
+        if not in_top and len(self._top) >= self.top_n and score <= self._top[-1][0]:
+            return
+        entries = [entry for entry in self._top if entry[1] != post_id]
+        entries.append((score, post_id))
+        entries.sort(reverse=True)
+        self._top = entries[:self.top_n]
+
+    def _rebuild_top(self) -> None:
+        entries = sorted(((score, post_id) for post_id, score in self._scores.items()), reverse=True)
+        self._top = entries[:self.top_n]
+
+    def _prune(self) -> None:
+        """점수가 낮은 게시글부터 추적 대상에서 제외 (추적 수를 max_tracked 의 절반으로)"""
+        keep = sorted(self._scores.items(), key=lambda item: item[1], reverse=True)[: self.max_tracked // 2]
+        self._scores = dict(keep)
+        # max_tracked // 2 < top_n 이면 제외된 게시글이 상위 목록에 남지 않도록 다시 만듦
+        self._rebuild_top()
+
+    def _rebase(self, now: float) -> None:
+        factor = math.exp(-self.decay * (now - self._landmark))
+        self._scores = {post_id: score * factor for post_id, score in self._scores.items()}
+        self._top = [(score * factor, post_id) for score, post_id in self._top]
+        self._landmark = now
+
+    def save(self, path: str) -> None:
+        """현재 점수를 파일로 저장"""
+        with self._lock:
+            data = {
+                "landmark": self._landmark,
+                "decay": self.decay,
+                "scores": {str(post_id): score for post_id, score in self._scores.items()},
+            }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        """저장된 점수 불러오기 (감쇠 계수가 바뀌었으면 현재 계수로 환산)"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        now = self.clock()
+        # 저장 시점 기준 현재 점수로 환산한 뒤 새 기준 시각으로 옮김
+        saved_factor = math.exp(-data["decay"] * (now - data["landmark"]))
+        with self._lock:
+            self._landmark = now
+            self._scores = {
+                int(post_id): score * saved_factor for post_id, score in data["scores"].items()
+            }
+            self._rebuild_top()
+
+
+class TrendingService:
+    """
+    리더보드 + 이벤트 가중치 + 선택적 스냅샷 저장
+
+    리더보드는 워커(프로세스)마다 따로 유지되며, 스냅샷은 단일 워커 배포를 가정함
+    워커가 여러 개면 각자 자기 이벤트만 반영한 점수를 같은 snapshot_path 에 덮어쓰므로 마지막에 저장한 워커의 점수만 남음
+    """
+
+    def __init__(
+        self,
+        leaderboard: TrendingLeaderboard,
+        view_weight: float = 1.0,
+        comment_weight: float = 5.0,
+        snapshot_path: Optional[str] = None,
+        snapshot_interval: float = 60.0,
+    ):
+        self.leaderboard = leaderboard
+        self.view_weight = view_weight
+        self.comment_weight = comment_weight
+        self.snapshot_path = snapshot_path
+        self._worker = PeriodicWorker("trending-snapshot", snapshot_interval, self.save_snapshot)
+
+    def record_view(self, post_id: int) -> None:
+        self.leaderboard.record(post_id, self.view_weight)
+
+    def record_comment(self, post_id: int) -> None:
+        self.leaderboard.record(post_id, self.comment_weight)
+
+    def remove(self, post_id: int) -> None:
+        self.leaderboard.remove(post_id)
+
+    def top(self, limit: int) -> List[Tuple[int, float]]:
+        return self.leaderboard.top(limit)
+
+    def save_snapshot(self) -> None:
+        if self.snapshot_path:
+            self.leaderboard.save(self.snapshot_path)
+
+    def start(self) -> None:
+        """스냅샷이 있으면 불러오고 주기 저장 시작"""
+        if not self.snapshot_path:
+            return
+        if os.path.exists(self.snapshot_path):
+            try:
+                self.leaderboard.load(self.snapshot_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"인기 게시글 스냅샷 불러오기 실패: {e}")
+        self._worker.start()
+
+    def stop(self) -> None:
+        if self.snapshot_path:
+            self._worker.stop()
+
+
+# 전역 인스턴스
+trending = TrendingService(
+    TrendingLeaderboard(
+        half_life_seconds=settings.TRENDING_HALF_LIFE_HOURS * 3600,
+        top_n=settings.TRENDING_TOP_N,
+        max_tracked=settings.TRENDING_MAX_TRACKED,
+    ),
+    view_weight=settings.TRENDING_VIEW_WEIGHT,
+    comment_weight=settings.TRENDING_COMMENT_WEIGHT,
+    snapshot_path=settings.TRENDING_SNAPSHOT_PATH,
+    snapshot_interval=settings.TRENDING_SNAPSHOT_INTERVAL_SECONDS,
+)
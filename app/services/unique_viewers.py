@@ -0,0 +1,244 @@
+"""
+게시글 순방문자(unique viewer) 근사 집계
+게시글별 전체/일별 HyperLogLog 스케치를 메모리에서 갱신하고 주기적으로 DB 스케치에 합쳐 저장
+"""
+
+import hashlib
+import logging
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.background import PeriodicWorker
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.hll import HyperLogLog
+from app.db.session import SessionLocal
+from app.models.view_sketch import PostDailyViewerSketch, PostViewerSketch
+
+logger = logging.getLogger(__name__)
+
+# (post_id, day) - day 가 None 이면 전체 기간 스케치
+SketchKey = Tuple[int, Optional[date]]
+
+
+def make_viewer_key(user_id: Optional[int], client_host: Optional[str], user_agent: Optional[str]) -> str:
+    """
+    방문자 식별 키
+
+    로그인 사용자는 사용자 id, 비로그인 사용자는 IP + User-Agent 해시
+    """
+    if user_id is not None:
+        return f"u:{user_id}"
+    raw = f"{client_host or ''}|{user_agent or ''}".encode("utf-8")
+    return "a:" + hashlib.blake2b(raw, digest_size=12).hexdigest()
+
+
+def today_utc() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+class UniqueViewerTracker:
+    """
+    게시글 순방문자 HyperLogLog 집계기
+
+    record() 는 메모리 스케치만 갱신하고, flush() 가 DB 스케치와 합쳐(레지스터별 최댓값) 저장함
+    게시글당 스케치 크기가 고정(2^precision 바이트)이므로 조회 수와 무관하게 메모리가 제한됨
+    """
+
+    def __init__(
+        self,
+        precision: int = 12,
+        flush_interval: float = 30.0,
+        session_factory=SessionLocal,
+    ):
+        self.precision = precision
+        self.session_factory = session_factory
+        self._pending: Dict[SketchKey, HyperLogLog] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # DB에 저장된 전체 기간 스케치 캐시 (post_id → HyperLogLog)
+        self._persisted = TTLCache(default_ttl=flush_interval, max_entries=10000)
+        # 기간별 순위 캐시 ((days, 시작일) → [(post_id, 추정값)]), flush 때마다 비움
+        self._rankings = TTLCache(default_ttl=flush_interval, max_entries=64)
+        self._ranking_lock = threading.Lock()
+        self._worker = PeriodicWorker("unique-viewer-flusher", flush_interval, self.flush)
+
+    def record(self, post_id: int, viewer_key: str, day: Optional[date] = None) -> None:
+        """방문 기록 (전체 기간 + 해당 일자 스케치)"""
+        day = day or today_utc()
+        with self._lock:
+            for key in ((post_id, None), (post_id, day)):
+                sketch = self._pending.get(key)
+                if sketch is None:
+                    sketch = self._pending[key] = HyperLogLog(self.precision)
+                sketch.add(viewer_key)
+
+    def _load_persisted(self, db: Session, post_id: int) -> HyperLogLog:
+        sketch = self._persisted.get(post_id)
+        if sketch is None:
+            registers = (
+                db.query(PostViewerSketch.registers)
+                .filter(PostViewerSketch.post_id == post_id)
+                .scalar()
+            )
+            sketch = HyperLogLog.from_bytes(registers) if registers else HyperLogLog(self.precision)
+            self._persisted.set(post_id, sketch)
+        return sketch
+
+    def estimate(self, db: Session, post_id: int) -> int:
+        """게시글 전체 기간 순방문자 추정값 (DB 스케치 + 반영 대기 스케치)"""
+        merged = HyperLogLog(self.precision)
+        merged.merge(self._load_persisted(db, post_id))
+        with self._lock:
+            pending = self._pending.get((post_id, None))
+            if pending is not None:
+                merged.merge(pending)
+        return merged.count()
+
+    def top_posts(self, db: Session, days: int = 7, limit: int = 10) -> List[Tuple[int, int]]:
+        """
+        최근 days 일 동안 순방문자가 많은 게시글
+
+        일별 스케치를 모두 읽어 합치는 계산이라 기간별 전체 순위를 캐시해 두고,
+        다음 flush (최대 flush_interval 초) 까지는 같은 순위를 돌려줌
+
+        Returns:
+            (post_id, 순방문자 추정값) 목록 (많은 순)
+        """
+        since = today_utc() - timedelta(days=days - 1)
+        key = (days, since)
+        ranking = self._rankings.get(key)
+        if ranking is None:
+            # 동시에 캐시가 비어도 계산은 한 번만
+            with self._ranking_lock:
+                ranking = self._rankings.get(key)
+                if ranking is None:
+                    ranking = self._compute_ranking(db, since)
+                    self._rankings.set(key, ranking)
+        return ranking[:limit]
+
+    def _compute_ranking(self, db: Session, since: date) -> List[Tuple[int, int]]:
+        merged: Dict[int, HyperLogLog] = {}
+
+        def merge_into(post_id: int, sketch: HyperLogLog) -> None:
+            target = merged.get(post_id)
+            if target is None:
+                target = merged[post_id] = HyperLogLog(self.precision)
+            target.merge(sketch)
+
+        rows = (
+            db.query(PostDailyViewerSketch.post_id, PostDailyViewerSketch.registers)
+            .filter(PostDailyViewerSketch.day >= since)
+            .all()
+        )
+        for post_id, registers in rows:
+            if registers:
+                merge_into(post_id, HyperLogLog.from_bytes(registers))
+        with self._lock:
+            for (post_id, day), sketch in self._pending.items():
+                if day is not None and day >= since:
+                    merge_into(post_id, sketch)
+
+        counts = [(post_id, sketch.count()) for post_id, sketch in merged.items()]
+        counts.sort(key=lambda item: (-item[1], -item[0]))
+        return counts
+
+    def flush(self, db: Optional[Session] = None) -> int:
+        """
+        반영 대기 스케치를 DB 스케치에 합쳐 저장
+
+        Returns:
+            저장한 스케치 개수 (실패 시 메모리로 되돌리고 0)
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            own_session = db is None
+            db = db or self.session_factory()
+            try:
+                # 키 순서대로 잠가 워커 간 교착 방지
+                for (post_id, day), sketch in sorted(
+                    pending.items(), key=lambda item: (item[0][0], item[0][1] or date.min)
+                ):
+                    self._merge_row(db, post_id, day, sketch)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                with self._lock:
+                    for key, sketch in pending.items():
+                        current = self._pending.get(key)
+                        if current is None:
+                            self._pending[key] = sketch
+                        else:
+                            current.merge(sketch)
+                logger.error(f"순방문자 스케치 반영 실패: {e}")
+                return 0
+            finally:
+                if own_session:
+                    db.close()
+
+            for post_id, day in pending:
+                if day is None:
+                    self._persisted.delete(post_id)
+            self._rankings.clear()
+            return len(pending)
+
+    def _merge_row(self, db: Session, post_id: int, day: Optional[date], sketch: HyperLogLog) -> None:
+        params = {"post_id": post_id, "empty": b""}
+        if day is None:
+            model = PostViewerSketch
+            db.execute(
+                text(
+                    "INSERT INTO post_viewer_sketches (post_id, registers) "
+                    "SELECT :post_id, :empty WHERE EXISTS (SELECT 1 FROM posts WHERE id = :post_id) "
+                    "ON CONFLICT DO NOTHING"
+                ),
+                params,
+            )
+            query = db.query(model).filter(model.post_id == post_id)
+        else:
+            model = PostDailyViewerSketch
+            db.execute(
+                text(
+                    "INSERT INTO post_daily_viewer_sketches (post_id, day, registers) "
+                    "SELECT :post_id, :day, :empty WHERE EXISTS (SELECT 1 FROM posts WHERE id = :post_id) "
+                    "ON CONFLICT DO NOTHING"
+                ),
+                {**params, "day": day},
+            )
+            query = db.query(model).filter(model.post_id == post_id, model.day == day)
+
+        row = query.with_for_update().first()
+        if row is None:
+            # 그 사이 삭제된 게시글
+            return
+        merged = HyperLogLog.from_bytes(row.registers) if row.registers else HyperLogLog(self.precision)
+        merged.merge(sketch)
+        row.registers = merged.to_bytes()
+
+    def clear(self) -> None:
+        """메모리 상태 초기화 (반영 대기 스케치는 버려짐)"""
+        with self._lock:
+            self._pending = {}
+        self._persisted.clear()
+        self._rankings.clear()
+
+    def start(self) -> None:
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._worker.stop()
+
+
+# 전역 인스턴스
+unique_viewer_tracker = UniqueViewerTracker(
+    precision=settings.UNIQUE_VIEWERS_PRECISION,
+    flush_interval=settings.UNIQUE_VIEWERS_FLUSH_INTERVAL_SECONDS,
+)
@@ -1,9 +1,32 @@
-from typing import Optional
+import hashlib
+from typing import List, Optional
 
+import anyio
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
-from app.core.security import get_password_hash, verify_password
+from app.core.cache import ObjectCache, load_cache_backend
+from app.core.config import settings
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_and_update_password,
+    verify_and_update_password_async,
+)
+
+# 인증된 사용자 캐시 (적중 횟수 = 절약한 사용자 조회 쿼리 수,
+# object_cache_requests_total{cache="principals", result="hit"})
+principal_cache = ObjectCache(
+    "principals",
+    backend=load_cache_backend(
+        settings.PRINCIPAL_CACHE_BACKEND, max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES
+    ),
+    default_ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+def _principal_version_name(user_id: int) -> str:
+    return f"principal:{user_id}"
 
 def get_by_email(db: Session, email: str) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.email == email).first()
@@ -11,14 +34,49 @@ def get_by_email(db: Session, email: str) -> Optional[models.User]:
 def get_by_id(db: Session, user_id: int) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.id == user_id).first()
 
+async def get_by_id_async(adb: AsyncSession, user_id: int) -> Optional[models.User]:
+    return await adb.get(models.User, user_id)
+
+def get_principal(db: Session, user_id: int, token: str) -> Optional[models.User]:
+    """
+    토큰 주체 사용자 (캐시 우선)
+
+    캐시 키는 사용자 id, 사용자별 버전, 토큰 해시로 만들고 update_user 가 버전을 올려 무효화함
+    반환값은 세션에 붙지 않은 스냅샷이므로 수정하려면 get_by_id 로 다시 읽어야 함
+    """
+    def load() -> Optional[bytes]:
+        user = get_by_id(db, user_id=user_id)
+        if user is None:
+            return None
+        return schemas.User.model_validate(user, from_attributes=True).model_dump_json().encode("utf-8")
+
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return get_by_id(db, user_id=user_id)
+
+    version = principal_cache.version(_principal_version_name(user_id))
+    token_hash = hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+    raw = principal_cache.get_or_load(f"principal:{user_id}:v{version}:{token_hash}", load)
+    if raw is None:
+        return None
+    return models.User(**schemas.User.model_validate_json(raw).model_dump())
+
+def invalidate_principal(user_id: int) -> None:
+    """사용자의 모든 토큰에 대한 캐시 무효화 (권한 / 활성 상태 / 비밀번호 / 프로필 변경 후 호출)"""
+    principal_cache.bump_version(_principal_version_name(user_id))
+
 def get_users(db: Session, skip: int = 0, limit: int = 100):
     return db.query(models.User).offset(skip).limit(limit).all()
 
-def create_user(db: Session, obj_in: schemas.UserCreate) -> models.User:
+async def get_users_async(adb: AsyncSession, skip: int = 0, limit: int = 100) -> List[models.User]:
+    return await adb.run_sync(get_users, skip, limit)
+
+def create_user(
+    db: Session, obj_in: schemas.UserCreate, hashed_password: Optional[str] = None
+) -> models.User:
     db_obj = models.User(
         email=obj_in.email,
         username=obj_in.username,
-        hashed_password=get_password_hash(obj_in.password),
+        hashed_password=hashed_password or get_password_hash(obj_in.password),
     )
     db.add(db_obj)
     db.commit()
@@ -38,14 +96,50 @@ def update_user(db: Session, db_obj: models.User, obj_in: schemas.UserUpdate) ->
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    invalidate_principal(db_obj.id)
     return db_obj
 
+async def create_user_async(db: Session, obj_in: schemas.UserCreate) -> models.User:
+    """
+    create_user 의 비동기 버전 (해시는 전용 실행기, DB 작업은 기본 스레드 풀)
+
+    해시 실행기 대기열이 가득 차면 ExecutorFull
+    """
+    hashed_password = await get_password_hash_async(obj_in.password)
+    return await anyio.to_thread.run_sync(create_user, db, obj_in, hashed_password)
+
+def _store_rehashed_password(db: Session, user: models.User, hashed_password: str) -> None:
+    # 해시 방식 / 비용 설정이 바뀐 사용자의 해시를 로그인할 때 교체
+    user.hashed_password = hashed_password
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
 def authenticate(db: Session, email: str, password: str) -> Optional[models.User]:
     user = get_by_email(db, email=email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    verified, new_hash = verify_and_update_password(password, user.hashed_password)
+    if not verified:
+        return None
+    if new_hash:
+        _store_rehashed_password(db, user, new_hash)
+    return user
+
+async def authenticate_async(db: Session, email: str, password: str) -> Optional[models.User]:
+    """
+    authenticate 의 비동기 버전 (해시 검증은 전용 실행기, DB 작업은 기본 스레드 풀)
+
+    해시 실행기 대기열이 가득 차면 ExecutorFull
+    """
+    user = await anyio.to_thread.run_sync(get_by_email, db, email)
+    if not user:
+        return None
+    verified, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+    if not verified:
         return None
+    if new_hash:
+        await anyio.to_thread.run_sync(_store_rehashed_password, db, user, new_hash)
     return user
 
 def is_active(user: models.User) -> bool:
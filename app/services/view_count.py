@@ -0,0 +1,192 @@
+"""
+게시글 조회수 write-behind 버퍼
+조회 요청마다 행을 갱신하지 않고 메모리에 누적한 뒤 주기적으로 한 번에 반영
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.background import PeriodicWorker
+from app.core.config import settings
+from app.core.metrics import registry
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+VIEW_COUNT_FLUSHED = registry.counter(
+    "view_count_flushed_total", "DB에 반영된 누적 조회수"
+)
+VIEW_COUNT_FLUSH_SECONDS = registry.histogram(
+    "view_count_flush_seconds", "조회수 배치 반영 소요 시간(초)"
+)
+VIEW_COUNT_PENDING = registry.gauge(
+    "view_count_pending", "아직 DB에 반영되지 않은 조회수"
+)
+
+
+class ViewCountBackend:
+    """
+    반영 대기 중인 조회수 저장소 인터페이스
+
+    워커 간에 버퍼를 공유하려면 (예: Redis 해시의 HINCRBY / 원자적 drain)
+    같은 메서드를 구현한 클래스를 VIEW_COUNT_BACKEND 에 지정
+    """
+
+    def incr(self, post_id: int, amount: int = 1) -> None:
+        raise NotImplementedError
+
+    def get(self, post_id: int) -> int:
+        raise NotImplementedError
+
+    def total(self) -> int:
+        raise NotImplementedError
+
+    def drain(self) -> Dict[int, int]:
+        """대기 중인 조회수를 모두 꺼내고 비움"""
+        raise NotImplementedError
+
+    def restore(self, counts: Dict[int, int]) -> None:
+        """반영에 실패한 조회수를 되돌려 놓음"""
+        for post_id, amount in counts.items():
+            self.incr(post_id, amount)
+
+
+class LocalViewCountBackend(ViewCountBackend):
+    """워커 프로세스 메모리에 누적하는 기본 저장소"""
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def incr(self, post_id: int, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[post_id] = self._counts.get(post_id, 0) + amount
+            self._total += amount
+
+    def get(self, post_id: int) -> int:
+        return self._counts.get(post_id, 0)
+
+    def total(self) -> int:
+        return self._total
+
+    def drain(self) -> Dict[int, int]:
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            self._total = 0
+        return counts
+
+
+def load_backend(path: str) -> ViewCountBackend:
+    """'모듈경로.클래스명' 문자열로 저장소 생성"""
+    module_name, _, class_name = path.rpartition(".")
+    backend_cls = getattr(importlib.import_module(module_name), class_name)
+    return backend_cls()
+
+
+class ViewCounter:
+    """
+    조회수 write-behind 카운터
+
+    record() 는 메모리 버퍼만 갱신하고, 백그라운드 스레드가 flush_interval 초마다
+    (또는 대기 조회수가 max_pending 을 넘으면 즉시)
+    UPDATE posts SET view_count = view_count + :n 배치로 반영함
+    프로세스가 비정상 종료되면 최대 flush_interval 초 / max_pending 건의 조회수가 유실될 수 있음
+    """
+
+    def __init__(
+        self,
+        backend: ViewCountBackend,
+        flush_interval: float = 5.0,
+        max_pending: int = 1000,
+        session_factory=SessionLocal,
+    ):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.session_factory = session_factory
+        self._flush_lock = threading.Lock()
+        self._flush_listeners: List[Callable[[Dict[int, int]], None]] = []
+        self._worker = PeriodicWorker("view-count-flusher", flush_interval, self.flush)
+        VIEW_COUNT_PENDING.set_function(self.backend.total)
+
+    def record(self, post_id: int, amount: int = 1) -> None:
+        """조회수 증가를 버퍼에 기록"""
+        self.backend.incr(post_id, amount)
+        if self.backend.total() >= self.max_pending:
+            self._worker.wake()
+
+    def add_flush_listener(self, listener: Callable[[Dict[int, int]], None]) -> None:
+        """DB 반영 직후 {post_id: 반영한 조회수} 로 호출할 함수 등록 (캐시 무효화 등)"""
+        self._flush_listeners.append(listener)
+
+    def pending(self, post_id: int) -> int:
+        """아직 반영되지 않은 조회수"""
+        return self.backend.get(post_id)
+
+    def flush(self, db: Optional[Session] = None) -> int:
+        """
+        대기 중인 조회수를 DB에 반영
+
+        Returns:
+            반영한 조회수 합계 (실패 시 버퍼로 되돌리고 0)
+        """
+        with self._flush_lock:
+            counts = self.backend.drain()
+            if not counts:
+                return 0
+
+            own_session = db is None
+            db = db or self.session_factory()
+            start = time.perf_counter()
+            try:
+                # id 순으로 갱신해 워커 간 행 잠금 순서를 맞춤 (교착 방지)
+                db.execute(
+                    text(
+                        "UPDATE posts SET view_count = COALESCE(view_count, 0) + :n "
+                        "WHERE id = :post_id"
+                    ),
+                    [{"post_id": post_id, "n": n} for post_id, n in sorted(counts.items())],
+                )
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                self.backend.restore(counts)
+                logger.error(f"조회수 반영 실패: {e}")
+                return 0
+            finally:
+                if own_session:
+                    db.close()
+
+            for listener in self._flush_listeners:
+                try:
+                    listener(counts)
+                except Exception as e:
+                    logger.error(f"조회수 반영 후처리 실패: {e}")
+
+            flushed = sum(counts.values())
+            VIEW_COUNT_FLUSHED.inc(flushed)
+            VIEW_COUNT_FLUSH_SECONDS.observe(time.perf_counter() - start)
+            return flushed
+
+    def start(self) -> None:
+        """백그라운드 반영 스레드 시작"""
+        self._worker.start()
+
+    def stop(self) -> None:
+        """반영 스레드를 멈추고 남은 조회수를 반영"""
+        self._worker.stop()
+
+
+# 전역 인스턴스
+view_counter = ViewCounter(
+    backend=load_backend(settings.VIEW_COUNT_BACKEND),
+    flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.VIEW_COUNT_MAX_PENDING,
+)
@@ -0,0 +1,113 @@
+"""
+동기 / 비동기 DB 경로 처리량 벤치마크
+같은 프로세스(워커 1개)에서 동기 엔드포인트(스레드 풀 + psycopg2)와
+비동기 엔드포인트(이벤트 루프 + asyncpg)로 같은 게시글 목록 조회를 동시에 보내 처리량과 응답 시간 비교
+
+사용법:
+    poetry run python -m benchmarks.bench_async --concurrency 200 --seconds 10
+    poetry run python -m benchmarks.bench_async --db-latency-ms 20  # 쿼리마다 pg_sleep 으로 DB 지연 추가
+
+동기 경로의 동시 처리 수는 스레드 풀 크기(--threads)와 DB 풀 크기 중 작은 쪽으로 제한되고,
+비동기 경로는 DB 풀 크기로만 제한됨 (두 경로 모두 DB_POOL_SIZE + DB_MAX_OVERFLOW 를 사용)
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import anyio
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import services
+from app.core.config import settings
+from app.db.base import SessionLocal, get_async_db, get_db
+from benchmarks.bench_post_pagination import seed_posts
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def _build_app(latency_seconds: float) -> FastAPI:
+    bench_app = FastAPI()
+
+    @bench_app.get("/sync")
+    def read_sync(db: Session = Depends(get_db)):
+        if latency_seconds:
+            db.execute(text("SELECT pg_sleep(:s)"), {"s": latency_seconds})
+        return services.post.get_pagination(db=db, page=1, size=10)
+
+    @bench_app.get("/async")
+    async def read_async(adb: AsyncSession = Depends(get_async_db)):
+        if latency_seconds:
+            await adb.execute(text("SELECT pg_sleep(:s)"), {"s": latency_seconds})
+        return await services.post.get_pagination_async(adb=adb, page=1, size=10)
+
+    return bench_app
+
+
+async def _run(path: str, bench_app: FastAPI, concurrency: int, seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    latencies_ms: List[float] = []
+
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def loop():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"{path:<7} 처리량 {len(latencies_ms) / elapsed:8.1f}/s, "
+        f"응답 시간(ms) p50 {statistics.median(latencies_ms):.1f}, p99 {_percentile(latencies_ms, 0.99):.1f}"
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    # 동기 엔드포인트가 쓰는 스레드 풀 크기 (anyio 기본값 40)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+    bench_app = _build_app(args.db_latency_ms / 1000)
+    for path in ("/sync", "/async"):
+        await _run(path, bench_app, args.concurrency, args.seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--threads", type=int, default=40, help="동기 엔드포인트 스레드 풀 크기")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="요청마다 추가할 DB 지연(ms)")
+    args = parser.parse_args()
+
+    settings.POST_CACHE_ENABLED = False
+    db = SessionLocal()
+    try:
+        seed_posts(db, 1000)
+    finally:
+        db.close()
+
+    print(
+        f"동시 요청 {args.concurrency}, 스레드 {args.threads}, "
+        f"DB 풀 {settings.DB_POOL_SIZE}+{settings.DB_MAX_OVERFLOW}, DB 지연 {args.db_latency_ms}ms"
+    )
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
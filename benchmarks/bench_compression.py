@@ -0,0 +1,125 @@
+"""
+응답 압축 벤치마크
+대표 응답 본문(게시글 목록 / 긴 게시글 상세 / 댓글 100개)을 인코딩 / 레벨별로 압축해
+압축 시간(CPU)과 줄어든 바이트를 비교
+
+사용법:
+    poetry run python -m benchmarks.bench_compression
+    poetry run python -m benchmarks.bench_compression --from-db  # DATABASE_URL 의 실제 데이터 사용
+
+br / zstd 는 brotli / zstandard 패키지가 설치되어 있을 때만 측정
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from app.core.compression import available_compressors
+from app.core.serialization import dumps
+from benchmarks.bench_post_pagination import measure
+
+WORDS = (
+    "게시판 데이터베이스 인덱스 쿼리 성능 캐시 응답 서버 사용자 댓글 검색 페이지 "
+    "FastAPI PostgreSQL 트랜잭션 커서 정렬 조회수 알림 배포 테스트 로그 설정"
+).split()
+
+LEVELS = {
+    "gzip": (1, 6, 9),
+    "br": (1, 4, 11),
+    "zstd": (1, 3, 10),
+}
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def synthetic_payloads() -> Dict[str, bytes]:
+    """응답 스키마 모양을 따른 합성 본문"""
+    rng = random.Random(42)
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    author = {
+        "email": "user@example.com", "username": "user", "id": 1,
+        "is_active": True, "is_admin": False, "created_at": now, "updated_at": None,
+    }
+
+    def post(i: int, words: int) -> dict:
+        return {
+            "id": i, "title": _text(rng, 6), "content": _text(rng, words), "user_id": 1,
+            "view_count": rng.randint(0, 10000), "comment_count": rng.randint(0, 50),
+            "last_commented_at": now, "created_at": now - timedelta(minutes=i), "updated_at": None,
+        }
+
+    posts_10 = [post(i, 150) for i in range(10)]
+    posts_100 = [post(i, 150) for i in range(100)]
+    comments = [
+        {
+            "content": _text(rng, 30), "id": i, "user_id": 1, "post_id": 1,
+            "created_at": now - timedelta(seconds=i), "updated_at": None, "author": author,
+        }
+        for i in range(100)
+    ]
+    return {
+        "GET /posts?size=10": dumps({"total": 1000, "total_exact": True, "items": posts_10, "page": 1, "size": 10, "pages": 100}),
+        "GET /posts?size=100": dumps({"total": 1000, "total_exact": True, "items": posts_100, "page": 1, "size": 100, "pages": 10}),
+        "GET /posts/{id} (긴 본문)": dumps({**post(1, 30000), "author": author, "unique_viewers": 10}),
+        "GET /posts/{id}/comments": dumps(comments),
+    }
+
+
+def db_payloads() -> Dict[str, bytes]:
+    """DATABASE_URL 의 실제 게시글 / 댓글로 만든 본문"""
+    from app import models, services
+    from app.core.config import settings
+    from app.db.base import SessionLocal
+
+    settings.POST_CACHE_ENABLED = False
+    db = SessionLocal()
+    try:
+        post_id = (
+            db.query(models.Post.id).order_by(models.Post.comment_count.desc()).limit(1).scalar()
+        )
+        return {
+            "GET /posts?size=10": services.post.get_pagination(db=db, size=10, as_json=True),
+            "GET /posts?size=100": services.post.get_pagination(db=db, size=100, as_json=True),
+            "GET /posts/{id}/comments": dumps(
+                services.comment.get_comment_details_by_post(db=db, post_id=post_id)
+            ),
+        }
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--from-db", action="store_true")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = db_payloads() if args.from_db else synthetic_payloads()
+    compressors = available_compressors()
+
+    print(f"{'payload':<26} {'encoding':<10} {'original':>10} {'compressed':>11} {'ratio':>7} {'ms':>8} {'MB/s':>8}")
+    for name, body in payloads.items():
+        for encoding, levels in LEVELS.items():
+            compress = compressors.get(encoding)
+            if compress is None:
+                continue
+            for level in levels:
+                compressed = compress(body, level)
+                ms = measure(lambda: compress(body, level), args.repeat)
+                rows: List[str] = [
+                    f"{name:<26}",
+                    f"{encoding}-{level:<{9 - len(encoding)}}",
+                    f"{len(body):>10}",
+                    f"{len(compressed):>11}",
+                    f"{len(compressed) / len(body):>7.1%}",
+                    f"{ms:>8.2f}",
+                    f"{len(body) / 1_000_000 / (ms / 1000):>8.1f}",
+                ]
+                print(" ".join(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+로그인 부하 벤치마크
+로그인 요청을 동시에 계속 보내면서 다른 라우트(GET /posts)의 응답 시간을 측정해
+비밀번호 해시를 전용 실행기에서 할 때와 기본 스레드 풀에서 할 때를 비교
+
+사용법:
+    poetry run python -m benchmarks.bench_login --concurrency 64 --seconds 10
+    poetry run python -m benchmarks.bench_login --shared-pool  # 기존 방식 (기본 스레드 풀에서 해시)
+
+DATABASE_URL 의 데이터베이스를 사용하며 서버를 띄우지 않고 앱을 프로세스 안에서 호출함
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import anyio
+import httpx
+
+from app.core import security
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.main import app
+from benchmarks.bench_post_pagination import BENCH_EMAIL, seed_posts
+
+
+class _SharedPool:
+    """해시를 기본 스레드 풀(anyio)에서 실행 (전용 실행기 도입 전과 같은 조건)"""
+
+    async def run(self, func, *args):
+        return await anyio.to_thread.run_sync(func, *args)
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def _run(concurrency: int, seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    logins = {"ok": 0, "busy": 0}
+    probe_ms: List[float] = []
+    login_form = {"username": BENCH_EMAIL, "password": "bench"}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def login_loop():
+            while time.perf_counter() < deadline:
+                response = await client.post(f"{settings.API_V1_STR}/auth/login", data=login_form)
+                if response.status_code == 200:
+                    logins["ok"] += 1
+                elif response.status_code == 503:
+                    logins["busy"] += 1
+                    await asyncio.sleep(0.05)
+                else:
+                    raise RuntimeError(f"로그인 실패: {response.status_code} {response.text}")
+
+        async def probe_loop():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await client.get(f"{settings.API_V1_STR}/posts/?size=10")
+                response.raise_for_status()
+                probe_ms.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(login_loop() for _ in range(concurrency)), probe_loop(), probe_loop())
+        elapsed = time.perf_counter() - started
+
+    print(f"로그인 처리량: {logins['ok'] / elapsed:.1f}/s (503 거절 {logins['busy']}회)")
+    print(
+        f"GET /posts 응답 시간(ms): p50 {statistics.median(probe_ms):.1f}, "
+        f"p99 {_percentile(probe_ms, 0.99):.1f}, 요청 {len(probe_ms)}회"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--shared-pool", action="store_true", help="전용 실행기 대신 기본 스레드 풀에서 해시")
+    args = parser.parse_args()
+
+    settings.POST_CACHE_ENABLED = False
+    db = SessionLocal()
+    try:
+        seed_posts(db, 1000)  # 벤치마크 사용자(비밀번호 bench)도 함께 만듦
+    finally:
+        db.close()
+
+    if args.shared_pool:
+        security.password_executor = _SharedPool()
+    print(
+        f"해시: {'기본 스레드 풀' if args.shared_pool else f'전용 실행기 ({settings.PASSWORD_HASH_WORKERS}개)'}, "
+        f"방식 {security.pwd_context.default_scheme()}, 동시 로그인 {args.concurrency}"
+    )
+    asyncio.run(_run(args.concurrency, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
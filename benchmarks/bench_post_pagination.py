@@ -0,0 +1,122 @@
+"""
+게시글 목록 페이지네이션 벤치마크
+OFFSET 페이지네이션과 커서(keyset) 페이지네이션의 페이지 깊이별 응답 시간 비교
+
+사용법:
+    poetry run python -m benchmarks.bench_post_pagination --rows 1000000
+
+DATABASE_URL 의 데이터베이스를 사용하며, 게시글 수가 --rows 보다 적으면
+generate_series 로 벤치마크용 게시글을 채워 넣음
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app import models, services
+from app.core.pagination import encode_cursor
+from app.core.security import get_password_hash
+from app.db.base import SessionLocal
+
+BENCH_EMAIL = "bench@example.com"
+
+
+def seed_posts(db: Session, rows: int) -> None:
+    """게시글이 rows 개가 되도록 벤치마크용 데이터 삽입"""
+    current = db.query(models.Post).count()
+    if current >= rows:
+        return
+
+    user = db.query(models.User).filter(models.User.email == BENCH_EMAIL).first()
+    if not user:
+        user = models.User(
+            email=BENCH_EMAIL,
+            username="bench",
+            hashed_password=get_password_hash("bench"),
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+
+    print(f"게시글 {rows - current}개 삽입 중...")
+    db.execute(
+        text(
+            "INSERT INTO posts (title, content, user_id, view_count, created_at) "
+            "SELECT 'bench ' || g, repeat('본문 ', 50), :user_id, (random() * 10000)::int, "
+            "now() - (g || ' seconds')::interval "
+            "FROM generate_series(1, :n) AS g"
+        ),
+        {"user_id": user.id, "n": rows - current},
+    )
+    db.commit()
+    db.execute(text("ANALYZE posts"))
+    db.commit()
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """repeat 회 실행한 응답 시간의 중앙값(ms)"""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--order-by", default="created_at", choices=["created_at", "view_count"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        seed_posts(db, args.rows)
+        order_col = services.post.KEYSET_ORDERS[args.order_by][0]
+
+        print(f"{'page':>8} {'offset(ms)':>12} {'keyset(ms)':>12}")
+        page = 1
+        while (page - 1) * args.size < args.rows:
+            offset_ms = measure(
+                lambda: services.post.get_pagination(
+                    db=db, page=page, size=args.size, order_by=args.order_by
+                ),
+                args.repeat,
+            )
+
+            # 해당 깊이의 커서는 측정 밖에서 미리 구함
+            cursor = None
+            if page > 1:
+                anchor = (
+                    db.query(models.Post)
+                    .order_by(order_col.desc(), models.Post.id.desc())
+                    .offset((page - 1) * args.size - 1)
+                    .first()
+                )
+                cursor = encode_cursor({
+                    "t": f"posts:{args.order_by}:desc",
+                    "v": getattr(anchor, args.order_by),
+                    "id": anchor.id,
+                    "d": "next",
+                })
+            keyset_ms = measure(
+                lambda: services.post.get_posts_keyset(
+                    db=db, size=args.size, order_by=args.order_by, cursor=cursor
+                ),
+                args.repeat,
+            )
+
+            print(f"{page:>8} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+            page *= 10
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
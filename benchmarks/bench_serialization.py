@@ -0,0 +1,114 @@
+"""
+목록 응답 직렬화 벤치마크
+조회 결과 → 응답 모델 검증 → jsonable_encoder → json.dumps (기존 경로)와
+컬럼 튜플 → dict → dumps (orjson) 경로의 엔드포인트별 처리 시간 비교
+
+사용법:
+    poetry run python -m benchmarks.bench_serialization --size 100 --comments 100
+
+DATABASE_URL 의 PostgreSQL 데이터베이스를 사용하며 (alembic upgrade head 로 스키마를 먼저 만들어야 함,
+bench_post_pagination 과 같은 시드 데이터), 캐시를 끄고 측정하므로 매번 DB 조회와 직렬화를 모두 거침
+"""
+
+import argparse
+import json
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from app import models, schemas, services
+from app.core import serialization
+from app.core.config import settings
+from app.db.base import SessionLocal
+from benchmarks.bench_post_pagination import BENCH_EMAIL, measure, seed_posts
+
+
+def _default_render(content) -> bytes:
+    # FastAPI 기본 JSONResponse 와 같은 설정
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def seed_comments(db: Session, post_id: int, count: int) -> None:
+    """게시글의 댓글이 count 개가 되도록 채움"""
+    current = db.query(models.Comment).filter(models.Comment.post_id == post_id).count()
+    if current >= count:
+        return
+    user = db.query(models.User).filter(models.User.email == BENCH_EMAIL).first()
+    db.add_all(
+        [
+            models.Comment(content=f"벤치마크 댓글 {i} " * 5, post_id=post_id, user_id=user.id)
+            for i in range(current, count)
+        ]
+    )
+    db.commit()
+
+
+def bench_posts(db: Session, size: int, repeat: int) -> List[tuple]:
+    def default_path() -> bytes:
+        total, total_exact = services.post.count_posts(db)
+        # fast 경로와 같은 SELECT 결과를 응답 모델로 검증한 뒤 직렬화
+        rows = services.post._order_list(
+            services.post._list_rows_query(db, None, None), "created_at", True
+        ).limit(size).all()
+        validated = schemas.PostPagination(
+            total=total,
+            total_exact=total_exact,
+            items=[schemas.PostListItem.model_validate(row, from_attributes=True) for row in rows],
+            page=1,
+            size=size,
+            pages=(total + size - 1) // size,
+        )
+        return _default_render(jsonable_encoder(validated, exclude_unset=True))
+
+    def fast_path() -> bytes:
+        return services.post.get_pagination(db=db, size=size, as_json=True)
+
+    return [
+        (f"GET /posts?size={size}", "default", measure(default_path, repeat)),
+        (f"GET /posts?size={size}", "fast", measure(fast_path, repeat)),
+    ]
+
+
+def bench_comments(db: Session, post_id: int, repeat: int) -> List[tuple]:
+    def default_path() -> bytes:
+        comments = services.comment.get_comments_by_post(db=db, post_id=post_id)
+        validated = [schemas.CommentDetail.model_validate(c, from_attributes=True) for c in comments]
+        # 매번 ORM 객체를 새로 만들도록 identity map 을 비움
+        db.expunge_all()
+        return _default_render(jsonable_encoder(validated))
+
+    def fast_path() -> bytes:
+        return serialization.dumps(services.comment.get_comment_details_by_post(db=db, post_id=post_id))
+
+    return [
+        ("GET /posts/{id}/comments", "default", measure(default_path, repeat)),
+        ("GET /posts/{id}/comments", "fast", measure(fast_path, repeat)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--comments", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    settings.POST_CACHE_ENABLED = False
+    db = SessionLocal()
+    try:
+        seed_posts(db, args.rows)
+        post_id = db.query(models.Post.id).order_by(models.Post.id).limit(1).scalar()
+        seed_comments(db, post_id, args.comments)
+
+        print(f"orjson: {'사용' if serialization.orjson is not None else '미설치 (표준 json)'}")
+        print(f"{'endpoint':<28} {'path':<8} {'median(ms)':>12}")
+        for endpoint, path, ms in bench_posts(db, args.size, args.repeat) + bench_comments(db, post_id, args.repeat):
+            print(f"{endpoint:<28} {path:<8} {ms:>12.2f}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
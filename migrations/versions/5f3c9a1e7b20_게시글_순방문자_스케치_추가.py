@@ -0,0 +1,41 @@
+"""게시글 순방문자 스케치 추가
+
+Revision ID: 5f3c9a1e7b20
+Revises: d8d77a99be41
+Create Date: 2026-10-19 10:12:41.503118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f3c9a1e7b20'
+down_revision = 'd8d77a99be41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('post_viewer_sketches',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('registers', sa.LargeBinary(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id')
+    )
+    op.create_table('post_daily_viewer_sketches',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('registers', sa.LargeBinary(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id', 'day')
+    )
+    op.create_index(op.f('ix_post_daily_viewer_sketches_day'), 'post_daily_viewer_sketches', ['day'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_post_daily_viewer_sketches_day'), table_name='post_daily_viewer_sketches')
+    op.drop_table('post_daily_viewer_sketches')
+    op.drop_table('post_viewer_sketches')
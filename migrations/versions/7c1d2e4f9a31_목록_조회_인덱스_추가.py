@@ -0,0 +1,40 @@
+"""목록 조회 인덱스 추가
+
+Revision ID: 7c1d2e4f9a31
+Revises: 5f3c9a1e7b20
+Create Date: 2026-10-19 14:05:27.218340
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1d2e4f9a31'
+down_revision = '5f3c9a1e7b20'
+branch_labels = None
+depends_on = None
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ('ix_posts_created_at_id', 'posts', ['created_at', 'id']),
+    ('ix_posts_view_count_id', 'posts', ['view_count', 'id']),
+    ('ix_posts_user_id', 'posts', ['user_id']),
+    ('ix_comments_post_id_created_at_id', 'comments', ['post_id', 'created_at', 'id']),
+    ('ix_comments_user_id', 'comments', ['user_id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없으므로 autocommit 블록에서 생성 (쓰기 잠금 없음)
+    # 이전 실행이 중간에 실패했다면 INVALID 인덱스가 남아 있을 수 있으므로 먼저 정리
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(sa.text(f'DROP INDEX CONCURRENTLY IF EXISTS {name}'))
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
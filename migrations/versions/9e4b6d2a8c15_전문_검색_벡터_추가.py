@@ -0,0 +1,100 @@
+"""전문 검색 벡터 추가
+
+Revision ID: 9e4b6d2a8c15
+Revises: 7c1d2e4f9a31
+Create Date: 2026-10-19 15:21:09.637402
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4b6d2a8c15'
+down_revision = '7c1d2e4f9a31'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# 이 리비전 시점의 app.core.search 토큰화 (이후 앱 코드가 바뀌어도 마이그레이션 결과가 달라지지 않도록 복사해 둠)
+_HANGUL = "가-힣"
+_WORD_RE = re.compile(rf"[{_HANGUL}]+|[^\W_{_HANGUL}]+")
+_HANGUL_RE = re.compile(rf"[{_HANGUL}]+")
+_MAX_TOKEN_LENGTH = 100
+
+POST_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', d.title), 'A') || "
+    "setweight(to_tsvector('simple', d.content), 'B')"
+)
+COMMENT_VECTOR_SQL = "setweight(to_tsvector('simple', d.content), 'B')"
+
+
+def to_document(text: str) -> str:
+    """한글은 음절 bigram, 나머지 단어는 그대로 둔 공백 구분 토큰 문자열"""
+    tokens = []
+    for word in _WORD_RE.findall((text or "").lower()):
+        if _HANGUL_RE.fullmatch(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word[:_MAX_TOKEN_LENGTH])
+    return " ".join(tokens)
+
+
+def _backfill(table: str, columns: list, vector_sql: str) -> None:
+    """
+    기존 행의 검색 벡터를 id 순서대로 BATCH_SIZE 개씩 채움 (토큰화는 위에 복사해 둔 파이썬 코드)
+
+    autocommit_block 안에서 호출해 배치마다 UPDATE 한 번으로 커밋함
+    """
+    conn = op.get_bind()
+    select = sa.text(
+        f"SELECT id, {', '.join(columns)} FROM {table} "
+        f"WHERE id > :last_id ORDER BY id LIMIT :limit"
+    )
+    arrays = ", ".join(f"CAST(:{column} AS text[])" for column in columns)
+    update = sa.text(
+        f"UPDATE {table} AS t SET search_vector = {vector_sql} "
+        f"FROM unnest(CAST(:ids AS integer[]), {arrays}) AS d(id, {', '.join(columns)}) "
+        f"WHERE t.id = d.id AND t.search_vector IS NULL"
+    )
+    last_id = 0
+    while True:
+        rows = conn.execute(select, {"last_id": last_id, "limit": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        params = {"ids": [row[0] for row in rows]}
+        for i, column in enumerate(columns, start=1):
+            params[column] = [to_document(row[i]) for row in rows]
+        conn.execute(update, params)
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column('posts', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.add_column('comments', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # 컬럼 추가를 먼저 커밋해 ACCESS EXCLUSIVE 잠금을 바로 놓고, 배치마다 커밋하며 채움
+    # (채우는 동안 서비스가 새로 저장한 검색 벡터는 덮어쓰지 않음)
+    with op.get_context().autocommit_block():
+        _backfill('posts', ['title', 'content'], POST_VECTOR_SQL)
+        _backfill('comments', ['content'], COMMENT_VECTOR_SQL)
+
+        # 채운 뒤에 GIN 인덱스를 만드는 편이 행마다 갱신하는 것보다 빠름
+        for name, table in (('ix_posts_search_vector', 'posts'), ('ix_comments_search_vector', 'comments')):
+            op.execute(sa.text(f'DROP INDEX CONCURRENTLY IF EXISTS {name}'))
+            op.create_index(
+                name, table, ['search_vector'], unique=False,
+                postgresql_using='gin', postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_comments_search_vector', table_name='comments', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_posts_search_vector', table_name='posts', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('comments', 'search_vector')
+    op.drop_column('posts', 'search_vector')
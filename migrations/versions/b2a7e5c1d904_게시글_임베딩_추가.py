@@ -0,0 +1,47 @@
+"""게시글 임베딩 추가
+
+Revision ID: b2a7e5c1d904
+Revises: 9e4b6d2a8c15
+Create Date: 2026-10-19 16:02:44.118527
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import pgvector.sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2a7e5c1d904'
+down_revision = '9e4b6d2a8c15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.create_table('post_embeddings',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('post_created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('embedding', pgvector.sqlalchemy.vector.VECTOR(dim=384), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id')
+    )
+    op.create_index(op.f('ix_post_embeddings_user_id'), 'post_embeddings', ['user_id'], unique=False)
+    op.create_index(op.f('ix_post_embeddings_post_created_at'), 'post_embeddings', ['post_created_at'], unique=False)
+    # 빈 테이블에 만드는 인덱스라 CONCURRENTLY 불필요 (기존 게시글은 POST /ai/post-embeddings 로 백필)
+    op.create_index(
+        'ix_post_embeddings_embedding_hnsw', 'post_embeddings', ['embedding'], unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_post_embeddings_embedding_hnsw', table_name='post_embeddings')
+    op.drop_index(op.f('ix_post_embeddings_post_created_at'), table_name='post_embeddings')
+    op.drop_index(op.f('ix_post_embeddings_user_id'), table_name='post_embeddings')
+    op.drop_table('post_embeddings')
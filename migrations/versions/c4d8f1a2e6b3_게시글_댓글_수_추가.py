@@ -0,0 +1,47 @@
+"""게시글 댓글 수 추가
+
+Revision ID: c4d8f1a2e6b3
+Revises: b2a7e5c1d904
+Create Date: 2026-10-19 16:48:30.902715
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d8f1a2e6b3'
+down_revision = 'b2a7e5c1d904'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # 상수 기본값 컬럼 추가는 테이블을 다시 쓰지 않음 (PostgreSQL 11+)
+    op.add_column('posts', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('posts', sa.Column('last_commented_at', sa.DateTime(timezone=True), nullable=True))
+
+    # 게시글 id 구간별로 나눠 채우고 구간마다 커밋 (한 번에 긴 행 잠금을 잡지 않도록)
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        max_id = conn.execute(sa.text('SELECT max(id) FROM posts')).scalar() or 0
+        for low in range(1, max_id + 1, BATCH_SIZE):
+            conn.execute(
+                sa.text(
+                    'UPDATE posts AS p '
+                    'SET comment_count = c.comment_count, last_commented_at = c.last_commented_at '
+                    'FROM ('
+                    '  SELECT post_id, count(*) AS comment_count, max(created_at) AS last_commented_at '
+                    '  FROM comments WHERE post_id BETWEEN :low AND :high GROUP BY post_id'
+                    ') AS c '
+                    'WHERE p.id = c.post_id'
+                ),
+                {'low': low, 'high': low + BATCH_SIZE - 1},
+            )
+
+
+def downgrade() -> None:
+    op.drop_column('posts', 'last_commented_at')
+    op.drop_column('posts', 'comment_count')
@@ -0,0 +1,15 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+
+def test_index_post_embeddings_requires_admin(
+    client: TestClient, db_session: Session, normal_user_token_headers: dict
+):
+    """
+    게시글 임베딩 백필은 관리자만 시작할 수 있는지 테스트
+    """
+    response = client.post("/api/v1/ai/post-embeddings")
+    assert response.status_code == 401
+
+    response = client.post("/api/v1/ai/post-embeddings", headers=normal_user_token_headers)
+    assert response.status_code == 403
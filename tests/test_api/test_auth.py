@@ -59,4 +59,65 @@ def test_register_existing_email(client: TestClient, create_test_user: models.Us
     }
     response = client.post("/api/v1/auth/register", json=data)
     assert response.status_code == 400
-    assert "detail" in response.json() 
\ No newline at end of file
+    assert "detail" in response.json() 
+
+def test_principal_cache(
+    client: TestClient, create_test_user: models.User, captured_statements
+):
+    """
+    인증 사용자 캐시 테스트 - 두 번째 요청부터 사용자 조회 없음, 사용자 수정 시 즉시 무효화
+    """
+    from app.core.security import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token(create_test_user.id)}"}
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+
+    captured_statements.clear()
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == "test@example.com"
+    assert not any("FROM users" in statement for statement, _ in captured_statements)
+
+    response = client.put("/api/v1/users/me", headers=headers, json={"is_active": False})
+    assert response.status_code == 200
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 400
+
+
+def test_login_rehashes_outdated_password(client: TestClient, db_session: Session):
+    """
+    설정보다 약한 비용의 해시가 로그인 시 새 해시로 바뀌는지 테스트
+    """
+    from passlib.context import CryptContext
+
+    from app.core.security import pwd_context
+
+    weak_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("password")
+    user = models.User(email="weak@example.com", username="weak", hashed_password=weak_hash, is_active=True)
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post("/api/v1/auth/login", data={"username": "weak@example.com", "password": "password"})
+    assert response.status_code == 200
+
+    db_session.refresh(user)
+    assert user.hashed_password != weak_hash
+    assert not pwd_context.needs_update(user.hashed_password)
+    assert pwd_context.verify("password", user.hashed_password)
+
+
+def test_logout_revokes_token(client: TestClient, create_test_user: models.User):
+    """
+    로그아웃한 토큰이 만료 전이라도 거부되고, 다른 토큰은 그대로 유효한지 테스트
+    """
+    data = {"username": "test@example.com", "password": "password"}
+    first = client.post("/api/v1/auth/login", data=data).json()["access_token"]
+    second = client.post("/api/v1/auth/login", data=data).json()["access_token"]
+    headers = {"Authorization": f"Bearer {first}"}
+
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+    assert client.post("/api/v1/auth/logout", headers=headers).status_code == 204
+
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 401
+    assert client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {second}"}).status_code == 200
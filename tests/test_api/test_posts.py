@@ -129,4 +129,94 @@ def test_delete_post(client: TestClient, db_session: Session, normal_user_token_
     
     # 삭제 후 조회 불가 확인
     get_response = client.get(f"/api/v1/posts/{post_id}")
-    assert get_response.status_code == 404 
\ No newline at end of file
+    assert get_response.status_code == 404 
+
+def test_read_posts_sparse_fields(client: TestClient, db_session: Session, normal_user_token_headers: dict):
+    """
+    게시글 목록 필드 선택 / 본문 발췌 API 테스트
+    """
+    client.post(
+        "/api/v1/posts/",
+        json={"title": "테스트 게시글", "content": "가나다라마바사아자차카타파하"},
+        headers=normal_user_token_headers
+    )
+
+    response = client.get("/api/v1/posts/", params={"fields": "id,title", "excerpt": 5})
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert set(item) == {"id", "title", "excerpt"}
+    assert item["excerpt"] == "가나다라마…"
+
+    response = client.get("/api/v1/posts/cursor", params={"fields": "title"})
+    assert response.status_code == 200
+    assert set(response.json()["items"][0]) == {"title"}
+
+    response = client.get("/api/v1/posts/", params={"fields": "id,password"})
+    assert response.status_code == 400
+
+
+def test_post_cache_invalidation(client: TestClient, db_session: Session, normal_user_token_headers: dict):
+    """
+    게시글 상세 / 첫 페이지 목록 캐시가 수정 / 댓글 작성 / 새 글 작성 시 무효화되는지 테스트
+    """
+    post_id = client.post(
+        "/api/v1/posts/", json={"title": "캐시 게시글", "content": "내용"}, headers=normal_user_token_headers
+    ).json()["id"]
+
+    # 캐시에 올림
+    assert client.get(f"/api/v1/posts/{post_id}").json()["title"] == "캐시 게시글"
+    assert client.get("/api/v1/posts/").json()["total"] == 1
+
+    client.put(f"/api/v1/posts/{post_id}", json={"title": "수정됨"}, headers=normal_user_token_headers)
+    assert client.get(f"/api/v1/posts/{post_id}").json()["title"] == "수정됨"
+    assert client.get("/api/v1/posts/").json()["items"][0]["title"] == "수정됨"
+
+    client.post(
+        "/api/v1/comments/", json={"content": "댓글", "post_id": post_id}, headers=normal_user_token_headers
+    )
+    assert client.get(f"/api/v1/posts/{post_id}").json()["comment_count"] == 1
+    assert client.get("/api/v1/posts/cursor").json()["items"][0]["comment_count"] == 1
+
+    client.post("/api/v1/posts/", json={"title": "새 글", "content": "내용"}, headers=normal_user_token_headers)
+    page = client.get("/api/v1/posts/").json()
+    assert page["total"] == 2
+    assert page["items"][0]["title"] == "새 글"
+
+
+def test_conditional_requests(client: TestClient, db_session: Session, normal_user_token_headers: dict):
+    """
+    게시글 상세 / 목록 / 댓글 목록 ETag 304 테스트 (304 응답은 조회수를 올리지 않음)
+    """
+    post_id = client.post(
+        "/api/v1/posts/", json={"title": "조건부 요청", "content": "내용"}, headers=normal_user_token_headers
+    ).json()["id"]
+
+    first = client.get(f"/api/v1/posts/{post_id}")
+    assert first.status_code == 200
+    assert first.json()["view_count"] == 1
+    assert "last-modified" in first.headers
+
+    not_modified = client.get(f"/api/v1/posts/{post_id}", headers={"If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == first.headers["etag"]
+    assert client.get(f"/api/v1/posts/{post_id}", params={"skip_increment": True}).json()["view_count"] == 1
+
+    # 수정되면 ETag 가 달라져 전체 본문
+    client.put(f"/api/v1/posts/{post_id}", json={"title": "수정됨"}, headers=normal_user_token_headers)
+    changed = client.get(
+        f"/api/v1/posts/{post_id}", params={"skip_increment": True}, headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "수정됨"
+
+    for url in ("/api/v1/posts/", "/api/v1/posts/cursor", f"/api/v1/posts/{post_id}/comments"):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert client.get(url, headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+
+    client.post(
+        "/api/v1/comments/", json={"content": "댓글", "post_id": post_id}, headers=normal_user_token_headers
+    )
+    response = client.get(f"/api/v1/posts/{post_id}/comments", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
@@ -0,0 +1,121 @@
+"""
+엔드포인트별 SQL 실행 횟수 테스트
+
+결과 행 수가 늘어도 쿼리 수가 고정 예산을 넘지 않는지 (N+1 이 없는지) 확인
+"""
+
+import logging
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.security import get_password_hash
+
+
+def select_count(statements: List[tuple]) -> int:
+    return sum(1 for statement, _ in statements if statement.lstrip().upper().startswith("SELECT"))
+
+
+def _create_users(db: Session, count: int, prefix: str) -> List[models.User]:
+    # 작성자가 모두 달라야 identity map 에 가려지지 않고 지연 로딩 쿼리가 드러남
+    users = [
+        models.User(
+            email=f"{prefix}{i}@example.com",
+            username=f"{prefix}{i}",
+            hashed_password=get_password_hash("password"),
+            is_active=True,
+        )
+        for i in range(count)
+    ]
+    db.add_all(users)
+    db.commit()
+    return users
+
+
+def _add_comments(db: Session, post: models.Post, users: List[models.User]) -> None:
+    db.add_all(
+        [models.Comment(content=f"댓글 {user.username}", post_id=post.id, user_id=user.id) for user in users]
+    )
+    db.commit()
+
+
+def test_post_comments_query_budget(
+    client: TestClient, db_session: Session, create_test_user: models.User, captured_statements
+):
+    """
+    댓글 목록 (CommentDetail) 쿼리 수 테스트 - 게시글 확인 1 + 댓글/작성자 1
+    """
+    post = models.Post(title="제목", content="내용", user_id=create_test_user.id)
+    db_session.add(post)
+    db_session.commit()
+
+    _add_comments(db_session, post, _create_users(db_session, 1, "one"))
+    # expire 후 post.id 를 읽으면 다시 로드하는 쿼리가 예산에 섞이므로 미리 꺼내 둠
+    post_id = post.id
+    db_session.expire_all()
+    captured_statements.clear()
+    response = client.get(f"/api/v1/posts/{post_id}/comments")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    small = select_count(captured_statements)
+
+    _add_comments(db_session, post, _create_users(db_session, 10, "many"))
+    db_session.expire_all()
+    captured_statements.clear()
+    response = client.get(f"/api/v1/posts/{post_id}/comments")
+    assert response.status_code == 200
+    assert len(response.json()) == 11
+    assert all(comment["author"]["username"] for comment in response.json())
+    large = select_count(captured_statements)
+
+    assert small == large <= 2
+
+
+def test_read_post_query_budget(
+    client: TestClient, db_session: Session, create_test_user: models.User, captured_statements
+):
+    """
+    게시글 상세 (PostDetail) 쿼리 수 테스트 - 게시글/작성자 1 + 순방문자 스케치 1
+    """
+    post = models.Post(title="제목", content="내용", user_id=create_test_user.id)
+    db_session.add(post)
+    db_session.commit()
+    post_id = post.id
+    db_session.expire_all()
+
+    captured_statements.clear()
+    response = client.get(f"/api/v1/posts/{post_id}", params={"skip_increment": True})
+    assert response.status_code == 200
+    assert response.json()["author"]["id"] == create_test_user.id
+    assert select_count(captured_statements) <= 2
+
+
+def test_slow_query_sampling_on_async_endpoints(
+    client: TestClient, db_session: Session, create_test_user: models.User, monkeypatch, caplog
+):
+    """
+    비동기 세션(get_async_db)으로 실행한 느린 쿼리도 EXPLAIN 표본으로 뽑히고, 요청은 실패하지 않는지 테스트
+    """
+    from app.core.config import settings
+
+    post = models.Post(title="제목", content="내용", user_id=create_test_user.id)
+    db_session.add(post)
+    db_session.commit()
+    _add_comments(db_session, post, _create_users(db_session, 2, "slow"))
+
+    # 모든 쿼리를 느린 쿼리로 보고 항상 표본으로 뽑음
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "POST_CACHE_ENABLED", False)
+
+    caplog.set_level(logging.WARNING, logger="app.core.query_stats")
+    response = client.get("/api/v1/posts/")
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+    assert any("Execution Time" in record.getMessage() for record in caplog.records)
+
+    response = client.get(f"/api/v1/posts/{post.id}/comments")
+    assert response.status_code == 200
+    assert len(response.json()) == 2
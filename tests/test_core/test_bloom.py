@@ -0,0 +1,26 @@
+from app.core.bloom import BloomFilter
+
+
+def test_bloom_filter_no_false_negatives():
+    """
+    넣은 값은 항상 포함으로 판정되는지 테스트
+    """
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    values = [f"jti-{i}" for i in range(1000)]
+    for value in values:
+        bloom.add(value)
+
+    assert all(value in bloom for value in values)
+    assert bloom.is_full()
+
+
+def test_bloom_filter_false_positive_rate():
+    """
+    capacity 만큼 넣었을 때 거짓 양성 비율이 설계값 근처인지 테스트
+    """
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"revoked-{i}")
+
+    false_positives = sum(1 for i in range(20000) if f"valid-{i}" in bloom)
+    assert false_positives / 20000 < 0.02
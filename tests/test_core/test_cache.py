@@ -0,0 +1,176 @@
+import threading
+import time
+
+import anyio
+
+from app.core.cache import CACHE_REQUESTS, LocalCacheBackend, ObjectCache
+
+
+def test_local_backend_lru_eviction():
+    """
+    최근에 사용하지 않은 항목부터 제거되는지 테스트
+    """
+    backend = LocalCacheBackend(max_entries=2)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    assert backend.get("a") == b"1"  # a 를 최근 사용으로
+    backend.set("c", b"3", ttl=60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.get("c") == b"3"
+
+    backend.set("d", b"4", ttl=0)
+    assert backend.get("d") is None
+
+
+def test_object_cache_coalesces_concurrent_misses():
+    """
+    같은 키의 동시 캐시 미스에서 원본을 한 번만 적재하는지 테스트
+    """
+    cache = ObjectCache("test-coalesce", LocalCacheBackend())
+    calls = []
+    started = threading.Event()
+
+    def loader():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return b"value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader))) for _ in range(8)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [b"value"] * 8
+    assert len(calls) == 1
+    assert CACHE_REQUESTS.value(cache="test-coalesce", result="coalesced") == 7
+
+    assert cache.get_or_load("k", loader) == b"value"
+    assert CACHE_REQUESTS.value(cache="test-coalesce", result="hit") == 1
+
+
+def test_object_cache_coalesces_async_misses():
+    """
+    비동기 적재 함수도 동시 캐시 미스에서 한 번만 호출되는지 테스트
+    """
+    cache = ObjectCache("test-coalesce-async", LocalCacheBackend())
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await anyio.sleep(0.1)
+        return b"value"
+
+    async def main():
+        results = []
+
+        async def get():
+            results.append(await cache.aget_or_load("k", loader))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(8):
+                tg.start_soon(get)
+        return results
+
+    assert anyio.run(main) == [b"value"] * 8
+    assert len(calls) == 1
+    assert CACHE_REQUESTS.value(cache="test-coalesce-async", result="coalesced") == 7
+
+
+def test_object_cache_invalidation():
+    """
+    키 삭제 / 적재 중 무효화 / 버전 증가 테스트
+    """
+    cache = ObjectCache("test-invalidate", LocalCacheBackend())
+    assert cache.get_or_load("k", lambda: b"old") == b"old"
+    cache.invalidate("k")
+    assert cache.get_or_load("k", lambda: b"new") == b"new"
+
+    # 적재 중에 무효화되면 (이미 오래된) 결과를 저장하지 않음
+    cache.invalidate("k")
+
+    def stale_loader():
+        cache.invalidate("k")
+        return b"stale"
+
+    assert cache.get_or_load("k", stale_loader) == b"stale"
+    assert cache.get_or_load("k", lambda: b"fresh") == b"fresh"
+
+    # cacheable 이 False 면 결과는 돌려주지만 저장하지 않음 (복제본에서 읽은 목록 등)
+    assert cache.get_or_load("replica", lambda: b"lagging", cacheable=lambda: False) == b"lagging"
+    assert cache.get_or_load("replica", lambda: b"primary", cacheable=lambda: True) == b"primary"
+    assert cache.get_or_load("replica", lambda: b"other") == b"primary"
+
+    # None 은 저장하지 않음
+    assert cache.get_or_load("missing", lambda: None) is None
+    assert cache.get_or_load("missing", lambda: b"found") == b"found"
+
+    assert cache.version("list") == 0
+    assert cache.bump_version("list") == 1
+    assert cache.version("list") == 1
+
+
+def test_object_cache_wait_timeout_falls_back_to_loader():
+    """
+    먼저 시작한 적재가 wait_timeout 안에 끝나지 않으면 기다리던 요청이 직접 적재하는지 테스트
+    """
+    cache = ObjectCache("test-wait-timeout", LocalCacheBackend(), wait_timeout=0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait(5)
+        return b"slow"
+
+    leader = threading.Thread(target=lambda: cache.get_or_load("k", slow_loader))
+    leader.start()
+    started.wait()
+    try:
+        assert cache.get_or_load("k", lambda: b"direct") == b"direct"
+        assert CACHE_REQUESTS.value(cache="test-wait-timeout", result="wait_timeout") == 1
+    finally:
+        release.set()
+        leader.join()
+    assert cache.get_or_load("k", lambda: b"unused") == b"slow"
+
+
+def test_object_cache_async_waiters_do_not_use_threads():
+    """
+    비동기로 기다리는 요청이 스레드 풀을 쓰지 않는지 (스레드가 모두 사용 중이어도 끝나는지) 테스트
+    """
+    cache = ObjectCache("test-async-no-threads", LocalCacheBackend())
+    release = threading.Event()
+
+    async def loader():
+        await anyio.sleep(0.05)
+        return b"value"
+
+    async def main():
+        anyio.to_thread.current_default_thread_limiter().total_tokens = 1
+        results = []
+
+        async def get():
+            results.append(await cache.aget_or_load("k", loader))
+
+        try:
+            async with anyio.create_task_group() as tg:
+                # 하나뿐인 스레드를 계속 점유
+                tg.start_soon(anyio.to_thread.run_sync, release.wait)
+                with anyio.fail_after(2):
+                    async with anyio.create_task_group() as waiters:
+                        for _ in range(8):
+                            waiters.start_soon(get)
+                release.set()
+        finally:
+            release.set()
+        return results
+
+    assert anyio.run(main) == [b"value"] * 8
+    assert CACHE_REQUESTS.value(cache="test-async-no-threads", result="coalesced") == 7
@@ -0,0 +1,85 @@
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, choose_encoding
+
+LARGE = [{"id": i, "content": "게시글 본문 " * 20} for i in range(50)]
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, encodings=["gzip"], minimum_size=500)
+
+    @app.get("/large")
+    def large(response: Response):
+        response.headers["ETag"] = '"abc"'
+        return LARGE
+
+    @app.get("/small")
+    def small():
+        return {"id": 1}
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("본문 " * 1000, media_type="image/svg+xml")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((b'{"chunk": 1}' * 100 for _ in range(3)), media_type="application/json")
+
+    return TestClient(app)
+
+
+def test_choose_encoding():
+    """
+    q 값과 서버 우선순위로 인코딩을 고르는지 테스트
+    """
+    assert choose_encoding("gzip, br", ["br", "gzip"]) == "br"
+    assert choose_encoding("gzip, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("br;q=0, *", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("identity", ["br", "gzip"]) is None
+    assert choose_encoding(None, ["gzip"]) is None
+
+
+def test_compression_middleware():
+    """
+    큰 JSON 만 압축하고 작은 응답 / 허용되지 않은 타입 / 스트리밍 응답은 그대로 보내는지 테스트
+    """
+    client = _client()
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == LARGE
+
+    # 압축을 받지 않는 클라이언트
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+
+    for path in ("/small", "/text", "/stream"):
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers, path
+
+    assert client.get("/stream", headers={"Accept-Encoding": "gzip"}).content == b'{"chunk": 1}' * 300
+
+
+def test_compression_large_body_in_thread():
+    """
+    스레드에서 압축하는 큰 본문 테스트
+    """
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, encodings=["gzip"], minimum_size=500)
+    body = [{"id": i, "content": "본문 " * 100} for i in range(300)]
+
+    @app.get("/huge")
+    def huge():
+        return body
+
+    response = TestClient(app).get("/huge", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == body
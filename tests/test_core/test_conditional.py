@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.conditional import conditional_json_response, format_http_date, make_etag
+
+MODIFIED = datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items")
+    def read_items(request: Request):
+        return conditional_json_response(request, '{"items":[1,2]}', last_modified=MODIFIED)
+
+    return TestClient(app)
+
+
+def test_etag_and_not_modified():
+    """
+    If-None-Match 일치 시 304, 본문이 다르면 ETag 도 달라지는지 테스트
+    """
+    client = _client()
+    response = client.get("/items")
+    assert response.status_code == 200
+    assert response.json() == {"items": [1, 2]}
+    etag = response.headers["etag"]
+    assert etag == make_etag('{"items":[1,2]}') != make_etag('{"items":[1]}')
+    assert response.headers["last-modified"] == "Tue, 02 Jan 2024 03:04:05 GMT"
+
+    response = client.get("/items", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    # If-None-Match 가 있으면 If-Modified-Since 는 무시
+    response = client.get(
+        "/items", headers={"If-None-Match": '"other"', "If-Modified-Since": format_http_date(MODIFIED)}
+    )
+    assert response.status_code == 200
+
+
+def test_if_modified_since():
+    """
+    Last-Modified 가 초 단위로 비교되는지 테스트
+    """
+    client = _client()
+    assert client.get("/items", headers={"If-Modified-Since": format_http_date(MODIFIED)}).status_code == 304
+    earlier = format_http_date(MODIFIED - timedelta(seconds=1))
+    assert client.get("/items", headers={"If-Modified-Since": earlier}).status_code == 200
+    assert client.get("/items", headers={"If-Modified-Since": "invalid"}).status_code == 200
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.executor import EXECUTOR_REJECTED, BoundedExecutor, ExecutorFull
+
+
+def test_bounded_executor_rejects_when_full():
+    """
+    실행 중 + 대기 작업이 한도를 넘으면 바로 거절하고, 끝나면 다시 받는지 테스트
+    """
+    executor = BoundedExecutor("test-bounded", max_workers=1, max_queue=1)
+    release = threading.Event()
+    rejected = EXECUTOR_REJECTED.value(executor="test-bounded")
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorFull):
+            await executor.run(lambda: "rejected")
+        release.set()
+        assert await running is True
+        assert await queued == "queued"
+        return await executor.run(lambda: "again")
+
+    try:
+        assert asyncio.run(scenario()) == "again"
+        assert EXECUTOR_REJECTED.value(executor="test-bounded") == rejected + 1
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_bounded_executor_cancelled_task_releases_slot():
+    """
+    실행 전에 취소된 작업의 자리가 반환되는지 테스트
+    """
+    executor = BoundedExecutor("test-cancel", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await running
+        return [executor.call(lambda i=i: i) for i in range(3)]
+
+    try:
+        assert asyncio.run(scenario()) == [0, 1, 2]
+    finally:
+        release.set()
+        executor.shutdown()
@@ -0,0 +1,60 @@
+from app.core.hll import HyperLogLog
+
+
+def test_hll_counts_distinct_values():
+    """
+    중복을 제외한 고유값 개수 추정 테스트
+    """
+    sketch = HyperLogLog()
+    for _ in range(3):
+        sketch.update(f"user:{i}" for i in range(5000))
+    
+    # 표준 오차(약 1.6%)의 몇 배 이내
+    assert abs(sketch.count() - 5000) < 5000 * 0.06
+
+
+def test_hll_merge_and_serialization():
+    """
+    스케치 합집합 및 직렬화 테스트
+    """
+    a = HyperLogLog()
+    b = HyperLogLog()
+    a.update(f"user:{i}" for i in range(0, 3000))
+    b.update(f"user:{i}" for i in range(2000, 5000))
+    a.merge(b)
+    
+    restored = HyperLogLog.from_bytes(a.to_bytes())
+    assert restored.count() == a.count()
+    assert abs(restored.count() - 5000) < 5000 * 0.06
+    
+    # 빈 스케치는 0, 압축되어 레지스터 크기보다 작게 저장
+    assert HyperLogLog().count() == 0
+    assert len(HyperLogLog().to_bytes()) < HyperLogLog().m
+
+
+def test_hll_merge_different_precision():
+    """
+    precision 이 다른 스케치를 합치면 낮은 precision 으로 접어서 합치는지 테스트
+    """
+    values = [f"user:{i}" for i in range(5000)]
+    high = HyperLogLog(14)
+    high.update(values[:3000])
+    low = HyperLogLog(10)
+    low.update(values[2000:])
+
+    # 낮은 precision 으로 처음부터 넣은 스케치와 같음
+    expected = HyperLogLog(10)
+    expected.update(values[:3000])
+    assert high.fold(10).registers == expected.registers
+
+    merged = HyperLogLog(14)
+    merged.merge(high)
+    merged.merge(low)
+    assert merged.precision == 10
+    expected.update(values[2000:])
+    assert merged.registers == expected.registers
+
+    low.merge(high)
+    assert low.precision == 10
+    assert low.registers == expected.registers
+    assert abs(low.count() - 5000) < 5000 * 0.15
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.db.init_db import alembic_heads, init_schema, schema_revisions
+
+
+def _stamp(engine, revision: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+        conn.execute(text("DELETE FROM alembic_version"))
+        conn.execute(text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": revision})
+
+
+def test_init_schema_skips_create_all_when_current(tmp_path):
+    """
+    alembic 버전이 head 와 같으면 create_all 없이 넘어가고, 다르면 경고만 남기는지 테스트
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    heads = alembic_heads()
+    assert len(heads) == 1
+
+    assert schema_revisions(engine) == (None, heads)
+
+    _stamp(engine, next(iter(heads)))
+    assert init_schema("check", engine) == "current"
+    assert inspect(engine).get_table_names() == ["alembic_version"]
+
+    _stamp(engine, "230242d3ddb9")  # 초기 마이그레이션
+    assert init_schema("check", engine) == "outdated"
+    assert inspect(engine).get_table_names() == ["alembic_version"]
+
+    assert init_schema("off", engine) == "skipped"
+    with pytest.raises(ValueError):
+        init_schema("unknown", engine)
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import Column, Integer, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from app.core.pagination import CURSOR_NEXT, encode_cursor, paginate_keyset
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    score = Column(Integer)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"t": "score", "d": CURSOR_NEXT, "v": 3, "id": "1"},
+        {"t": "score", "d": CURSOR_NEXT, "v": 3, "id": True},
+        {"t": "score", "d": CURSOR_NEXT, "v": 3},
+        {"t": "score", "d": CURSOR_NEXT, "v": [3], "id": 1},
+        {"t": "score", "d": CURSOR_NEXT, "v": "x", "id": 1},
+    ],
+)
+def test_paginate_keyset_rejects_malformed_cursor(payload):
+    """
+    id 가 정수가 아니거나 정렬값을 되돌릴 수 없는 커서는 ValueError 로 거부하는지 테스트
+    """
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        with pytest.raises(ValueError, match="잘못된 커서입니다."):
+            paginate_keyset(
+                db.query(Item),
+                Item.score,
+                Item.id,
+                size=10,
+                cursor=encode_cursor(payload),
+                tag="score",
+                value_parser=int,
+            )
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.pool_metrics import (
+    DB_POOL_CAPACITY,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTIONS,
+    DB_POOL_TIMEOUTS,
+    InstrumentedQueuePool,
+    register_pool_metrics,
+)
+
+
+def test_pool_metrics(tmp_path):
+    """
+    사용 중 / 초과 연결 수, 대기 시간, 대기 시간 초과가 기록되는지 테스트
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    register_pool_metrics(engine, "test", max_overflow=1)
+    waits = DB_POOL_CHECKOUT_WAIT.count(pool="test")
+    timeouts = DB_POOL_TIMEOUTS.value(pool="test")
+
+    first = engine.connect()
+    second = engine.connect()
+    assert DB_POOL_CONNECTIONS.value(pool="test", state="in_use") == 2
+    assert DB_POOL_CONNECTIONS.value(pool="test", state="overflow") == 1
+    assert DB_POOL_CAPACITY.value(pool="test") == 2
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    assert DB_POOL_TIMEOUTS.value(pool="test") == timeouts + 1
+    assert DB_POOL_CHECKOUT_WAIT.count(pool="test") == waits + 3
+
+    first.close()
+    second.close()
+    assert DB_POOL_CONNECTIONS.value(pool="test", state="in_use") == 0
+    assert DB_POOL_CONNECTIONS.value(pool="test", state="idle") == 1
+    engine.dispose()
@@ -0,0 +1,53 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.query_stats import DB_QUERIES_PER_REQUEST, QueryStatsMiddleware, install_query_hooks
+
+
+def test_query_stats_middleware(monkeypatch):
+    """
+    요청별 SQL 실행 횟수 헤더 / 라우트별 메트릭 테스트
+    """
+    monkeypatch.setattr(settings, "DEBUG", True)
+    install_query_hooks()
+    engine = create_engine("sqlite://")
+
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(item_id):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    before = DB_QUERIES_PER_REQUEST.count(method="GET", route="/items/{item_id}")
+    with TestClient(app) as client:
+        response = client.get("/items/3")
+
+    assert response.status_code == 200
+    assert response.headers["x-db-query-count"] == "3"
+    assert float(response.headers["x-db-time-ms"]) >= float(response.headers["x-db-slowest-ms"])
+    assert DB_QUERIES_PER_REQUEST.count(method="GET", route="/items/{item_id}") == before + 1
+
+
+def test_explain_failure_does_not_raise():
+    """
+    실행 계획 조회가 어디서 실패하든 예외 없이 None 을 반환하는지 테스트
+    """
+    from app.core.query_stats import _explain_analyze
+
+    class BrokenConnection:
+        def cursor(self):
+            raise RuntimeError("커서 생성 실패")
+
+    class PoolConnection:
+        dbapi_connection = BrokenConnection()
+
+    class Connection:
+        connection = PoolConnection()
+
+    assert _explain_analyze(Connection(), "SELECT 1", {}) is None
@@ -0,0 +1,130 @@
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from app.db.routing import (
+    ReplicaRouter,
+    RoutingSession,
+    _current_state,
+    _RoutingState,
+    must_use_primary,
+    read_only_from_primary,
+)
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    source = Column(String)
+
+
+def _make_db(path, source: str) -> str:
+    url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Item.__table__.insert().values(id=1, source=source))
+    engine.dispose()
+    return url
+
+
+def _source(session) -> str:
+    return session.execute(select(Item.source).where(Item.id == 1)).scalar_one()
+
+
+def test_routing_session_reads_replicas_round_robin(tmp_path):
+    """
+    읽기는 복제본을 돌아가며, 쓰기 후에는 프라이머리로 보내는지 테스트
+    """
+    primary = create_engine(_make_db(tmp_path / "primary.db", "primary"))
+    router = ReplicaRouter([_make_db(tmp_path / "r1.db", "r1"), _make_db(tmp_path / "r2.db", "r2")])
+
+    sources = []
+    for _ in range(4):
+        with RoutingSession(primary=primary, router=router) as session:
+            sources.append(_source(session))
+    assert sources == ["r1", "r2", "r1", "r2"]
+
+    with RoutingSession(primary=primary, router=router) as session:
+        assert _source(session) == "r1"
+        session.add(Item(id=2, source="new"))
+        session.commit()
+        # 쓰기 이후에는 같은 세션의 읽기도 프라이머리로
+        assert _source(session) == "primary"
+    with primary.connect() as conn:
+        assert conn.execute(select(Item.source).where(Item.id == 2)).scalar_one() == "new"
+
+
+def test_routing_session_sticks_to_primary(tmp_path):
+    """
+    고정 쿠키가 있거나 같은 요청에서 쓰기가 있었으면 프라이머리에서 읽는지 테스트
+    """
+    primary = create_engine(_make_db(tmp_path / "primary.db", "primary"))
+    router = ReplicaRouter([_make_db(tmp_path / "r1.db", "r1")])
+
+    token = _current_state.set(_RoutingState(pinned=True))
+    try:
+        with RoutingSession(primary=primary, router=router) as session:
+            assert _source(session) == "primary"
+    finally:
+        _current_state.reset(token)
+
+    state = _RoutingState()
+    token = _current_state.set(state)
+    try:
+        with RoutingSession(primary=primary, router=router) as session:
+            assert _source(session) == "r1"
+        with RoutingSession(primary=primary, router=router) as session:
+            session.add(Item(id=2, source="new"))
+            session.commit()
+        assert state.wrote
+        with RoutingSession(primary=primary, router=router) as session:
+            assert _source(session) == "primary"
+    finally:
+        _current_state.reset(token)
+
+
+def test_unhealthy_replica_falls_back_to_primary(tmp_path):
+    """
+    상태 확인에 실패한 복제본은 제외하고, 남은 복제본이 없으면 프라이머리를 쓰는지 테스트
+    """
+    primary = create_engine(_make_db(tmp_path / "primary.db", "primary"))
+    router = ReplicaRouter([_make_db(tmp_path / "r1.db", "r1")])
+
+    # SQLite 에는 복제 지연 함수가 없으므로 상태 확인이 실패함
+    assert router.check() == 0
+    assert router.choose() is None
+    with RoutingSession(primary=primary, router=router) as session:
+        assert _source(session) == "primary"
+
+    router.replicas[0].healthy = True
+    with RoutingSession(primary=primary, router=router) as session:
+        assert _source(session) == "r1"
+
+
+def test_read_only_from_primary(tmp_path):
+    """
+    복제본에서 읽은 세션만 (목록 캐시에 저장하면 안 되는) 복제본 읽기로 판단하는지 테스트
+    """
+    primary = create_engine(_make_db(tmp_path / "primary.db", "primary"))
+    router = ReplicaRouter([_make_db(tmp_path / "r1.db", "r1")])
+
+    with RoutingSession(primary=primary, router=router) as session:
+        assert _source(session) == "r1"
+        assert not read_only_from_primary(session)
+
+    router.replicas[0].healthy = False
+    with RoutingSession(primary=primary, router=router) as session:
+        assert _source(session) == "primary"
+        assert read_only_from_primary(session)
+    with Session(primary) as session:
+        assert read_only_from_primary(session)
+
+    token = _current_state.set(_RoutingState(pinned=True))
+    try:
+        assert must_use_primary()
+    finally:
+        _current_state.reset(token)
+    assert not must_use_primary()
@@ -0,0 +1,30 @@
+from app.core.search import build_tsquery, highlight, tokenize
+
+
+def test_tokenize_hangul_bigrams():
+    """
+    한글 bigram / 영문 단어 토큰화 테스트
+    """
+    assert tokenize("FastAPI 데이터베이스, 가") == ["fastapi", "데이", "이터", "터베", "베이", "이스", "가"]
+    assert tokenize("!!!") == []
+
+
+def test_build_tsquery():
+    """
+    검색식 생성 테스트
+    """
+    assert build_tsquery("데이터 FastAPI") == "('데이' <-> '이터') & ('fastapi')"
+    assert build_tsquery("가") == "('가':*)"
+    assert build_tsquery("'; DROP --") == "('drop')"
+    assert build_tsquery("...") is None
+
+
+def test_highlight_snippet():
+    """
+    하이라이트 / 스니펫 테스트
+    """
+    assert highlight("<b>FastAPI</b> 데이터", "fastapi") == "&lt;b&gt;<mark>FastAPI</mark>&lt;/b&gt; 데이터"
+
+    snippet = highlight("앞" * 100 + " 데이터 " + "뒤" * 100, "데이터", max_length=40)
+    assert "<mark>데이터</mark>" in snippet
+    assert snippet.startswith("…") and snippet.endswith("…")
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.core import serialization
+from app.core.serialization import dumps, loads
+
+
+class Item(BaseModel):
+    id: int
+    title: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+ITEMS = [
+    {"id": 1, "title": "한글 제목", "created_at": datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc), "updated_at": None},
+    {"id": 2, "title": "\"quote\"", "created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=9))), "updated_at": datetime(2024, 1, 2)},
+]
+
+
+def _pydantic_json(items) -> bytes:
+    return b"[" + b",".join(Item(**item).model_dump_json().encode("utf-8") for item in items) + b"]"
+
+
+def test_dumps_matches_pydantic(monkeypatch):
+    """
+    orjson / 표준 json 모두 Pydantic 직렬화와 같은 바이트를 만드는지 테스트
+    """
+    expected = _pydantic_json(ITEMS)
+    assert dumps(ITEMS) == expected
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps(ITEMS) == expected
+    assert loads(dumps(ITEMS))[0]["title"] == "한글 제목"
@@ -0,0 +1,43 @@
+from app.core.metrics import MetricsRegistry
+from app.core.timing import RequestTimings, StageTimer, _current_timings
+
+
+def test_stage_timer_records_histogram_and_request_timings():
+    """
+    구간 측정값이 결과, 요청 타이밍, 히스토그램에 모두 기록되는지 테스트
+    """
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_stage_seconds", "테스트", labelnames=("stage",))
+    request_timings = RequestTimings()
+    token = _current_timings.set(request_timings)
+    try:
+        timer = StageTimer(histogram)
+        with timer.stage("encode"):
+            pass
+        with timer.stage("scoring"):
+            pass
+    finally:
+        _current_timings.reset(token)
+
+    assert set(timer.as_dict()) == {"encode", "scoring"}
+    assert set(request_timings.as_dict()) == {"encode", "scoring"}
+    assert histogram.count(stage="encode") == 1
+    assert histogram.count(stage="scoring") == 1
+
+    header = request_timings.server_timing_header()
+    assert header.startswith("encode;dur=")
+    assert "total;dur=" in header
+
+
+def test_metrics_render_prometheus_format():
+    """
+    Prometheus 텍스트 포맷 출력 테스트
+    """
+    registry = MetricsRegistry()
+    counter = registry.counter("test_requests_total", "테스트", labelnames=("route",))
+    counter.inc(route="/posts")
+    counter.inc(2, route="/posts")
+
+    output = registry.render()
+    assert "# TYPE test_requests_total counter" in output
+    assert 'test_requests_total{route="/posts"} 3.0' in output
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.revoked_token import RevokedToken
+from app.services.token_revocation import TokenRevocationList
+
+
+def test_refresh_purges_expired_rows_with_own_session(tmp_path):
+    """
+    refresh 가 자체 세션으로 필터를 채우고, purge_interval 마다 만료된 행을 지우는지 테스트
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'revoked.db'}")
+    RevokedToken.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine)
+    now = datetime.now(timezone.utc)
+
+    with session_factory() as db:
+        db.add(RevokedToken(jti="valid", expires_at=now + timedelta(hours=1)))
+        db.commit()
+
+    revocation = TokenRevocationList(capacity=100, purge_interval=0, session_factory=session_factory)
+    assert revocation.refresh() == 1
+
+    with session_factory() as db:
+        db.add(RevokedToken(jti="expired", expires_at=now - timedelta(seconds=1)))
+        db.add(RevokedToken(jti="new", expires_at=now + timedelta(hours=1)))
+        db.commit()
+
+    # 필터가 가득 차지 않아도 만료된 행은 삭제되고 새 행은 필터에 추가됨
+    assert revocation.refresh() == 1
+    with session_factory() as db:
+        assert sorted(jti for (jti,) in db.query(RevokedToken.jti)) == ["new", "valid"]
+        assert revocation.is_revoked(db, "new")
+        assert not revocation.is_revoked(db, "unknown")
+
+
+def test_unloaded_filter_fails_closed_and_backs_off(tmp_path):
+    """
+    첫 적재에 실패하면 DB 로 확인하고 (폐기된 토큰을 통과시키지 않음) 요청마다 재시도하지 않는지 테스트
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'revoked.db'}")
+    RevokedToken.__table__.create(engine)
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing.db'}")  # revoked_tokens 테이블 없음
+    attempts = []
+
+    def broken_factory():
+        attempts.append(1)
+        return sessionmaker(bind=broken)()
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(RevokedToken(jti="revoked", expires_at=datetime.now(timezone.utc) + timedelta(hours=1)))
+        db.commit()
+
+        revocation = TokenRevocationList(capacity=100, session_factory=broken_factory)
+        assert revocation.is_revoked(db, "revoked")
+        assert not revocation.is_revoked(db, "valid")
+        assert len(attempts) == 1
+
+        # 재시도 시각이 지나면 다시 적재
+        revocation.session_factory = sessionmaker(bind=engine)
+        revocation._retry_at = 0.0
+        assert revocation.is_revoked(db, "revoked")
+        assert revocation._last_id is not None
@@ -0,0 +1,67 @@
+from app.services.trending import TrendingLeaderboard
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_trending_recent_events_outrank_old_ones():
+    """
+    시간 감쇠 점수 순위 및 삭제 테스트
+    """
+    clock = FakeClock()
+    board = TrendingLeaderboard(half_life_seconds=3600, top_n=2, max_tracked=10, clock=clock)
+
+    for _ in range(4):
+        board.record(1)
+    # 반감기 2번이 지나면 게시글 1 의 점수는 1 로 감쇠
+    clock.now += 2 * 3600
+    for _ in range(2):
+        board.record(2)
+    board.record(3, weight=0.5)
+
+    top = board.top()
+    assert [post_id for post_id, _ in top] == [2, 1]
+    assert abs(top[0][1] - 2.0) < 1e-9
+    assert abs(top[1][1] - 1.0) < 1e-9
+
+    board.remove(2)
+    assert [post_id for post_id, _ in board.top()] == [1, 3]
+
+
+def test_trending_prune_drops_untracked_posts_from_top():
+    """
+    추적 대상에서 제외된 게시글이 상위 목록에 남지 않는지 테스트 (max_tracked // 2 < top_n)
+    """
+    board = TrendingLeaderboard(half_life_seconds=3600, top_n=3, max_tracked=4, clock=FakeClock())
+    for post_id, weight in [(1, 5), (2, 4), (3, 3), (4, 1), (5, 2)]:
+        board.record(post_id, weight=weight)
+    # 5번째 게시글에서 추적 수가 max_tracked 를 넘어 상위 2개만 남음
+    assert [post_id for post_id, _ in board.top()] == [1, 2]
+
+    board.remove(3)
+    assert [post_id for post_id, _ in board.top()] == [1, 2]
+
+
+def test_trending_rebase_keeps_order(tmp_path):
+    """
+    기준 시각 재설정 / 스냅샷 복원 후 순위 유지 테스트
+    """
+    clock = FakeClock()
+    board = TrendingLeaderboard(half_life_seconds=60, top_n=10, clock=clock)
+    board.record(1, weight=3)
+    board.record(2, weight=1)
+    # 기준 시각 재설정이 일어날 만큼 시간이 지나도 순위 유지
+    clock.now += 60 * 100
+    board.record(3, weight=1)
+    assert [post_id for post_id, _ in board.top()] == [3, 1, 2]
+
+    path = str(tmp_path / "trending.json")
+    board.save(path)
+    restored = TrendingLeaderboard(half_life_seconds=60, top_n=10, clock=clock)
+    restored.load(path)
+    assert [post_id for post_id, _ in restored.top()] == [3, 1, 2]
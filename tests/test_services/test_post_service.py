@@ -152,4 +152,331 @@ def test_increment_view_count(db_session: Session):
     updated_post = services.post.increment_view_count(db=db_session, db_obj=updated_post)
     
     # 검증
-    assert updated_post.view_count == 2 
\ No newline at end of file
+    assert updated_post.view_count == 2 
+
+def test_get_posts_keyset(db_session: Session):
+    """
+    게시글 커서 페이지네이션 서비스 함수 테스트
+    """
+    # 테스트 사용자 생성
+    user = models.User(
+        email="keysettest@example.com",
+        username="keysettest",
+        hashed_password=get_password_hash("password"),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    
+    # 게시글 생성
+    for i in range(7):
+        db_session.add(models.Post(
+            title=f"커서 테스트 게시글 {i}",
+            content="커서 테스트",
+            user_id=user.id,
+            view_count=i % 3
+        ))
+    db_session.commit()
+    
+    expected = [
+        post.id for post in db_session.query(models.Post)
+        .order_by(models.Post.view_count.desc(), models.Post.id.desc())
+        .all()
+    ]
+    
+    # 다음 페이지로 끝까지 이동
+    seen = []
+    pages = []
+    cursor = None
+    while True:
+        page = services.post.get_posts_keyset(
+            db=db_session, size=3, order_by="view_count", cursor=cursor
+        )
+        pages.append(page)
+        seen.extend(post.id for post in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    
+    # 검증
+    assert seen == expected
+    assert pages[0]["prev_cursor"] is None
+    
+    # 이전 페이지로 이동
+    previous = services.post.get_posts_keyset(
+        db=db_session, size=3, order_by="view_count", cursor=pages[-1]["prev_cursor"]
+    )
+    assert [post.id for post in previous["items"]] == [post.id for post in pages[-2]["items"]]
+    
+    # 다른 정렬 기준의 커서는 거부
+    with pytest.raises(ValueError):
+        services.post.get_posts_keyset(
+            db=db_session, size=3, order_by="created_at", cursor=pages[0]["next_cursor"]
+        )
+
+
+def test_count_posts_cached_invalidation(db_session: Session):
+    """
+    게시글 개수 캐시가 게시글 생성/삭제 시 무효화되는지 테스트
+    """
+    # 테스트 사용자 생성
+    user = models.User(
+        email="counttest@example.com",
+        username="counttest",
+        hashed_password=get_password_hash("password"),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    services.post.invalidate_total_count()
+    
+    # 처음 계산한 값은 정확한 값
+    total, exact = services.post.count_posts(db_session, strategy="cached")
+    assert (total, exact) == (0, True)
+    
+    # 캐시된 값은 추정값으로 표시
+    total, exact = services.post.count_posts(db_session, strategy="cached")
+    assert (total, exact) == (0, False)
+    
+    # 게시글 생성 시 캐시 무효화
+    post = services.post.create_post(
+        db=db_session,
+        obj_in=schemas.PostCreate(title="개수 테스트", content="개수 테스트"),
+        user_id=user.id
+    )
+    assert services.post.count_posts(db_session, strategy="cached") == (1, True)
+    
+    # 게시글 삭제 시 캐시 무효화
+    services.post.delete_post(db=db_session, db_obj=post)
+    assert services.post.count_posts(db_session, strategy="cached") == (0, True)
+
+
+def test_record_view_buffered(db_session: Session):
+    """
+    조회수 write-behind 버퍼링 테스트
+    """
+    from app.services.view_count import view_counter
+    
+    # 테스트 사용자 생성
+    user = models.User(
+        email="buffertest@example.com",
+        username="buffertest",
+        hashed_password=get_password_hash("password"),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    
+    # 게시글 생성
+    post = models.Post(
+        title="버퍼 테스트 게시글",
+        content="이것은 버퍼 테스트 게시글입니다.",
+        user_id=user.id,
+        view_count=0
+    )
+    db_session.add(post)
+    db_session.commit()
+    db_session.refresh(post)
+    view_counter.backend.drain()
+    
+    # 조회수 증가는 메모리 버퍼에만 기록
+    services.post.record_view(db=db_session, db_obj=post)
+    assert services.post.record_view(db=db_session, db_obj=post) == 2
+    db_session.refresh(post)
+    assert post.view_count == 0
+    
+    # 배치 반영
+    assert view_counter.flush(db=db_session) == 2
+    db_session.refresh(post)
+    assert post.view_count == 2
+    assert services.post.get_view_count(post) == 2
+
+
+def test_unique_viewers(db_session: Session):
+    """
+    게시글 순방문자(HyperLogLog) 집계 테스트
+    """
+    from app.services.unique_viewers import unique_viewer_tracker
+    
+    # 테스트 사용자 생성
+    user = models.User(
+        email="uniquetest@example.com",
+        username="uniquetest",
+        hashed_password=get_password_hash("password"),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    
+    # 게시글 생성
+    post = models.Post(
+        title="순방문자 테스트 게시글",
+        content="이것은 순방문자 테스트 게시글입니다.",
+        user_id=user.id
+    )
+    db_session.add(post)
+    db_session.commit()
+    db_session.refresh(post)
+    unique_viewer_tracker.clear()
+    
+    # 같은 방문자의 반복 조회는 한 번만 집계
+    for viewer in ["u:1", "u:2", "u:1", "a:abc", "u:2"]:
+        services.post.record_unique_viewer(post.id, viewer)
+    assert services.post.get_unique_viewers(db=db_session, post_id=post.id) == 3
+    
+    # DB 반영 후에도 유지
+    unique_viewer_tracker.flush(db=db_session)
+    assert services.post.get_unique_viewers(db=db_session, post_id=post.id) == 3
+    
+    # 순위 조회
+    top = services.post.get_top_by_unique_viewers(db=db_session, days=1)
+    assert [(p.id, count) for p, count in top] == [(post.id, 3)]
+
+    # 순위는 다음 flush 까지 캐시됨
+    services.post.record_unique_viewer(post.id, "u:3")
+    top = services.post.get_top_by_unique_viewers(db=db_session, days=1)
+    assert [(p.id, count) for p, count in top] == [(post.id, 3)]
+    unique_viewer_tracker.flush(db=db_session)
+    top = services.post.get_top_by_unique_viewers(db=db_session, days=1)
+    assert [(p.id, count) for p, count in top] == [(post.id, 4)]
+
+
+def test_unique_viewers_precision_change(db_session: Session):
+    """
+    UNIQUE_VIEWERS_PRECISION 을 바꾼 뒤에도 이전 precision 으로 저장된 스케치를 읽고 합치는지 테스트
+    """
+    from app.services.unique_viewers import UniqueViewerTracker
+
+    user = models.User(
+        email="precision@example.com",
+        username="precision",
+        hashed_password=get_password_hash("password"),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    post = models.Post(title="precision", content="precision", user_id=user.id)
+    db_session.add(post)
+    db_session.commit()
+
+    old = UniqueViewerTracker(precision=12)
+    for viewer in ["u:1", "u:2"]:
+        old.record(post.id, viewer)
+    old.flush(db=db_session)
+
+    # 낮추면 저장된 스케치를 접어서, 높이면 새 스케치를 접어서 낮은 precision 으로 합침
+    expected = 2
+    for precision in (10, 14):
+        tracker = UniqueViewerTracker(precision=precision)
+        assert tracker.estimate(db_session, post.id) == expected
+        tracker.record(post.id, f"u:{precision}")
+        expected += 1
+        assert tracker.estimate(db_session, post.id) == expected
+        assert tracker.flush(db=db_session) == 2
+        assert [count for _, count in tracker.top_posts(db_session, days=1)] == [expected]
+
+
+def test_comment_count_maintained(db_session: Session):
+    """
+    댓글 추가/삭제 시 게시글 댓글 수 / 마지막 댓글 시각 갱신 테스트
+    """
+    user = models.User(
+        email="commentcount@example.com",
+        username="commentcount",
+        hashed_password=get_password_hash("password"),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    post = services.post.create_post(
+        db=db_session,
+        obj_in=schemas.PostCreate(title="댓글 수 테스트", content="내용"),
+        user_id=user.id,
+    )
+    assert post.comment_count == 0
+    assert post.last_commented_at is None
+    updated_at = post.updated_at
+
+    comments = [
+        services.comment.create_comment(
+            db=db_session, obj_in=schemas.CommentCreate(content=f"댓글 {i}", post_id=post.id), user_id=user.id
+        )
+        for i in range(2)
+    ]
+    db_session.refresh(post)
+    assert post.comment_count == 2
+    assert post.last_commented_at == comments[-1].created_at
+    # 댓글 추가는 게시글 수정이 아님
+    assert post.updated_at == updated_at
+
+    services.comment.delete_comment(db=db_session, db_obj=comments[-1])
+    db_session.refresh(post)
+    assert post.comment_count == 1
+    assert post.last_commented_at == comments[0].created_at
+    assert post.updated_at == updated_at
+
+    services.comment.delete_comment(db=db_session, db_obj=comments[0])
+    db_session.refresh(post)
+    assert post.comment_count == 0
+    assert post.last_commented_at is None
+
+
+def test_comments_keyset_and_preview(db_session: Session):
+    """
+    게시글별 댓글 커서 페이지네이션 / 여러 게시글 최신 댓글 미리보기 테스트
+    """
+    user = models.User(
+        email="commentpreview@example.com",
+        username="commentpreview",
+        hashed_password=get_password_hash("password"),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    posts = [
+        services.post.create_post(
+            db=db_session,
+            obj_in=schemas.PostCreate(title=f"미리보기 {i}", content="내용"),
+            user_id=user.id,
+        )
+        for i in range(3)
+    ]
+    for i in range(5):
+        services.comment.create_comment(
+            db=db_session, obj_in=schemas.CommentCreate(content=f"댓글 {i}", post_id=posts[0].id), user_id=user.id
+        )
+    services.comment.create_comment(
+        db=db_session, obj_in=schemas.CommentCreate(content="댓글", post_id=posts[1].id), user_id=user.id
+    )
+
+    expected = [
+        c.id for c in services.comment.get_comments_by_post(db=db_session, post_id=posts[0].id)
+    ]
+    seen = []
+    cursor = None
+    while True:
+        page = services.comment.get_comments_by_post_keyset(
+            db=db_session, post_id=posts[0].id, size=2, cursor=cursor
+        )
+        seen.extend(c.id for c in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+    # 다른 게시글의 커서는 거부
+    with pytest.raises(ValueError):
+        services.comment.get_comments_by_post_keyset(
+            db=db_session, post_id=posts[1].id, cursor=page["prev_cursor"]
+        )
+
+    preview = services.comment.get_latest_comments_by_posts(
+        db=db_session, post_ids=[p.id for p in posts], per_post=3
+    )
+    assert [c.id for c in preview[posts[0].id]] == expected[:3]
+    assert len(preview[posts[1].id]) == 1
+    assert preview[posts[2].id] == []
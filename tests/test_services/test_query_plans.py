@@ -0,0 +1,153 @@
+"""
+목록 조회 쿼리 실행 계획 회귀 테스트
+
+데이터를 충분히 넣고 ANALYZE 한 뒤, 서비스 함수가 실행한 SELECT 를 EXPLAIN 해서
+posts / comments 에 대한 순차 스캔이나 (소수 행의 top-N 정렬을 제외한) 정렬 노드가 없는지 확인
+"""
+
+import json
+from typing import Iterator, List, Optional
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app import models, services
+
+POST_ROWS = 20000
+COMMENTS_PER_POST = 5
+
+
+@pytest.fixture(scope="function")
+def seeded_db(db_session: Session, create_test_user: models.User) -> Session:
+    """
+    실행 계획 확인용 대량 데이터
+    """
+    db_session.execute(
+        text(
+            "INSERT INTO posts (title, content, user_id, view_count, created_at) "
+            "SELECT 'title ' || g, 'content', :user_id, (random() * 1000)::int, "
+            "now() - g * interval '1 minute' "
+            "FROM generate_series(1, :n) AS g"
+        ),
+        {"user_id": create_test_user.id, "n": POST_ROWS},
+    )
+    # 게시글 4개 중 1개에만 댓글
+    db_session.execute(
+        text(
+            "INSERT INTO comments (content, user_id, post_id, created_at) "
+            "SELECT 'comment', :user_id, p.id, p.created_at + g * interval '1 second' "
+            "FROM posts p, generate_series(1, :n) AS g WHERE p.id % 4 = 0"
+        ),
+        {"user_id": create_test_user.id, "n": COMMENTS_PER_POST},
+    )
+    db_session.commit()
+    db_session.execute(text("ANALYZE posts"))
+    db_session.execute(text("ANALYZE comments"))
+    db_session.commit()
+    return db_session
+
+
+def _plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _explain(db: Session, statement: str, parameters) -> dict:
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+        result = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def assert_indexed_plans(
+    db: Session, statements: List[tuple], allow_sort: bool = False, index_name: Optional[str] = None
+) -> None:
+    """
+    수집한 SELECT 문이 모두 인덱스로 읽히는지 확인
+
+    allow_sort: 인덱스로 좁힌 소수의 행을 정렬하는 (top-N) Sort 노드는 허용
+    index_name: 실행 계획에 이 인덱스를 사용하는 노드가 있어야 함
+    """
+    selects = [(s, p) for s, p in statements if s.lstrip().upper().startswith("SELECT")]
+    assert selects, "실행된 SELECT 문이 없습니다."
+    for statement, parameters in selects:
+        plan = _explain(db, statement, parameters)
+        nodes = list(_plan_nodes(plan))
+        for node in nodes:
+            node_type = node["Node Type"]
+            assert not (
+                node_type == "Seq Scan" and node.get("Relation Name") in ("posts", "comments")
+            ), f"순차 스캔: {statement}\n{json.dumps(plan, indent=2)}"
+            assert allow_sort or node_type not in ("Sort", "Incremental Sort"), (
+                f"정렬 노드: {statement}\n{json.dumps(plan, indent=2)}"
+            )
+        if index_name is not None:
+            assert any(node.get("Index Name") == index_name for node in nodes), (
+                f"{index_name} 미사용: {statement}\n{json.dumps(plan, indent=2)}"
+            )
+
+
+@pytest.mark.parametrize("order_by", ["created_at", "view_count"])
+@pytest.mark.parametrize("order_desc", [True, False])
+def test_get_posts_plan(seeded_db: Session, captured_statements, order_by, order_desc):
+    """
+    게시글 목록 (offset) 실행 계획 테스트
+    """
+    # get_pagination 이 만드는 목록 쿼리 (전체 개수 조회 제외)
+    rows = (
+        services.post._order_list(services.post._list_rows_query(seeded_db, None, None), order_by, order_desc)
+        .offset(100)
+        .limit(10)
+        .all()
+    )
+    assert len(rows) == 10
+    assert_indexed_plans(seeded_db, captured_statements)
+
+
+@pytest.mark.parametrize("order_by", ["created_at", "view_count"])
+def test_get_posts_keyset_plan(seeded_db: Session, captured_statements, order_by):
+    """
+    게시글 목록 (커서) 실행 계획 테스트 - 첫 페이지와 다음 페이지
+    """
+    page = services.post.get_posts_keyset(db=seeded_db, size=10, order_by=order_by)
+    services.post.get_posts_keyset(
+        db=seeded_db, size=10, order_by=order_by, cursor=page["next_cursor"]
+    )
+    assert_indexed_plans(seeded_db, captured_statements)
+
+
+def test_get_comments_by_post_plan(seeded_db: Session, captured_statements):
+    """
+    게시글별 댓글 목록 실행 계획 테스트
+    """
+    post_id = seeded_db.query(models.Comment.post_id).limit(1).scalar()
+    captured_statements.clear()
+
+    comments = services.comment.get_comments_by_post(db=seeded_db, post_id=post_id)
+    assert len(comments) == COMMENTS_PER_POST
+    # 게시글 하나의 댓글은 몇 개뿐이라 Bitmap Index Scan 뒤 작은 Sort 를 고를 수 있음
+    assert_indexed_plans(
+        seeded_db, captured_statements, allow_sort=True, index_name="ix_comments_post_id_created_at_id"
+    )
+
+
+def test_get_comments_by_post_keyset_plan(seeded_db: Session, captured_statements):
+    """
+    게시글별 댓글 커서 목록 / 최신 댓글 미리보기 실행 계획 테스트
+    """
+    post_ids = [row[0] for row in seeded_db.query(models.Comment.post_id).distinct().limit(20)]
+    captured_statements.clear()
+
+    page = services.comment.get_comments_by_post_keyset(db=seeded_db, post_id=post_ids[0], size=2)
+    services.comment.get_comments_by_post_keyset(
+        db=seeded_db, post_id=post_ids[0], size=2, cursor=page["next_cursor"]
+    )
+    services.comment.get_latest_comments_by_posts(db=seeded_db, post_ids=post_ids, per_post=3)
+    assert_indexed_plans(seeded_db, captured_statements)
@@ -0,0 +1,60 @@
+from sqlalchemy.orm import Session
+
+from app import models, schemas, services
+
+
+def test_search_posts(db_session: Session, create_test_user: models.User):
+    """
+    게시글 검색 서비스 함수 테스트 (한글 부분 일치, 제목 가중치, 커서 페이지네이션)
+    """
+    for title, content in [
+        ("FastAPI 소개", "데이터베이스 연결 방법을 설명합니다."),
+        ("데이터베이스 인덱스", "인덱스를 만들면 조회가 빨라집니다."),
+        ("잡담", "오늘은 날씨가 좋습니다."),
+    ]:
+        services.post.create_post(
+            db=db_session,
+            obj_in=schemas.PostCreate(title=title, content=content),
+            user_id=create_test_user.id,
+        )
+
+    result = services.search.search_posts(db=db_session, q="데이터", size=1)
+    assert len(result["items"]) == 1
+    # 제목에 일치하는 게시글이 먼저
+    first = result["items"][0]
+    assert first.title == "데이터베이스 인덱스"
+    assert first.title_highlight == "<mark>데이터</mark>베이스 인덱스"
+
+    result = services.search.search_posts(
+        db=db_session, q="데이터", size=1, cursor=result["next_cursor"]
+    )
+    assert [hit.title for hit in result["items"]] == ["FastAPI 소개"]
+    assert "<mark>데이터</mark>" in result["items"][0].snippet
+    assert result["next_cursor"] is None
+
+    # 수정하면 검색 벡터도 갱신
+    post = db_session.query(models.Post).filter(models.Post.title == "잡담").first()
+    services.post.update_post(db=db_session, db_obj=post, obj_in=schemas.PostUpdate(content="데이터 분석"))
+    result = services.search.search_posts(db=db_session, q="데이터 분석")
+    assert [hit.title for hit in result["items"]] == ["잡담"]
+
+
+def test_search_comments(db_session: Session, create_test_user: models.User):
+    """
+    댓글 검색 서비스 함수 테스트
+    """
+    post = services.post.create_post(
+        db=db_session,
+        obj_in=schemas.PostCreate(title="게시글", content="내용"),
+        user_id=create_test_user.id,
+    )
+    for content in ["검색 기능이 좋네요", "감사합니다"]:
+        services.comment.create_comment(
+            db=db_session,
+            obj_in=schemas.CommentCreate(content=content, post_id=post.id),
+            user_id=create_test_user.id,
+        )
+
+    result = services.search.search_comments(db=db_session, q="검색", post_id=post.id)
+    assert [hit.content for hit in result["items"]] == ["검색 기능이 좋네요"]
+    assert services.search.search_comments(db=db_session, q="...")["items"] == []
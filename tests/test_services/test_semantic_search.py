@@ -0,0 +1,51 @@
+from sqlalchemy.orm import Session
+
+from app import models, schemas, services
+from app.services.ai import ai_service
+
+
+def _create_post(db: Session, user: models.User, title: str, content: str) -> models.Post:
+    post = services.post.create_post(
+        db=db, obj_in=schemas.PostCreate(title=title, content=content), user_id=user.id
+    )
+    assert ai_service.index_post(post.id, db=db)
+    return post
+
+
+def test_semantic_search_posts(db_session: Session, create_test_user: models.User):
+    """
+    의미 기반 게시글 검색 / 비슷한 게시글 테스트
+    """
+    python_post = _create_post(
+        db_session, create_test_user,
+        "Python web frameworks", "Building REST APIs with FastAPI and Django",
+    )
+    _create_post(
+        db_session, create_test_user,
+        "Baking bread at home", "Flour, water, salt and yeast make a simple loaf",
+    )
+    api_post = _create_post(
+        db_session, create_test_user,
+        "Designing HTTP APIs", "How to version and document a REST API",
+    )
+
+    results = ai_service.search_posts(db_session, "python api server", limit=2)
+    assert {post.id for post, _ in results} == {python_post.id, api_post.id}
+    assert results[0][1] >= results[1][1]
+
+    similar = ai_service.similar_posts(db_session, python_post.id, limit=1)
+    assert [post.id for post, _ in similar] == [api_post.id]
+
+    # 작성자 필터
+    assert ai_service.search_posts(db_session, "python", author_id=create_test_user.id + 1) == []
+
+
+def test_index_post_skips_unchanged(db_session: Session, create_test_user: models.User):
+    """
+    내용이 바뀌지 않으면 임베딩을 다시 만들지 않음
+    """
+    post = _create_post(db_session, create_test_user, "제목", "내용")
+    assert not ai_service.index_post(post.id, db=db_session)
+
+    services.post.update_post(db=db_session, db_obj=post, obj_in=schemas.PostUpdate(content="바뀐 내용"))
+    assert ai_service.index_post(post.id, db=db_session)